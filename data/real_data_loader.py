@@ -55,7 +55,7 @@ class RealDataLoader:
         
         for _, row in suppliers_df.iterrows():
             if pd.notna(row['cost_per_unit']) and row['cost_per_unit'] > 0:
-                supplier = Supplier(
+                supplier = Supplier.create_validated(
                     material_id=str(row['material_id']),
                     supplier_id=row['supplier_id'],
                     cost_per_unit=row['cost_per_unit'],
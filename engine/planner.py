@@ -161,7 +161,7 @@ class RawMaterialPlanner:
 
                 if selected_supplier:
                     # Calculate EOQ
-                    eoq = self.eoq_calculator.calculate_eoq(
+                    eoq = self.eoq_calculator.calculate_eoq_cached(
                         buffered_requirement,
                         selected_supplier.ordering_cost,
                         selected_supplier.cost_per_unit,  # Added unit_cost parameter
@@ -343,7 +343,7 @@ class RawMaterialPlanner:
             # Calculate optimal quantity for this supplier
             if remaining_qty >= supplier.moq:
                 # Calculate EOQ for this supplier
-                eoq = self.eoq_calculator.calculate_eoq(
+                eoq = self.eoq_calculator.calculate_eoq_cached(
                     remaining_qty,
                     supplier.ordering_cost,
                     supplier.cost_per_unit,  # Added unit_cost parameter
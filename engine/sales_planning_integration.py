@@ -16,6 +16,7 @@ from models.forecast import FinishedGoodsForecast
 from models.sales_forecast_generator import SalesForecastGenerator
 from models.bom import BillOfMaterials, BOMExploder
 from models.inventory import Inventory, InventoryNetter
+from models.recommendation import RecommendationGenerator
 from models.supplier import Supplier
 
 logger = logging.getLogger(__name__)
@@ -388,7 +389,7 @@ class SalesPlanningIntegration:
                 
                 # Convert recommendations to DataFrame if needed
                 if recommendations and not isinstance(recommendations, pd.DataFrame):
-                    recommendations_df = pd.DataFrame([r.__dict__ for r in recommendations])
+                    recommendations_df = RecommendationGenerator.to_dataframe(recommendations)
                 else:
                     recommendations_df = recommendations
                     
@@ -328,7 +328,7 @@ def display_planning_results():
     st.subheader("Procurement Recommendations")
     
     # Convert to DataFrame for display
-    rec_df = RecommendationGenerator.to_dataframe(recommendations)
+    rec_df = RecommendationGenerator.to_dataframe(recommendations, legacy=True)
     
     # Add filters
     col1, col2, col3 = st.columns(3)
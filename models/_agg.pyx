@@ -0,0 +1,41 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled forecast aggregation loop
+
+Optional accelerator for ForecastProcessor.aggregate_forecasts when callers
+already hold a list of FinishedGoodsForecast objects. Build in place from
+the repository root with:
+
+    python -c "from setuptools import setup; from Cython.Build import cythonize; setup(packages=[], ext_modules=cythonize('models/_agg.pyx'))" build_ext --inplace
+
+(plain ``cythonize -i`` fails here: the top-level src/ directory makes
+setuptools treat the tree as src-layout).
+
+ForecastProcessor falls back to the pure-Python loop when the extension
+has not been built.
+"""
+
+from cpython.dict cimport PyDict_GetItem
+from cpython.object cimport PyObject
+
+
+def cy_aggregate(list forecasts, dict weights, double default_weight=0.5):
+    """
+    Aggregate forecasts by SKU with source weighting
+    Returns: {sku_id: weighted_forecast_qty}
+    """
+    cdef dict out = {}
+    cdef PyObject* item
+    cdef double w, total
+    cdef object forecast, sku_id
+
+    for forecast in forecasts:
+        item = PyDict_GetItem(weights, forecast.source)
+        w = <double>(<object>item) if item is not NULL else default_weight
+
+        sku_id = forecast.sku_id
+        item = PyDict_GetItem(out, sku_id)
+        total = <double>(<object>item) if item is not NULL else 0.0
+        out[sku_id] = total + <double>forecast.forecast_qty * w
+
+    return out
@@ -78,11 +78,12 @@ class BOMExploder:
         df['qty_per_unit'] = pd.to_numeric(df['qty_per_unit'], errors='coerce')
         df['unit_of_measure'] = df.get('unit_of_measure', 'unit').astype(str)
 
-        # Filter out invalid rows
-        invalid_rows = df[df['qty_per_unit'].isna() | (df['qty_per_unit'] <= 0)]
-        if not invalid_rows.empty:
-            logger.warning(f"Filtering out {len(invalid_rows)} invalid BOM rows")
-            df = df[~df['qty_per_unit'].isna() & (df['qty_per_unit'] > 0)]
+        # Filter out invalid rows with a single keep-mask (NaN compares False)
+        keep = df['qty_per_unit'] > 0
+        n_invalid = int((~keep).sum())
+        if n_invalid:
+            logger.warning(f"Filtering out {n_invalid} invalid BOM rows")
+            df = df.loc[keep]
 
         # Convert to list of dictionaries for faster iteration
         bom_data = df.to_dict('records')
@@ -273,16 +274,17 @@ class BOMExploder:
                     # Calculate yarn quantity based on percentage
                     yarn_qty = forecast_qty * (bom.percentage / 100.0)
                     
-                    if bom.yarn_id not in yarn_requirements:
-                        yarn_requirements[bom.yarn_id] = {
+                    requirement = yarn_requirements.get(bom.yarn_id)
+                    if requirement is None:
+                        requirement = yarn_requirements[bom.yarn_id] = {
                             'total_qty': 0.0,
                             'unit': unit,
                             'sources': [],
                             'yarn_name': bom.yarn_name or bom.yarn_id
                         }
                     
-                    yarn_requirements[bom.yarn_id]['total_qty'] += yarn_qty
-                    yarn_requirements[bom.yarn_id]['sources'].append({
+                    requirement['total_qty'] += yarn_qty
+                    requirement['sources'].append({
                         'style_id': style_id,
                         'style_forecast_qty': forecast_qty,
                         'percentage': bom.percentage,
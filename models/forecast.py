@@ -4,9 +4,23 @@ Finished Goods Forecast Data Model
 
 from dataclasses import dataclass
 from datetime import date
+from typing import Iterable, Iterator
 
 import pandas as pd
 
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Optional compiled aggregation loop (see models/_agg.pyx for the build command); pure Python is used when not built
+try:
+    from models._agg import cy_aggregate
+except ImportError:
+    cy_aggregate = None
+
+# Forecast sources accepted by FinishedGoodsForecast
+VALID_SOURCES = ["sales_order", "projection", "prod_plan", "sales_history", "manual", "order", "combined"]
+
 
 @dataclass
 class FinishedGoodsForecast:
@@ -39,9 +53,8 @@ class FinishedGoodsForecast:
         if self.forecast_qty is not None and self.forecast_qty < 0:
             raise ValueError("Forecast quantity cannot be negative")
 
-        valid_sources = ["sales_order", "projection", "prod_plan", "sales_history", "manual", "order", "combined"]
-        if self.source and self.source not in valid_sources:
-            raise ValueError(f"Source must be one of: {valid_sources}")
+        if self.source and self.source not in VALID_SOURCES:
+            raise ValueError(f"Source must be one of: {VALID_SOURCES}")
 
 
 class ForecastProcessor:
@@ -60,7 +73,7 @@ class ForecastProcessor:
         if config and hasattr(config, 'forecast_source_weights'):
             self.SOURCE_WEIGHTS = config.forecast_source_weights
 
-    def unify_forecasts(self, forecasts: list[FinishedGoodsForecast]) -> dict[str, float]:
+    def unify_forecasts(self, forecasts: Iterable[FinishedGoodsForecast]) -> dict[str, float]:
         """
         Unify forecasts by SKU with source weighting
         Returns: {sku_id: weighted_forecast_qty}
@@ -70,8 +83,35 @@ class ForecastProcessor:
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> list[FinishedGoodsForecast]:
         """Create forecast objects from DataFrame - optimized version"""
-        forecasts = []
+        forecasts = list(cls.iter_from_dataframe(df))
+        logger.info(f"Successfully created {len(forecasts)} forecasts from {len(df)} rows")
+        return forecasts
 
+    @classmethod
+    def iter_from_dataframe(cls, df: pd.DataFrame,
+                            chunksize: int = 65536) -> Iterator[FinishedGoodsForecast]:
+        """
+        Lazily yield forecast objects from DataFrame
+
+        Coercion and validation run once over the whole frame; objects are then
+        built one chunk at a time so single-pass consumers such as
+        aggregate_forecasts never hold the full list in memory.
+        """
+        df = cls._prepare_forecast_frame(df)
+
+        for start in range(0, len(df), chunksize):
+            # Rows are fully validated, so construction cannot raise
+            for row in df.iloc[start:start + chunksize].to_dict('records'):
+                yield FinishedGoodsForecast(
+                    sku_id=row['sku_id'],
+                    forecast_qty=int(row['forecast_qty']),
+                    forecast_date=row['forecast_date'].date(),
+                    source=row['source']
+                )
+
+    @staticmethod
+    def _prepare_forecast_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Coerce forecast columns and drop rows that would fail validation"""
         # Validate required columns
         required_columns = ['sku_id', 'forecast_qty', 'forecast_date', 'source']
         missing_columns = set(required_columns) - set(df.columns)
@@ -85,62 +125,68 @@ class ForecastProcessor:
         df['forecast_qty'] = pd.to_numeric(df['forecast_qty'], errors='coerce').fillna(0).astype(int)
         df['forecast_date'] = pd.to_datetime(df['forecast_date'], errors='coerce')
 
-        # Filter out invalid rows
-        invalid_rows = df[df['forecast_date'].isna() | (df['forecast_qty'] < 0)]
-        if not invalid_rows.empty:
-            logger.warning(f"Filtering out {len(invalid_rows)} invalid forecast rows")
-            df = df[~df['forecast_date'].isna() & (df['forecast_qty'] >= 0)]
+        # Filter out invalid rows with a single keep-mask
+        keep = df['forecast_date'].notna() & (df['forecast_qty'] >= 0)
+        n_invalid = int((~keep).sum())
+        if n_invalid:
+            logger.warning(f"Filtering out {n_invalid} invalid forecast rows")
+            df = df.loc[keep]
 
-        # Convert to list of dictionaries for faster iteration
-        forecast_data = df.to_dict('records')
-
-        for row in forecast_data:
-            try:
-                forecast = FinishedGoodsForecast(
-                    sku_id=row['sku_id'],
-                    forecast_qty=int(row['forecast_qty']),
-                    forecast_date=row['forecast_date'].date(),
-                    source=row['source']
-                )
-                forecasts.append(forecast)
-            except Exception as e:
-                logger.error(f"Error creating forecast from row: {e}")
-                continue
+        # Rows that would fail FinishedGoodsForecast validation are reported in one message
+        invalid_source = ~(df['source'].isin(VALID_SOURCES) | df['source'].eq(''))
+        if invalid_source.any():
+            errors_df = df.loc[invalid_source]
+            logger.error(f"Skipping {len(errors_df)} forecast rows with invalid source: "
+                         f"{sorted(errors_df['source'].unique())}")
+            df = df.loc[~invalid_source]
 
-        logger.info(f"Successfully created {len(forecasts)} forecasts from {len(df)} rows")
-        return forecasts
+        return df
 
-    def aggregate_forecasts(self, forecasts: list[FinishedGoodsForecast]) -> dict[str, float]:
+    def aggregate_forecasts(self, forecasts: Iterable[FinishedGoodsForecast]) -> dict[str, float]:
         """
         Aggregate forecasts by SKU with source weighting
         Returns: {sku_id: weighted_forecast_qty}
         """
+        if cy_aggregate is not None and type(forecasts) is list and type(self.SOURCE_WEIGHTS) is dict:
+            return cy_aggregate(forecasts, self.SOURCE_WEIGHTS)
+
         sku_totals = {}
 
-        for forecast in forecasts:
-            weight = self.SOURCE_WEIGHTS.get(forecast.source, 0.5)
-            weighted_qty = forecast.forecast_qty * weight
+        # Bind lookups once; the loop body is the hot path for large forecast sets
+        get_weight = self.SOURCE_WEIGHTS.get
+        get_total = sku_totals.get
 
-            if forecast.sku_id in sku_totals:
-                sku_totals[forecast.sku_id] += weighted_qty
-            else:
-                sku_totals[forecast.sku_id] = weighted_qty
+        for forecast in forecasts:
+            sku_id = forecast.sku_id
+            sku_totals[sku_id] = get_total(sku_id, 0.0) + forecast.forecast_qty * get_weight(forecast.source, 0.5)
 
         return sku_totals
 
     @classmethod
-    def get_forecast_summary(cls, forecasts: list[FinishedGoodsForecast]) -> pd.DataFrame:
+    def get_forecast_summary(cls, forecasts: Iterable[FinishedGoodsForecast]) -> pd.DataFrame:
         """Generate forecast summary for analysis"""
-        data = []
+        get_weight = cls.SOURCE_WEIGHTS.get
+        sku_ids, quantities, sources, weights, dates = [], [], [], [], []
+
+        # Single pass so lazily produced forecasts are consumed only once
         for forecast in forecasts:
-            weight = cls.SOURCE_WEIGHTS.get(forecast.source, 0.5)
-            data.append({
-                'sku_id': forecast.sku_id,
-                'forecast_qty': forecast.forecast_qty,
-                'source': forecast.source,
-                'weight': weight,
-                'weighted_qty': forecast.forecast_qty * weight,
-                'forecast_date': forecast.forecast_date
-            })
-
-        return pd.DataFrame(data)
\ No newline at end of file
+            sku_ids.append(forecast.sku_id)
+            quantities.append(forecast.forecast_qty)
+            sources.append(forecast.source)
+            weights.append(get_weight(forecast.source, 0.5))
+            dates.append(forecast.forecast_date)
+
+        if not sku_ids:
+            return pd.DataFrame()
+
+        summary = pd.DataFrame({
+            'sku_id': sku_ids,
+            'forecast_qty': quantities,
+            'source': sources,
+            'weight': weights,
+            'forecast_date': dates
+        })
+
+        # Derived column computed in one vectorized expression
+        summary.eval('weighted_qty = forecast_qty * weight', inplace=True)
+        return summary[['sku_id', 'forecast_qty', 'source', 'weight', 'weighted_qty', 'forecast_date']]
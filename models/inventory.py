@@ -4,10 +4,15 @@ Inventory Data Model
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class Inventory:
@@ -34,8 +39,11 @@ class InventoryNetter:
         """Create inventory objects from DataFrame - optimized version"""
         inventory_items = []
 
+        # Accept the legacy column names used by older exports
+        df = df.rename(columns={'on_order_qty': 'open_po_qty', 'expected_date': 'po_expected_date'})
+
         # Validate required columns
-        required_columns = ['material_id', 'on_hand_qty', 'on_order_qty', 'expected_date']
+        required_columns = ['material_id', 'on_hand_qty']
         missing_columns = set(required_columns) - set(df.columns)
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
@@ -43,26 +51,37 @@ class InventoryNetter:
         # Prepare data with proper types
         df = df.copy()
         df['material_id'] = df['material_id'].astype(str)
+        df['unit'] = df['unit'].astype(str) if 'unit' in df.columns else 'units'
         df['on_hand_qty'] = pd.to_numeric(df['on_hand_qty'], errors='coerce').fillna(0)
-        df['on_order_qty'] = pd.to_numeric(df['on_order_qty'], errors='coerce').fillna(0)
-        df['expected_date'] = pd.to_datetime(df['expected_date'], errors='coerce')
+        open_po_qty = df['open_po_qty'] if 'open_po_qty' in df.columns else pd.Series(0.0, index=df.index)
+        df['open_po_qty'] = pd.to_numeric(open_po_qty, errors='coerce').fillna(0)
 
-        # Filter out invalid rows
-        invalid_rows = df[(df['on_hand_qty'] < 0) | (df['on_order_qty'] < 0)]
-        if not invalid_rows.empty:
-            logger.warning(f"Filtering out {len(invalid_rows)} invalid inventory rows")
-            df = df[(df['on_hand_qty'] >= 0) & (df['on_order_qty'] >= 0)]
+        # Filter out invalid rows with a single keep-mask
+        keep = (df['on_hand_qty'] >= 0) & (df['open_po_qty'] >= 0)
+        n_invalid = int((~keep).sum())
+        if n_invalid:
+            logger.warning(f"Filtering out {n_invalid} invalid inventory rows")
+            df = df.loc[keep]
+
+        # Parse expected dates for the whole column at once; casting datetime64[D] to
+        # object yields datetime.date values (NaT -> None) without a per-row .date() call
+        if 'po_expected_date' in df.columns:
+            expected_dates = (pd.to_datetime(df['po_expected_date'], errors='coerce')
+                              .to_numpy(dtype='datetime64[D]').astype(object))
+        else:
+            expected_dates = np.full(len(df), None, dtype=object)
 
         # Convert to list of dictionaries for faster iteration
-        inventory_data = df.to_dict('records')
+        inventory_data = df[['material_id', 'on_hand_qty', 'unit', 'open_po_qty']].to_dict('records')
 
-        for row in inventory_data:
+        for row, expected_date in zip(inventory_data, expected_dates):
             try:
                 inventory = Inventory(
                     material_id=row['material_id'],
                     on_hand_qty=float(row['on_hand_qty']),
-                    on_order_qty=float(row['on_order_qty']),
-                    expected_date=row['expected_date'].date() if pd.notna(row['expected_date']) else None
+                    unit=row['unit'],
+                    open_po_qty=float(row['open_po_qty']),
+                    po_expected_date=expected_date
                 )
                 inventory_items.append(inventory)
             except Exception as e:
@@ -134,6 +153,59 @@ class InventoryNetter:
         
         return net_requirements
     
+    @classmethod
+    def calculate_net_requirements_frame(cls,
+                                         material_requirements: Dict[str, Dict],
+                                         inventories: List[Inventory]) -> pd.DataFrame:
+        """
+        Calculate net material requirements as a DataFrame indexed by material_id
+
+        Same figures as calculate_net_requirements, computed column-wise so that
+        downstream filtering (e.g. identify_critical_materials) stays vectorized.
+        """
+        columns = ['gross_requirement', 'on_hand_qty', 'open_po_qty', 'available_qty',
+                   'net_requirement', 'unit', 'inventory_status', 'sources']
+        if not material_requirements:
+            return pd.DataFrame(columns=columns, index=pd.Index([], name='material_id'))
+
+        inventory_lookup = {inv.material_id: inv for inv in inventories}
+        material_ids = list(material_requirements)
+        n = len(material_ids)
+
+        gross = np.empty(n)
+        on_hand = np.zeros(n)
+        open_po = np.zeros(n)
+        units = []
+        sources = []
+        for i, material_id in enumerate(material_ids):
+            req_data = material_requirements[material_id]
+            gross[i] = req_data['total_qty']
+            units.append(req_data['unit'])
+            sources.append(req_data.get('sources', []))
+            inventory = inventory_lookup.get(material_id)
+            if inventory:
+                on_hand[i] = inventory.on_hand_qty
+                open_po[i] = inventory.open_po_qty
+
+        available = on_hand + open_po
+        net = np.maximum(0.0, gross - available)
+        status = np.select(
+            [net == 0, on_hand >= gross, available >= gross],
+            ['sufficient', 'on_hand_sufficient', 'with_po_sufficient'],
+            default='shortage'
+        )
+
+        return pd.DataFrame({
+            'gross_requirement': gross,
+            'on_hand_qty': on_hand,
+            'open_po_qty': open_po,
+            'available_qty': available,
+            'net_requirement': net,
+            'unit': units,
+            'inventory_status': status,
+            'sources': sources
+        }, index=pd.Index(material_ids, name='material_id'))
+
     @classmethod
     def get_inventory_summary(cls, inventories: List[Inventory]) -> pd.DataFrame:
         """Generate inventory summary for analysis"""
@@ -153,14 +225,15 @@ class InventoryNetter:
     
     @classmethod
     def identify_critical_materials(cls, 
-                                  net_requirements: Dict[str, Dict],
+                                  net_requirements: Union[Dict[str, Dict], pd.DataFrame],
                                   threshold_days: int = 30) -> List[str]:
         """Identify materials with critical shortage"""
-        critical_materials = []
-        
-        for material_id, req_data in net_requirements.items():
-            if (req_data['net_requirement'] > 0 and 
-                req_data['inventory_status'] == 'shortage'):
-                critical_materials.append(material_id)
-        
-        return critical_materials
\ No newline at end of file
+        if isinstance(net_requirements, pd.DataFrame):
+            critical = (net_requirements['net_requirement'] > 0) & \
+                       (net_requirements['inventory_status'] == 'shortage')
+            return net_requirements.index[critical].tolist()
+
+        return [
+            material_id for material_id, req_data in net_requirements.items()
+            if req_data['net_requirement'] > 0 and req_data['inventory_status'] == 'shortage'
+        ]
@@ -2,12 +2,24 @@
 Procurement Recommendation Data Model
 """
 
+import sys
+from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, overload
 
+import numpy as np
 import pandas as pd
 
+from models.supplier import Supplier, SupplierSelector
+
+# Optional JIT for the quantity/risk kernel; the NumPy version is used without numba
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 class RiskFlag(Enum):
     """Risk levels for procurement recommendations"""
@@ -16,9 +28,104 @@ class RiskFlag(Enum):
     HIGH = "high"
 
 
-@dataclass
+# Risk flags in tier order, indexed by the tier returned from _compute_qty_and_risk
+_RISK_TIERS = (RiskFlag.HIGH, RiskFlag.MEDIUM, RiskFlag.LOW)
+_RISK_HIGH = RiskFlag.HIGH
+_RISK_TIER_ARRAY = np.array(_RISK_TIERS, dtype=object)
+
+# Sentinel supplier_id for materials with no available supplier
+_NO_SUPPLIER = sys.intern("NO_SUPPLIER")
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular dataclasses
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Selection holds no per-call state, so one selector serves every call
+_SUPPLIER_SELECTOR = SupplierSelector()
+
+
+def _qty_and_risk_numpy(net: np.ndarray, moq: np.ndarray, reliability: np.ndarray, cost: np.ndarray,
+                        sb_rate: float, high_thr: float, med_thr: float) -> Tuple[np.ndarray, ...]:
+    """
+    Safety buffer, MOQ adjustment, order quantity, total cost and risk tier per material
+    Risk tier indexes _RISK_TIERS
+    """
+    safety_buffer = net * sb_rate
+    buffered = net + safety_buffer
+    moq_adjustment = np.maximum(moq - buffered, 0.0)
+    order_qty = np.maximum(buffered, moq)
+    # Reliability below high_thr is HIGH risk, below med_thr MEDIUM, otherwise LOW
+    risk_tier = np.searchsorted([high_thr, med_thr], reliability, side='right')
+    return safety_buffer, moq_adjustment, order_qty, order_qty * cost, risk_tier
+
+
+def _qty_and_risk_loop(net: np.ndarray, moq: np.ndarray, reliability: np.ndarray, cost: np.ndarray,
+                       sb_rate: float, high_thr: float, med_thr: float) -> Tuple[np.ndarray, ...]:
+    """Single-loop form of _qty_and_risk_numpy for numba compilation"""
+    n = net.shape[0]
+    safety_buffer = np.empty(n)
+    moq_adjustment = np.empty(n)
+    order_qty = np.empty(n)
+    total_cost = np.empty(n)
+    risk_tier = np.empty(n, np.int64)
+
+    for i in range(n):
+        buffer = net[i] * sb_rate
+        qty = net[i] + buffer
+        if qty < moq[i]:
+            moq_adjustment[i] = moq[i] - qty
+            qty = moq[i]
+        else:
+            moq_adjustment[i] = 0.0
+        safety_buffer[i] = buffer
+        order_qty[i] = qty
+        total_cost[i] = qty * cost[i]
+
+        r = reliability[i]
+        if r < high_thr:
+            risk_tier[i] = 0
+        elif r < med_thr:
+            risk_tier[i] = 1
+        else:
+            risk_tier[i] = 2
+
+    return safety_buffer, moq_adjustment, order_qty, total_cost, risk_tier
+
+
+_compute_qty_and_risk = njit(cache=True)(_qty_and_risk_loop) if njit is not None else _qty_and_risk_numpy
+
+
+def _build_reasoning(moq_adjustment: float, safety_buffer: float, supplier_highly_reliable: bool) -> str:
+    """Reasoning text for a recommendation from its analysis fields"""
+    reasoning_parts = []
+    if moq_adjustment > 0:
+        reasoning_parts.append("MOQ adjustment applied")
+    if safety_buffer > 0:
+        reasoning_parts.append(f"Safety buffer: {safety_buffer:.1f}")
+    if supplier_highly_reliable:
+        reasoning_parts.append("High reliability supplier")
+
+    return "; ".join(reasoning_parts) if reasoning_parts else "Standard procurement"
+
+
+def _add_legacy_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add legacy alias columns to a recommendations DataFrame"""
+    return df.assign(
+        recommended_order_qty=df['order_quantity'],
+        unit='units',
+        expected_lead_time=df['lead_time_days'],
+        risk_flag=df['risk'],
+        safety_buffer_applied=df['safety_buffer']
+    )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ProcurementRecommendation:
-    """Represents a procurement recommendation for a material"""
+    """Represents a procurement recommendation for a material
+
+    Declared with ``slots=True`` on Python 3.10+: recommendations are created in bulk
+    by the planner, so instances carry no per-object ``__dict__``. ``reasoning`` is
+    built on access from the analysis fields unless ``reasoning_text`` is set.
+    """
     material_id: str
     order_quantity: float
     supplier_id: str
@@ -26,7 +133,6 @@ class ProcurementRecommendation:
     total_cost: float
     lead_time_days: int
     risk: RiskFlag
-    reasoning: str
     
     # Additional analysis fields
     gross_requirement: float = 0.0
@@ -37,6 +143,28 @@ class ProcurementRecommendation:
     # EOQ-related fields
     eoq_quantity: Optional[float] = None
     cost_analysis: Optional[Dict[str, float]] = None
+
+    # Reasoning inputs; reasoning_text overrides the generated text
+    supplier_highly_reliable: bool = False
+    reasoning_text: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Intern IDs so recommendations for the same material/supplier share one string"""
+        if isinstance(self.material_id, str):
+            self.material_id = sys.intern(self.material_id)
+        if isinstance(self.supplier_id, str):
+            self.supplier_id = sys.intern(self.supplier_id)
+
+    @property
+    def reasoning(self) -> str:
+        """Human-readable explanation of the recommendation"""
+        if self.reasoning_text is not None:
+            return self.reasoning_text
+        return _build_reasoning(self.moq_adjustment, self.safety_buffer, self.supplier_highly_reliable)
+
+    @reasoning.setter
+    def reasoning(self, value: str) -> None:
+        self.reasoning_text = value
     
     # Legacy field mappings for compatibility
     @property
@@ -64,25 +192,26 @@ class ProcurementRecommendation:
         """Legacy field mapping"""
         return self.safety_buffer
     
-    def to_dict(self) -> Dict:
-        """Convert recommendation to dictionary for JSON serialization"""
+    def to_dict(self, *, legacy: bool = False) -> Dict:
+        """
+        Convert recommendation to dictionary for JSON serialization
+
+        Legacy alias keys (recommended_order_qty, unit, expected_lead_time,
+        risk_flag, safety_buffer_applied) are only included when ``legacy`` is True.
+        """
+        risk_value = self.risk.value
         result = {
             'material_id': self.material_id,
             'order_quantity': self.order_quantity,
-            'recommended_order_qty': self.order_quantity,  # Legacy compatibility
             'supplier_id': self.supplier_id,
-            'unit': self.unit,
             'cost_per_unit': self.cost_per_unit,
             'total_cost': self.total_cost,
             'lead_time_days': self.lead_time_days,
-            'expected_lead_time': self.lead_time_days,  # Legacy compatibility
-            'risk': self.risk.value,
-            'risk_flag': self.risk.value,  # Legacy compatibility
+            'risk': risk_value,
             'reasoning': self.reasoning,
             'gross_requirement': self.gross_requirement,
             'net_requirement': self.net_requirement,
             'safety_buffer': self.safety_buffer,
-            'safety_buffer_applied': self.safety_buffer,  # Legacy compatibility
             'moq_adjustment': self.moq_adjustment,
         }
         
@@ -92,10 +221,114 @@ class ProcurementRecommendation:
         
         if self.cost_analysis:
             result['cost_analysis'] = self.cost_analysis
+
+        if legacy:
+            result.update({
+                'recommended_order_qty': self.order_quantity,
+                'unit': 'units',
+                'expected_lead_time': self.lead_time_days,
+                'risk_flag': risk_value,
+                'safety_buffer_applied': self.safety_buffer,
+            })
         
         return result
 
 
+class RecommendationBatch(Sequence):
+    """
+    Column-oriented, read-only sequence of procurement recommendations
+
+    Holds one NumPy array per ProcurementRecommendation field and only builds
+    recommendation objects when indexed or iterated, so DataFrame export and
+    summary stats work straight from the arrays. Items are snapshots: each
+    access builds a new object, and changing it does not change the batch.
+    Slicing returns a list of snapshots.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.material_id = np.empty(n, dtype=object)
+        self.order_quantity = np.zeros(n)
+        self.supplier_id = np.full(n, _NO_SUPPLIER, dtype=object)
+        self.cost_per_unit = np.zeros(n)
+        self.total_cost = np.zeros(n)
+        self.lead_time_days = np.zeros(n, dtype=np.int32)
+        self.risk = np.full(n, _RISK_HIGH, dtype=object)
+        self.gross_requirement = np.zeros(n)
+        self.net_requirement = np.zeros(n)
+        self.safety_buffer = np.zeros(n)
+        self.moq_adjustment = np.zeros(n)
+        self.supplier_highly_reliable = np.zeros(n, dtype=bool)
+        self.reasoning_text = np.full(n, None, dtype=object)
+
+    def __len__(self) -> int:
+        return self.n
+
+    @overload
+    def __getitem__(self, i: int) -> ProcurementRecommendation: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[ProcurementRecommendation]: ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[ProcurementRecommendation, List[ProcurementRecommendation]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.n))]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("RecommendationBatch index out of range")
+        return ProcurementRecommendation(
+            material_id=self.material_id[i],
+            order_quantity=float(self.order_quantity[i]),
+            supplier_id=self.supplier_id[i],
+            cost_per_unit=float(self.cost_per_unit[i]),
+            total_cost=float(self.total_cost[i]),
+            lead_time_days=int(self.lead_time_days[i]),
+            risk=self.risk[i],
+            gross_requirement=float(self.gross_requirement[i]),
+            net_requirement=float(self.net_requirement[i]),
+            safety_buffer=float(self.safety_buffer[i]),
+            moq_adjustment=float(self.moq_adjustment[i]),
+            supplier_highly_reliable=bool(self.supplier_highly_reliable[i]),
+            reasoning_text=self.reasoning_text[i]
+        )
+
+    def __iter__(self) -> Iterator[ProcurementRecommendation]:
+        for i in range(self.n):
+            yield self[i]
+
+    def to_dataframe(self, legacy: bool = False) -> pd.DataFrame:
+        """Convert to the same DataFrame layout as RecommendationGenerator.to_dataframe"""
+        if not self.n:
+            return pd.DataFrame()
+
+        reasoning = [
+            text if text is not None else _build_reasoning(adjustment, buffer, reliable)
+            for text, adjustment, buffer, reliable in zip(
+                self.reasoning_text, self.moq_adjustment.tolist(),
+                self.safety_buffer.tolist(), self.supplier_highly_reliable.tolist()
+            )
+        ]
+
+        df = pd.DataFrame({
+            'material_id': self.material_id,
+            'order_quantity': self.order_quantity,
+            'supplier_id': self.supplier_id,
+            'cost_per_unit': self.cost_per_unit,
+            'total_cost': self.total_cost,
+            'lead_time_days': self.lead_time_days,
+            'risk': [risk.value for risk in self.risk],
+            'reasoning': reasoning,
+            'gross_requirement': self.gross_requirement,
+            'net_requirement': self.net_requirement,
+            'safety_buffer': self.safety_buffer,
+            'moq_adjustment': self.moq_adjustment,
+        })
+        if legacy:
+            df = _add_legacy_columns(df)
+        return df
+
+
 class RecommendationGenerator:
     """Generates procurement recommendations based on net requirements and suppliers"""
     
@@ -108,11 +341,38 @@ class RecommendationGenerator:
         
         Note: This method is kept for backward compatibility.
         The main logic is now in RawMaterialPlanner._generate_enhanced_recommendations()
+
+        Supplier choice goes through SupplierSelector per material; the safety
+        buffer, MOQ and risk arithmetic then runs once over NumPy arrays for all
+        selected materials.
+        """
+        return list(RecommendationGenerator.generate_recommendation_batch(net_requirements, suppliers, config))
+    
+    @staticmethod
+    def generate_recommendation_batch(net_requirements: Dict[str, Dict],
+                                      suppliers: List,
+                                      config: Dict) -> RecommendationBatch:
         """
-        from models.supplier import SupplierSelector
+        Generate procurement recommendations like generate_recommendations, as a RecommendationBatch
         
-        recommendations = []
-        supplier_selector = SupplierSelector()
+        The batch keeps the results as NumPy arrays and builds ProcurementRecommendation
+        objects only when indexed or iterated, so callers that only export to a
+        DataFrame or compute summary stats skip the per-object work.
+        """
+        supplier_selector = _SUPPLIER_SELECTOR
+        max_lead_time = config.get('max_lead_time')
+        sb_rate = config.get('safety_buffer', 0.1)
+        high_thr = config.get('high_risk_threshold', 0.7)
+        med_thr = config.get('medium_risk_threshold', 0.85)
+
+        # (material_id, req_data, supplier) per material to recommend, in input order;
+        # supplier is None when the material has no supplier at all
+        selections: List[Tuple[str, Dict[str, Any], Optional[Supplier]]] = []
+
+        # Index suppliers by material once instead of scanning the full list per material
+        suppliers_by_material = defaultdict(list)
+        for supplier in suppliers:
+            suppliers_by_material[supplier.material_id].append(supplier)
         
         for material_id, req_data in net_requirements.items():
             net_requirement = req_data['net_requirement']
@@ -121,24 +381,10 @@ class RecommendationGenerator:
                 continue
             
             # Get suppliers for this material
-            material_suppliers = [s for s in suppliers if s.material_id == material_id]
+            material_suppliers = suppliers_by_material.get(material_id)
             
             if not material_suppliers:
-                # Create recommendation for material without suppliers
-                recommendations.append(ProcurementRecommendation(
-                    material_id=material_id,
-                    order_quantity=net_requirement,
-                    supplier_id="NO_SUPPLIER",
-                    cost_per_unit=0.0,
-                    total_cost=0.0,
-                    lead_time_days=999,
-                    risk=RiskFlag.HIGH,
-                    reasoning="No supplier available for this material",
-                    gross_requirement=req_data['total_requirement'],
-                    net_requirement=net_requirement,
-                    safety_buffer=0,
-                    moq_adjustment=0
-                ))
+                selections.append((material_id, req_data, None))
                 continue
             
             # Select optimal supplier (basic selection without EOQ)
@@ -146,95 +392,202 @@ class RecommendationGenerator:
                 material_id=material_id,
                 suppliers=material_suppliers,
                 required_quantity=net_requirement,
-                max_lead_time=config.get('max_lead_time'),
+                max_lead_time=max_lead_time,
                 use_eoq=False
             )
             
             if optimal_supplier:
-                # Apply safety buffer
-                safety_buffer = net_requirement * config.get('safety_buffer', 0.1)
-                order_qty = net_requirement + safety_buffer
-                
-                # Ensure MOQ is met
-                if order_qty < optimal_supplier.moq:
-                    moq_adjustment = optimal_supplier.moq - order_qty
-                    order_qty = optimal_supplier.moq
-                else:
-                    moq_adjustment = 0
-                
-                # Assess risk
-                if optimal_supplier.reliability_score < config.get('high_risk_threshold', 0.7):
-                    risk = RiskFlag.HIGH
-                elif optimal_supplier.reliability_score < config.get('medium_risk_threshold', 0.85):
-                    risk = RiskFlag.MEDIUM
-                else:
-                    risk = RiskFlag.LOW
-                
-                # Generate reasoning
-                reasoning_parts = []
-                if moq_adjustment > 0:
-                    reasoning_parts.append("MOQ adjustment applied")
-                if safety_buffer > 0:
-                    reasoning_parts.append(f"Safety buffer: {safety_buffer:.1f}")
-                if optimal_supplier.reliability_score >= 0.9:
-                    reasoning_parts.append("High reliability supplier")
-                
-                reasoning = "; ".join(reasoning_parts) if reasoning_parts else "Standard procurement"
-                
-                recommendations.append(ProcurementRecommendation(
-                    material_id=material_id,
-                    order_quantity=order_qty,
-                    supplier_id=optimal_supplier.supplier_id,
-                    cost_per_unit=optimal_supplier.cost_per_unit,
-                    total_cost=order_qty * optimal_supplier.cost_per_unit,
-                    lead_time_days=optimal_supplier.lead_time_days,
-                    risk=risk,
-                    reasoning=reasoning,
-                    gross_requirement=req_data['total_requirement'],
-                    net_requirement=net_requirement,
-                    safety_buffer=safety_buffer,
-                    moq_adjustment=moq_adjustment
-                ))
-        
-        return recommendations
+                selections.append((material_id, req_data, optimal_supplier))
+
+        n = len(selections)
+        selected: List[Supplier] = [supplier for _, _, supplier in selections if supplier is not None]
+        has_supplier = np.fromiter((supplier is not None for _, _, supplier in selections), dtype=bool, count=n)
+
+        batch = RecommendationBatch(n)
+        batch.material_id = np.fromiter((material_id for material_id, _, _ in selections), dtype=object, count=n)
+        batch.net_requirement = np.fromiter((req_data['net_requirement'] for _, req_data, _ in selections),
+                                            dtype=np.float64, count=n)
+        batch.gross_requirement = np.fromiter((req_data.get('gross_requirement', 0.0) for _, req_data, _ in selections),
+                                              dtype=np.float64, count=n)
+
+        # Materials without any supplier order their net requirement from NO_SUPPLIER at HIGH risk
+        batch.order_quantity = batch.net_requirement.copy()
+        batch.lead_time_days[~has_supplier] = 999
+        batch.reasoning_text[~has_supplier] = "No supplier available for this material"
+
+        # Vectorized safety buffer, MOQ and risk assessment over all selected materials
+        net = batch.net_requirement[has_supplier]
+        moq = np.fromiter((supplier.moq for supplier in selected), dtype=np.float64, count=len(selected))
+        reliability = np.fromiter((supplier.reliability_score for supplier in selected),
+                                  dtype=np.float64, count=len(selected))
+        cost = np.fromiter((supplier.cost_per_unit for supplier in selected), dtype=np.float64, count=len(selected))
+
+        safety_buffer, moq_adjustment, order_qty, total_cost, risk_tier = _compute_qty_and_risk(
+            net, moq, reliability, cost, sb_rate, high_thr, med_thr
+        )
+
+        batch.supplier_id[has_supplier] = [supplier.supplier_id for supplier in selected]
+        batch.cost_per_unit[has_supplier] = cost
+        batch.lead_time_days[has_supplier] = [supplier.lead_time_days for supplier in selected]
+        batch.order_quantity[has_supplier] = order_qty
+        batch.total_cost[has_supplier] = total_cost
+        batch.safety_buffer[has_supplier] = safety_buffer
+        batch.moq_adjustment[has_supplier] = moq_adjustment
+        batch.risk[has_supplier] = _RISK_TIER_ARRAY[risk_tier]
+        batch.supplier_highly_reliable[has_supplier] = reliability >= 0.9
+
+        return batch
     
     @staticmethod
-    def to_dataframe(recommendations: List[ProcurementRecommendation]) -> pd.DataFrame:
-        """Convert recommendations to DataFrame"""
+    def to_dataframe(recommendations: Union[List[ProcurementRecommendation], RecommendationBatch],
+                     legacy: bool = False) -> pd.DataFrame:
+        """
+        Convert recommendations to DataFrame
+
+        Columns are filled into pre-allocated arrays in a single pass and handed to
+        pandas as-is, avoiding a per-recommendation dict and per-row type inference.
+        Legacy alias columns (recommended_order_qty, unit, expected_lead_time,
+        risk_flag, safety_buffer_applied) are only added when ``legacy`` is True.
+        """
+        if isinstance(recommendations, RecommendationBatch):
+            return recommendations.to_dataframe(legacy=legacy)
+
         if not recommendations:
             return pd.DataFrame()
-        
-        data = [rec.to_dict() for rec in recommendations]
-        return pd.DataFrame(data)
+
+        n = len(recommendations)
+        material_id = np.empty(n, dtype=object)
+        order_quantity = np.empty(n, dtype=np.float64)
+        supplier_id = np.empty(n, dtype=object)
+        cost_per_unit = np.empty(n, dtype=np.float64)
+        total_cost = np.empty(n, dtype=np.float64)
+        lead_time_days = np.empty(n, dtype=np.int32)
+        risk = np.empty(n, dtype=object)
+        reasoning = np.empty(n, dtype=object)
+        gross_requirement = np.empty(n, dtype=np.float64)
+        net_requirement = np.empty(n, dtype=np.float64)
+        safety_buffer = np.empty(n, dtype=np.float64)
+        moq_adjustment = np.empty(n, dtype=np.float64)
+        eoq_quantity = np.full(n, np.nan)
+        cost_analysis = np.full(n, None, dtype=object)
+        has_eoq = has_cost_analysis = False
+
+        for i, rec in enumerate(recommendations):
+            material_id[i] = rec.material_id
+            order_quantity[i] = rec.order_quantity
+            supplier_id[i] = rec.supplier_id
+            cost_per_unit[i] = rec.cost_per_unit
+            total_cost[i] = rec.total_cost
+            lead_time_days[i] = rec.lead_time_days
+            risk[i] = rec.risk.value
+            reasoning[i] = rec.reasoning
+            gross_requirement[i] = rec.gross_requirement
+            net_requirement[i] = rec.net_requirement
+            safety_buffer[i] = rec.safety_buffer
+            moq_adjustment[i] = rec.moq_adjustment
+            if rec.eoq_quantity is not None:
+                eoq_quantity[i] = rec.eoq_quantity
+                has_eoq = True
+            if rec.cost_analysis:
+                cost_analysis[i] = rec.cost_analysis
+                has_cost_analysis = True
+
+        columns = {
+            'material_id': material_id,
+            'order_quantity': order_quantity,
+            'supplier_id': supplier_id,
+            'cost_per_unit': cost_per_unit,
+            'total_cost': total_cost,
+            'lead_time_days': lead_time_days,
+            'risk': risk,
+            'reasoning': reasoning,
+            'gross_requirement': gross_requirement,
+            'net_requirement': net_requirement,
+            'safety_buffer': safety_buffer,
+            'moq_adjustment': moq_adjustment,
+        }
+        if has_eoq:
+            columns['eoq_quantity'] = eoq_quantity
+        if has_cost_analysis:
+            columns['cost_analysis'] = cost_analysis
+
+        df = pd.DataFrame(columns)
+        if legacy:
+            df = _add_legacy_columns(df)
+        return df
     
     @staticmethod
-    def get_summary_stats(recommendations: List[ProcurementRecommendation]) -> Dict:
+    def get_summary_stats(recommendations: Union[List[ProcurementRecommendation], RecommendationBatch,
+                                                 pd.DataFrame]) -> Dict:
         """Generate summary statistics for recommendations"""
+        if isinstance(recommendations, RecommendationBatch):
+            recommendations = recommendations.to_dataframe()
+        if isinstance(recommendations, pd.DataFrame):
+            return RecommendationGenerator.get_summary_stats_df(recommendations)
+
         if not recommendations:
             return {}
-        
-        total_cost = sum(rec.total_cost for rec in recommendations)
-        avg_lead_time = sum(rec.lead_time_days for rec in recommendations) / len(recommendations)
-        
-        # Risk distribution
+
+        # Single pass over the recommendations with running accumulators
+        total_cost = 0.0
+        lead_time_sum = 0
+        quantity_sum = 0.0
         risk_counts = {}
+        materials_without_suppliers = 0
+        eoq_optimized = 0
+        suppliers = set()
+
         for rec in recommendations:
+            total_cost += rec.total_cost
+            lead_time_sum += rec.lead_time_days
+            quantity_sum += rec.order_quantity
+
             risk_level = rec.risk.value
             risk_counts[risk_level] = risk_counts.get(risk_level, 0) + 1
-        
-        # Materials without suppliers
-        materials_without_suppliers = sum(1 for rec in recommendations if rec.supplier_id == "NO_SUPPLIER")
-        
-        # EOQ statistics
-        eoq_optimized = sum(1 for rec in recommendations if rec.eoq_quantity is not None)
-        
+
+            supplier_id = rec.supplier_id
+            if supplier_id == _NO_SUPPLIER:
+                materials_without_suppliers += 1
+            else:
+                suppliers.add(supplier_id)
+
+            if rec.eoq_quantity is not None:
+                eoq_optimized += 1
+
+        n = len(recommendations)
         return {
-            'total_recommendations': len(recommendations),
+            'total_recommendations': n,
             'total_estimated_cost': total_cost,
-            'avg_lead_time': avg_lead_time,
+            'avg_lead_time': lead_time_sum / n,
             'risk_distribution': risk_counts,
             'materials_without_suppliers': materials_without_suppliers,
             'eoq_optimized_count': eoq_optimized,
-            'unique_suppliers': len(set(rec.supplier_id for rec in recommendations if rec.supplier_id != "NO_SUPPLIER")),
-            'avg_order_quantity': sum(rec.order_quantity for rec in recommendations) / len(recommendations)
-        }
\ No newline at end of file
+            'unique_suppliers': len(suppliers),
+            'avg_order_quantity': quantity_sum / n
+        }
+
+    @staticmethod
+    def get_summary_stats_df(df: pd.DataFrame) -> Dict:
+        """
+        Generate summary statistics from a recommendations DataFrame
+
+        Same output as get_summary_stats, for callers that already hold the
+        result of to_dataframe.
+        """
+        if df.empty:
+            return {}
+
+        agg = df.agg({'total_cost': 'sum', 'lead_time_days': 'mean', 'order_quantity': 'mean'})
+        no_sup_mask = df['supplier_id'].eq(_NO_SUPPLIER)
+
+        return {
+            'total_recommendations': len(df),
+            'total_estimated_cost': float(agg['total_cost']),
+            'avg_lead_time': float(agg['lead_time_days']),
+            'risk_distribution': {risk: int(count) for risk, count in df['risk'].value_counts().items()},
+            'materials_without_suppliers': int(no_sup_mask.sum()),
+            'eoq_optimized_count': int(df['eoq_quantity'].notna().sum()) if 'eoq_quantity' in df else 0,
+            # Drop the sentinel from the distinct count instead of filtering a copy
+            'unique_suppliers': int(df['supplier_id'].nunique()) - int(no_sup_mask.any()),
+            'avg_order_quantity': float(agg['order_quantity'])
+        }
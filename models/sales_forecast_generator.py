@@ -5,18 +5,101 @@ Enhanced with automated forecast creation and improved integration
 """
 
 import logging
+import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from pandas.core.groupby import DataFrameGroupBy
 from scipy import stats
 
 from models.bom import BOMExploder
 from models.forecast import FinishedGoodsForecast
 
+# Optional JIT for the per-period demand statistics; the NumPy version is used without numba
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional Polars backend for generate_forecasts_polars
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional process pool for per-style seasonality decomposition
+try:
+    from joblib import Parallel, cpu_count, delayed
+except ImportError:
+    Parallel = None
+
 logger = logging.getLogger(__name__)
 
+
+def _period_stats_numpy(values: np.ndarray) -> Tuple[float, float, float, int]:
+    """
+    Mean, sample std, cv and count of per-period demand
+    Std is NaN for a single period, matching pandas
+    """
+    n = values.shape[0]
+    mean = values.mean()
+    std = values.std(ddof=1) if n > 1 else np.nan
+    cv = std / mean if mean > 0 else 0.0
+    return mean, std, cv, n
+
+
+def _period_stats_loop(values: np.ndarray) -> Tuple[float, float, float, int]:
+    """Loop form of _period_stats_numpy for numba compilation"""
+    n = values.shape[0]
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+    mean = total / n
+
+    std = np.nan
+    if n > 1:
+        squared = 0.0
+        for i in range(n):
+            squared += (values[i] - mean) ** 2
+        std = np.sqrt(squared / (n - 1))
+
+    cv = std / mean if mean > 0 else 0.0
+    return mean, std, cv, n
+
+
+_period_stats = njit(cache=True)(_period_stats_loop) if njit is not None else _period_stats_numpy
+
+
+def _multiplicative_seasonal(values: np.ndarray, period: int = 12) -> np.ndarray:
+    """
+    Seasonal component of a multiplicative decomposition, as statsmodels seasonal_decompose
+    
+    The trend is the centred moving average (a 2x12 average for even periods); each
+    position's factor is the mean ratio to trend at its phase, normalized to average 1.
+    """
+    n = values.shape[0]
+    if n < 2 * period:
+        raise ValueError(f"Decomposition needs at least {2 * period} observations, got {n}")
+    if (values <= 0).any():
+        raise ValueError("Multiplicative seasonality is not appropriate for zero and negative values")
+
+    if period % 2 == 0:
+        weights = np.r_[0.5, np.ones(period - 1), 0.5] / period
+    else:
+        weights = np.ones(period) / period
+    half = len(weights) // 2
+    trend = np.full(n, np.nan)
+    trend[half:n - half] = np.convolve(values, weights, mode='valid')
+
+    with np.errstate(invalid='ignore'):
+        detrended = values / trend
+    period_averages = np.array([np.nanmean(detrended[i::period]) for i in range(period)])
+    period_averages /= period_averages.mean()
+    return np.tile(period_averages, n // period + 1)[:n]
+
+
 class SalesForecastGenerator:
     """Generate forecasts from historical sales data with enhanced capabilities"""
     
@@ -44,7 +127,8 @@ class SalesForecastGenerator:
                  bom_df: Optional[pd.DataFrame] = None,
                  aggregation_period: str = 'weekly',
                  safety_stock_method: str = 'statistical',
-                 service_level: float = 0.95):
+                 service_level: float = 0.95,
+                 compact_quantities: bool = False):
         """
         Initialize the forecast generator
         
@@ -57,6 +141,8 @@ class SalesForecastGenerator:
             aggregation_period: Time period for aggregation ('daily', 'weekly', 'monthly')
             safety_stock_method: Method for calculating safety stock
             service_level: Service level for statistical safety stock (0-1)
+            compact_quantities: Store Yds_ordered as float32, halving the memory scanned by
+                the demand statistics at the cost of ~7 significant digits per sale
         """
         self.sales_df = sales_df.copy()
         self.planning_horizon_days = planning_horizon_days
@@ -67,20 +153,77 @@ class SalesForecastGenerator:
         self.safety_stock_method = safety_stock_method
         self.service_level = service_level
         
+        # Z-score for service level and days per aggregation period, for statistical safety stock
+        self._z_score = float(stats.norm.ppf(service_level))
+        self._days_per_period = {'weekly': 7, 'monthly': 30}.get(aggregation_period, 1)
+        
         # Ensure date column is datetime
         if 'Invoice Date' in self.sales_df.columns:
             self.sales_df['Invoice Date'] = pd.to_datetime(self.sales_df['Invoice Date'])
+            # Sorted by date so date windows are located by binary search instead of masks
+            self.sales_df = self.sales_df.sort_values('Invoice Date', kind='stable', ignore_index=True)
+        
+        # Group and compare styles by integer category codes instead of hashing strings
+        if 'Style' in self.sales_df.columns:
+            self.sales_df['Style'] = self.sales_df['Style'].astype('category')
+        
+        if compact_quantities and 'Yds_ordered' in self.sales_df.columns:
+            self.sales_df['Yds_ordered'] = self.sales_df['Yds_ordered'].astype(np.float32)
+        
+        # One "now" for the generator, so every forecast and projection uses the same date
+        self._now = datetime.now()
+        self._current_month = self._now.month
         
         # Calculate date ranges
-        self.end_date = datetime.now()
+        self.end_date = self._now
         self.start_date = self.end_date - timedelta(days=lookback_days)
         self.forecast_end_date = self.end_date + timedelta(days=planning_horizon_days)
         
+        # Lookback-window sales and their per-style groups, built on first use
+        self._recent_sales: Optional[pd.DataFrame] = None
+        self._style_groups: Optional[DataFrameGroupBy] = None
+        # Seasonality factors by (style_id, min_periods)
+        self._seasonality_cache: Dict[Tuple[str, int], Dict[int, float]] = {}
+        # Distinct sale months per style, to pick the seasonality method without aggregating
+        self._month_counts_per_style: Optional[pd.Series] = None
+        
         # Process style-yarn BOM if provided
         self.style_yarn_boms = None
         if bom_df is not None:
             self.style_yarn_boms = BOMExploder.from_style_yarn_dataframe(bom_df)
     
+    def invalidate_sales_cache(self) -> None:
+        """Drop cached lookback-window data and seasonality factors; call after modifying sales_df"""
+        self._recent_sales = None
+        self._style_groups = None
+        self._seasonality_cache = {}
+        self._month_counts_per_style = None
+    
+    def _get_month_counts(self) -> pd.Series:
+        """Number of distinct months with sales for each style, over the full history"""
+        if self._month_counts_per_style is None:
+            year_month = self.sales_df['Invoice Date'].dt.to_period('M')
+            self._month_counts_per_style = year_month.groupby(self.sales_df['Style'], observed=True).nunique()
+        return self._month_counts_per_style
+    
+    def _get_recent_sales(self) -> pd.DataFrame:
+        """Sales within the lookback window"""
+        if self._recent_sales is None:
+            dates = self.sales_df['Invoice Date'].to_numpy()
+            start = dates.searchsorted(np.datetime64(self.start_date), side='left')
+            end = dates.searchsorted(np.datetime64(self.end_date), side='right')
+            self._recent_sales = self.sales_df.iloc[start:end]
+        return self._recent_sales
+    
+    def _get_style_sales(self, style_id: str) -> pd.DataFrame:
+        """Sales for one style within the lookback window"""
+        if self._style_groups is None:
+            self._style_groups = self._get_recent_sales().groupby('Style', sort=False, observed=True)
+        try:
+            return self._style_groups.get_group(style_id)
+        except KeyError:
+            return self._get_recent_sales().iloc[0:0]
+    
     def generate_forecasts(self, 
                           include_safety_stock: bool = True,
                           growth_factor: float = 1.0,
@@ -96,60 +239,253 @@ class SalesForecastGenerator:
         Returns:
             List of FinishedGoodsForecast objects
         """
-        forecasts = []
+        return self.to_forecast_objects(
+            self.generate_forecast_frame(include_safety_stock, growth_factor, seasonality_factors)
+        )
+    
+    def generate_forecast_frame(self,
+                                include_safety_stock: bool = True,
+                                growth_factor: float = 1.0,
+                                seasonality_factors: Optional[Dict[int, float]] = None) -> pd.DataFrame:
+        """
+        Generate forecasts like generate_forecasts, as one row per style
+        
+        Skips building FinishedGoodsForecast objects for callers that only need
+        the columns; to_forecast_objects converts the frame when they are needed.
         
+        Returns:
+            DataFrame with sku_id, forecast_qty, forecast_date, source, confidence and notes
+        """
         # Filter sales data to lookback period
-        recent_sales = self.sales_df[
-            (self.sales_df['Invoice Date'] >= self.start_date) &
-            (self.sales_df['Invoice Date'] <= self.end_date)
+        recent_sales = self._get_recent_sales()
+        
+        # Demand statistics for every style in one grouped pass
+        style_stats = self._demand_statistics_by_style(recent_sales)
+        
+        return self._forecast_frame_from_statistics(style_stats, include_safety_stock, growth_factor, seasonality_factors)
+    
+    @staticmethod
+    def to_forecast_objects(forecast_frame: pd.DataFrame) -> List[FinishedGoodsForecast]:
+        """Convert a frame from generate_forecast_frame to FinishedGoodsForecast objects"""
+        return [
+            FinishedGoodsForecast(
+                sku_id=sku_id,
+                forecast_qty=qty,
+                forecast_date=forecast_date,
+                source=source,
+                confidence=confidence,
+                notes=notes
+            )
+            for sku_id, qty, forecast_date, source, confidence, notes in zip(
+                forecast_frame['sku_id'].tolist(), forecast_frame['forecast_qty'].tolist(),
+                forecast_frame['forecast_date'].tolist(), forecast_frame['source'].tolist(),
+                forecast_frame['confidence'].tolist(), forecast_frame['notes'].tolist()
+            )
         ]
+    
+    def generate_forecasts_polars(self, 
+                                  include_safety_stock: bool = True,
+                                  growth_factor: float = 1.0,
+                                  seasonality_factors: Optional[Dict[int, float]] = None) -> List[FinishedGoodsForecast]:
+        """
+        Generate forecasts like generate_forecasts, with the grouping done by Polars
         
-        # Get unique styles
-        styles = recent_sales['Style'].unique()
+        The filter and both aggregation levels run as one lazy Polars query, which
+        is faster on large sales histories. Requires the optional polars package.
         
-        for style in styles:
-            style_sales = recent_sales[recent_sales['Style'] == style]
-            
-            # Check if we have enough history
-            days_of_history = (style_sales['Invoice Date'].max() - style_sales['Invoice Date'].min()).days
-            if days_of_history < self.min_history_days:
-                logger.warning(f"Skipping style {style}: only {days_of_history} days of history")
-                continue
-            
-            # Calculate demand statistics
-            demand_stats = self.calculate_demand_statistics(style)
-            
-            if demand_stats['average_demand'] > 0:
-                # Apply growth and seasonality
-                base_demand = demand_stats['average_demand'] * growth_factor
-                
-                # Apply seasonality if provided
-                current_month = datetime.now().month
-                if seasonality_factors and current_month in seasonality_factors:
-                    base_demand *= seasonality_factors[current_month]
-                
-                # Add safety stock if requested
-                total_demand = base_demand
-                if include_safety_stock:
-                    safety_stock = self.calculate_safety_stock(
-                        demand_stats['average_demand'],
-                        demand_stats['std_deviation'],
-                        demand_stats['lead_time_days']
-                    )
-                    total_demand += safety_stock
-                
-                # Create forecast object
-                forecast = FinishedGoodsForecast(
-                    sku_id=style,
-                    forecast_qty=int(np.ceil(total_demand)),
-                    forecast_date=self.forecast_end_date.date(),
-                    source='sales_history',
-                    confidence=demand_stats['confidence'],
-                    notes=f"Based on {days_of_history} days history, {self.aggregation_period} aggregation"
-                )
-                forecasts.append(forecast)
+        Returns:
+            List of FinishedGoodsForecast objects
+        """
+        if pl is None:
+            raise ImportError("generate_forecasts_polars requires the polars package")
         
-        return forecasts
+        # Integer period number per sale, consecutive across period boundaries
+        period = self.AGGREGATION_PERIODS.get(self.aggregation_period, 'W')
+        date = pl.col('Invoice Date')
+        days = date.dt.epoch('d')
+        period_number = {
+            'D': days,
+            'W': (days + 3) // 7,  # Weeks starting Monday; 1970-01-01 was a Thursday
+            'M': date.dt.year() * 12 + date.dt.month(),
+            'Q': date.dt.year() * 4 + (date.dt.month() - 1) // 3,
+        }[period]
+        
+        # Demand per (style, period), then per-style stats counting empty periods as zero demand
+        demand_stats = (
+            pl.from_pandas(self.sales_df[['Invoice Date', 'Style', 'Yds_ordered']])
+            .lazy()
+            .filter(date.is_between(self.start_date, self.end_date))
+            .with_columns(pl.col('Style').cast(pl.Utf8), period_number.alias('period'))
+            .group_by(['Style', 'period'], maintain_order=True)
+            .agg(
+                pl.col('Yds_ordered').sum(),
+                date.min().alias('first_date'),
+                date.max().alias('last_date')
+            )
+            .with_columns(
+                (pl.col('period').max() - pl.col('period').min() + 1).over('Style').alias('num_periods')
+            )
+            .with_columns(
+                (pl.col('Yds_ordered').sum().over('Style') / pl.col('num_periods')).alias('average_demand')
+            )
+            .group_by('Style', maintain_order=True)
+            .agg(
+                pl.col('first_date').min(),
+                pl.col('last_date').max(),
+                pl.col('num_periods').first(),
+                pl.col('average_demand').first(),
+                ((pl.col('Yds_ordered') - pl.col('average_demand')) ** 2).sum().alias('squared_deviation'),
+                pl.len().alias('sales_periods')
+            )
+            .with_columns(
+                pl.when(pl.col('num_periods') > 1)
+                .then((
+                    (pl.col('squared_deviation')
+                     + (pl.col('num_periods') - pl.col('sales_periods')) * pl.col('average_demand') ** 2)
+                    / (pl.col('num_periods') - 1)
+                ).sqrt())
+                .alias('std_deviation')
+            )
+            .collect()
+            .to_pandas()
+            .set_index('Style')
+        )
+        
+        style_stats = self._finish_demand_statistics(
+            demand_stats['first_date'], demand_stats['last_date'], demand_stats['average_demand'],
+            demand_stats['std_deviation'], demand_stats['num_periods']
+        )
+        return self.to_forecast_objects(self._forecast_frame_from_statistics(
+            style_stats, include_safety_stock, growth_factor, seasonality_factors
+        ))
+    
+    def _forecast_frame_from_statistics(self,
+                                        style_stats: pd.DataFrame,
+                                        include_safety_stock: bool,
+                                        growth_factor: float,
+                                        seasonality_factors: Optional[Dict[int, float]]) -> pd.DataFrame:
+        """Build the forecast frame from per-style demand statistics (see _demand_statistics_by_style)"""
+        days_of_history = (style_stats['last_date'] - style_stats['first_date']).dt.days.to_numpy()
+        
+        # Check if we have enough history
+        short_history = days_of_history < self.min_history_days
+        for style, days in zip(style_stats.index[short_history], days_of_history[short_history].tolist()):
+            logger.warning(f"Skipping style {style}: only {days} days of history")
+        
+        keep = ~short_history & (style_stats['average_demand'].to_numpy() > 0)
+        styles = style_stats.index[keep]
+        days_of_history = days_of_history[keep]
+        average_demand = style_stats['average_demand'].to_numpy(dtype=np.float64)[keep]
+        
+        # Apply growth and seasonality
+        total_demand = average_demand * growth_factor
+        if seasonality_factors and self._current_month in seasonality_factors:
+            total_demand *= seasonality_factors[self._current_month]
+        
+        # Add safety stock if requested
+        if include_safety_stock:
+            total_demand += self._safety_stock_array(
+                average_demand,
+                style_stats['std_deviation'].to_numpy(dtype=np.float64)[keep],
+                style_stats['lead_time_days'].to_numpy()[keep]
+            )
+        forecast_qty = np.ceil(total_demand).astype(np.int64)
+        
+        return pd.DataFrame({
+            'sku_id': styles.to_numpy(dtype=object),
+            'forecast_qty': forecast_qty,
+            'forecast_date': self.forecast_end_date.date(),
+            'source': 'sales_history',
+            'confidence': style_stats['confidence'].to_numpy(dtype=np.float64)[keep],
+            'notes': [f"Based on {days} days history, {self.aggregation_period} aggregation"
+                      for days in days_of_history.tolist()]
+        })
+    
+    def _safety_stock_array(self,
+                            average_demand: np.ndarray,
+                            std_deviation: np.ndarray,
+                            lead_time_days: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_safety_stock over per-style arrays"""
+        if self.safety_stock_method == 'percentage':
+            return average_demand * 0.2
+        elif self.safety_stock_method == 'statistical':
+            safety_stock = self._z_score * std_deviation * np.sqrt(lead_time_days / self._days_per_period)
+            return np.fmax(safety_stock, 0)  # fmax also maps NaN std to 0, like max(0, nan)
+        elif self.safety_stock_method == 'min_max':
+            return average_demand
+        elif self.safety_stock_method == 'dynamic':
+            cv = np.where(average_demand > 0, std_deviation / average_demand, 0)
+            return average_demand * (1 + np.nan_to_num(cv)) * 0.1  # NaN std (single period) counts as no variability
+        else:
+            return np.zeros_like(average_demand)
+    
+    def _demand_statistics_by_style(self, sales: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate demand statistics for every style in sales
+        
+        Periods with no sales between a style's first and last sale count as
+        zero demand, as in calculate_demand_statistics.
+        
+        Returns:
+            DataFrame indexed by style (in order of first appearance) with first_date,
+            last_date, average_demand, std_deviation, cv, confidence, lead_time_days
+            and num_periods
+        """
+        period = self.AGGREGATION_PERIODS.get(self.aggregation_period, 'W')
+        ordinals = pd.Series(sales['Invoice Date'].dt.to_period(period).array.asi8, index=sales.index)
+        style_key = sales['Style']
+        
+        # Per-style date span and number of periods it covers
+        spans = pd.DataFrame({
+            'first_date': sales['Invoice Date'],
+            'last_date': sales['Invoice Date'],
+            'first_period': ordinals,
+            'last_period': ordinals
+        }).groupby(style_key, observed=True).agg({
+            'first_date': 'min', 'last_date': 'max', 'first_period': 'min', 'last_period': 'max'
+        })
+        num_periods = spans['last_period'] - spans['first_period'] + 1
+        
+        # Demand per (style, period) for the periods that had sales
+        period_demand = sales['Yds_ordered'].groupby([style_key, ordinals], observed=True).sum()
+        period_styles = period_demand.index.get_level_values(0)
+        
+        average_demand = period_demand.groupby(level=0, observed=True).sum() / num_periods
+        
+        # Sample std over all periods; periods without sales deviate by the full mean
+        deviations = period_demand.to_numpy() - average_demand.reindex(period_styles).to_numpy()
+        squared_deviation = pd.Series(deviations ** 2, index=period_styles).groupby(level=0, observed=True).sum()
+        empty_periods = num_periods - period_demand.groupby(level=0, observed=True).size()
+        squared_deviation += empty_periods * average_demand ** 2
+        std_deviation = np.sqrt(squared_deviation / (num_periods - 1).where(num_periods > 1))
+        
+        stats_df = self._finish_demand_statistics(
+            spans['first_date'], spans['last_date'], average_demand, std_deviation, num_periods
+        )
+        return stats_df.reindex(style_key.unique())
+    
+    @staticmethod
+    def _finish_demand_statistics(first_date: pd.Series,
+                                  last_date: pd.Series,
+                                  average_demand: pd.Series,
+                                  std_deviation: pd.Series,
+                                  num_periods: pd.Series) -> pd.DataFrame:
+        """Add cv, confidence and lead time to per-style demand statistics"""
+        cv = (std_deviation / average_demand).where(average_demand > 0, 0)
+        
+        # Calculate confidence based on CV and number of periods
+        confidence = [min(0.95, value) for value in ((1 - cv) * (num_periods / 52)).tolist()]
+        
+        return pd.DataFrame({
+            'first_date': first_date,
+            'last_date': last_date,
+            'average_demand': average_demand,
+            'std_deviation': std_deviation,
+            'cv': cv,
+            'confidence': confidence,
+            'lead_time_days': 14,  # Default 2 weeks
+            'num_periods': num_periods
+        })
     
     def calculate_demand_statistics(self, style_id: str) -> Dict[str, float]:
         """
@@ -158,35 +494,31 @@ class SalesForecastGenerator:
         Returns:
             Dictionary with average_demand, std_deviation, cv, confidence, lead_time_days
         """
-        # Filter sales for the style
-        style_sales = self.sales_df[
-            (self.sales_df['Style'] == style_id) &
-            (self.sales_df['Invoice Date'] >= self.start_date) &
-            (self.sales_df['Invoice Date'] <= self.end_date)
-        ].copy()
+        # Sales for the style from the cached lookback-window groups
+        style_sales = self._get_style_sales(style_id)
+        
+        if style_sales.empty:
+            raise ValueError(f"No sales for style {style_id} in the lookback period")
         
-        # Aggregate by selected period
+        # Aggregate by selected period, as consecutive integer period numbers
         period = self.AGGREGATION_PERIODS.get(self.aggregation_period, 'W')
-        style_sales['period'] = style_sales['Invoice Date'].dt.to_period(period)
+        ordinals = style_sales['Invoice Date'].dt.to_period(period).array.asi8
+        order = np.argsort(ordinals, kind='stable')
+        ordinals = ordinals[order]
+        quantities = style_sales['Yds_ordered'].to_numpy(dtype=np.float64)[order]
         
-        # Group by period and sum quantities
-        period_demand = style_sales.groupby('period')['Yds_ordered'].sum()
+        # Sum quantities over each run of equal periods
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ordinals)) + 1))
+        sums = np.add.reduceat(quantities, starts)
         
         # Fill missing periods with zero
-        all_periods = pd.period_range(
-            start=style_sales['Invoice Date'].min(),
-            end=style_sales['Invoice Date'].max(),
-            freq=period
-        )
-        period_demand = period_demand.reindex(all_periods, fill_value=0)
+        period_demand = np.zeros(ordinals[-1] - ordinals[0] + 1)
+        period_demand[ordinals[starts] - ordinals[0]] = sums
         
         # Calculate statistics
-        average_demand = period_demand.mean()
-        std_deviation = period_demand.std()
-        cv = std_deviation / average_demand if average_demand > 0 else 0
+        average_demand, std_deviation, cv, num_periods = _period_stats(period_demand)
         
         # Calculate confidence based on CV and number of periods
-        num_periods = len(period_demand)
         confidence = min(0.95, (1 - cv) * (num_periods / 52))  # Adjust based on variability and data points
         
         # Estimate lead time (simplified - could be enhanced with actual supplier data)
@@ -222,19 +554,11 @@ class SalesForecastGenerator:
             
         elif self.safety_stock_method == 'statistical':
             # Statistical safety stock calculation
-            # Z-score for service level
-            z_score = stats.norm.ppf(self.service_level)
-            
             # Convert lead time to periods
-            if self.aggregation_period == 'weekly':
-                lead_time_periods = lead_time_days / 7
-            elif self.aggregation_period == 'monthly':
-                lead_time_periods = lead_time_days / 30
-            else:
-                lead_time_periods = lead_time_days
+            lead_time_periods = lead_time_days / self._days_per_period
             
             # Safety stock = Z * σ * √(Lead Time)
-            safety_stock = z_score * std_deviation * np.sqrt(lead_time_periods)
+            safety_stock = self._z_score * std_deviation * math.sqrt(lead_time_periods)
             
             return max(0, safety_stock)
             
@@ -263,11 +587,28 @@ class SalesForecastGenerator:
         Returns:
             Dictionary of monthly seasonality factors {month: factor}
         """
+        key = (style_id, min_periods)
+        if key not in self._seasonality_cache:
+            self._seasonality_cache[key] = self._compute_seasonality(style_id, min_periods)
+        return dict(self._seasonality_cache[key])
+
+    def _compute_seasonality(self, style_id: Optional[str], min_periods: int) -> Dict[int, float]:
+        """Seasonality factors for detect_seasonality_patterns, without caching"""
         # Filter sales data
-        sales_data = self.sales_df.copy()
+        sales_data = self.sales_df
+        num_months = None
         if style_id:
             sales_data = sales_data[sales_data['Style'] == style_id]
+            num_months = int(self._get_month_counts().get(style_id, 0))
+        return self._seasonality_from_sales(sales_data.copy(), min_periods, num_months)
 
+    @classmethod
+    def _seasonality_from_sales(cls, sales_data: pd.DataFrame, min_periods: int,
+                                num_months: Optional[int] = None) -> Dict[int, float]:
+        """
+        Seasonality factors from an already filtered copy of the sales data
+        num_months, when known, is the number of distinct months with sales
+        """
         # Ensure we have enough data
         if len(sales_data) < min_periods * 30:  # Approximate days needed
             logger.warning(f"Insufficient data for seasonality detection: {len(sales_data)} records")
@@ -275,43 +616,30 @@ class SalesForecastGenerator:
 
         # Aggregate by month
         sales_data['month'] = sales_data['Invoice Date'].dt.month
+
+        # Need at least 2 years of data for reliable seasonality
+        if num_months is not None and num_months < 24:
+            logger.info("Using simple monthly averaging for seasonality (less than 2 years of data)")
+            # Simple approach: average by month
+            return cls._monthly_average_factors(sales_data)
+
         sales_data['year'] = sales_data['Invoice Date'].dt.year
         sales_data['year_month'] = sales_data['Invoice Date'].dt.to_period('M')
 
         # Calculate monthly totals
         monthly_sales = sales_data.groupby(['year_month'])['Yds_ordered'].sum()
 
-        # Need at least 2 years of data for reliable seasonality
         if len(monthly_sales) < 24:
             logger.info("Using simple monthly averaging for seasonality (less than 2 years of data)")
-            # Simple approach: average by month
-            monthly_avg = sales_data.groupby('month')['Yds_ordered'].mean()
-            overall_avg = monthly_avg.mean()
-
-            # Calculate factors
-            seasonality_factors = {}
-            for month in range(1, 13):
-                if month in monthly_avg.index:
-                    factor = monthly_avg[month] / overall_avg if overall_avg > 0 else 1.0
-                    seasonality_factors[month] = round(factor, 3)
-                else:
-                    seasonality_factors[month] = 1.0
-
-            return seasonality_factors
+            return cls._monthly_average_factors(sales_data)
 
         # Advanced approach: decomposition for longer time series
         try:
-            from statsmodels.tsa.seasonal import seasonal_decompose
-
-            # Ensure continuous time series
-            monthly_sales = monthly_sales.asfreq('M', fill_value=0)
-
-            # Perform decomposition
-            decomposition = seasonal_decompose(monthly_sales, model='multiplicative', period=12)
-            seasonal_component = decomposition.seasonal
+            # Multiplicative decomposition in NumPy, one factor per position in the yearly cycle
+            seasonal_component = _multiplicative_seasonal(monthly_sales.to_numpy(dtype=np.float64), period=12)
 
             # Extract monthly factors
-            monthly_factors = seasonal_component.groupby(seasonal_component.index.month).mean()
+            monthly_factors = pd.Series(seasonal_component).groupby(monthly_sales.index.month).mean()
 
             # Normalize factors (ensure average = 1.0)
             avg_factor = monthly_factors.mean()
@@ -323,25 +651,31 @@ class SalesForecastGenerator:
         except Exception as e:
             logger.warning(f"Advanced seasonality detection failed: {e}. Using simple approach.")
             # Fallback to simple approach
-            monthly_avg = sales_data.groupby('month')['Yds_ordered'].mean()
-            overall_avg = monthly_avg.mean()
-
-            seasonality_factors = {}
-            for month in range(1, 13):
-                if month in monthly_avg.index:
-                    factor = monthly_avg[month] / overall_avg if overall_avg > 0 else 1.0
-                    seasonality_factors[month] = round(factor, 3)
-                else:
-                    seasonality_factors[month] = 1.0
+            seasonality_factors = cls._monthly_average_factors(sales_data)
 
         # Validate factors (should be reasonable)
-        for month, factor in seasonality_factors.items():
-            if factor < 0.5 or factor > 2.0:
-                logger.warning(f"Extreme seasonality factor detected for month {month}: {factor}")
-                # Cap extreme values
-                seasonality_factors[month] = max(0.5, min(2.0, factor))
+        months = np.fromiter(seasonality_factors.keys(), dtype=np.int64, count=len(seasonality_factors))
+        factors = np.fromiter(seasonality_factors.values(), dtype=np.float64, count=len(seasonality_factors))
+        extreme = (factors < 0.5) | (factors > 2.0)
+        for month, factor in zip(months[extreme].tolist(), factors[extreme].tolist()):
+            logger.warning(f"Extreme seasonality factor detected for month {month}: {factor}")
+
+        # Cap extreme values
+        return dict(zip(months.tolist(), np.clip(factors, 0.5, 2.0).tolist()))
+
+    @staticmethod
+    def _monthly_average_factors(sales_data: pd.DataFrame) -> Dict[int, float]:
+        """Seasonality factors from average sales per calendar month; months without sales get 1.0"""
+        monthly_avg = sales_data.groupby('month')['Yds_ordered'].mean()
+        overall_avg = monthly_avg.mean()
+
+        if overall_avg > 0:
+            factors = (monthly_avg / overall_avg).round(3)
+        else:
+            factors = pd.Series(1.0, index=monthly_avg.index)
 
-        return seasonality_factors
+        factors = factors.reindex(range(1, 13), fill_value=1.0)
+        return dict(zip(factors.index.tolist(), factors.tolist()))
 
     def calculate_weekly_average_demand(self, style_id: str,
                                       apply_seasonality: bool = True,
@@ -382,15 +716,11 @@ class SalesForecastGenerator:
             weekly_avg = demand_stats['average_demand']
 
         # Calculate min/max from historical data
-        style_sales = self.sales_df[
-            (self.sales_df['Style'] == style_id) &
-            (self.sales_df['Invoice Date'] >= self.start_date) &
-            (self.sales_df['Invoice Date'] <= self.end_date)
-        ].copy()
+        style_sales = self._get_style_sales(style_id)
 
         # Weekly aggregation
-        style_sales['week'] = style_sales['Invoice Date'].dt.to_period('W')
-        weekly_demand = style_sales.groupby('week')['Yds_ordered'].sum()
+        week_key = style_sales['Invoice Date'].dt.to_period('W')
+        weekly_demand = style_sales['Yds_ordered'].groupby(week_key).sum()
 
         weekly_min = weekly_demand.min() if len(weekly_demand) > 0 else 0
         weekly_max = weekly_demand.max() if len(weekly_demand) > 0 else weekly_avg * 2
@@ -403,21 +733,15 @@ class SalesForecastGenerator:
 
             if seasonality_factors:
                 # Calculate average factor for the projection period
-                from datetime import datetime, timedelta
-                projection_start = datetime.now()
+                projection_start = self._now
+                factor_by_month = np.array([seasonality_factors.get(month, 1.0) for month in range(1, 13)])
 
-                # Calculate weighted average of seasonal factors for the projection period
-                total_weight = 0
-                weighted_factor = 0
-
-                for week in range(weeks_ahead):
-                    week_date = projection_start + timedelta(weeks=week)
-                    month = week_date.month
-                    factor = seasonality_factors.get(month, 1.0)
-                    weighted_factor += factor
-                    total_weight += 1
-
-                avg_seasonal_factor = weighted_factor / total_weight if total_weight > 0 else 1.0
+                # Average the factor of the month each projected week starts in
+                if weeks_ahead > 0:
+                    week_months = pd.date_range(projection_start, periods=weeks_ahead, freq='7D').month.to_numpy()
+                    avg_seasonal_factor = factor_by_month[week_months - 1].mean()
+                else:
+                    avg_seasonal_factor = 1.0
                 seasonally_adjusted = weekly_avg * avg_seasonal_factor
 
         return {
@@ -433,7 +757,8 @@ class SalesForecastGenerator:
     def generate_forecasts_with_auto_seasonality(self,
                                                include_safety_stock: bool = True,
                                                growth_factor: float = 1.0,
-                                               auto_detect_seasonality: bool = True) -> List[FinishedGoodsForecast]:
+                                               auto_detect_seasonality: bool = True,
+                                               n_jobs: int = 1) -> List[FinishedGoodsForecast]:
         """
         Generate forecasts with automatic seasonality detection
 
@@ -441,6 +766,8 @@ class SalesForecastGenerator:
             include_safety_stock: Whether to include safety stock
             growth_factor: Growth multiplier
             auto_detect_seasonality: Whether to automatically detect and apply seasonality
+            n_jobs: Worker processes for seasonality decomposition (-1 for all CPUs;
+                requires joblib, otherwise runs serially)
 
         Returns:
             List of FinishedGoodsForecast objects
@@ -448,69 +775,141 @@ class SalesForecastGenerator:
         forecasts = []
 
         # Filter sales data to lookback period
-        recent_sales = self.sales_df[
-            (self.sales_df['Invoice Date'] >= self.start_date) &
-            (self.sales_df['Invoice Date'] <= self.end_date)
-        ]
+        recent_sales = self._get_recent_sales()
 
-        # Get unique styles
-        styles = recent_sales['Style'].unique()
+        # Demand statistics for every style in one grouped pass
+        style_stats = self._demand_statistics_by_style(recent_sales)
 
-        for style in styles:
-            style_sales = recent_sales[recent_sales['Style'] == style]
+        # Check if we have enough history
+        days_of_history = (style_stats['last_date'] - style_stats['first_date']).dt.days
+        for style, days in days_of_history[days_of_history < self.min_history_days].items():
+            logger.warning(f"Skipping style {style}: only {days} days of history")
+        style_stats = style_stats[days_of_history >= self.min_history_days]
 
-            # Check if we have enough history
-            days_of_history = (style_sales['Invoice Date'].max() - style_sales['Invoice Date'].min()).days
-            if days_of_history < self.min_history_days:
-                logger.warning(f"Skipping style {style}: only {days_of_history} days of history")
-                continue
+        # Weekly demand, as in calculate_weekly_average_demand
+        if self.aggregation_period == 'daily':
+            weekly_demand = style_stats['average_demand'] * 7
+        elif self.aggregation_period == 'monthly':
+            weekly_demand = style_stats['average_demand'] / 4.33  # Average weeks per month
+        else:
+            weekly_demand = style_stats['average_demand']
+        weekly_avg = weekly_demand.round(2)
 
-            # Get weekly demand with seasonality
-            weekly_stats = self.calculate_weekly_average_demand(
-                style,
-                apply_seasonality=auto_detect_seasonality,
-                weeks_ahead=self.planning_horizon_days // 7
+        # Use seasonally adjusted demand if available
+        base_weekly_demand = weekly_avg
+        if auto_detect_seasonality:
+            seasonal_factor = self._projected_seasonality_factors(
+                style_stats.index, weeks_ahead=self.planning_horizon_days // 7, n_jobs=n_jobs
             )
+            seasonally_adjusted = (weekly_demand * seasonal_factor).round(2)
+            base_weekly_demand = seasonally_adjusted.where(seasonally_adjusted > 0, weekly_avg)
+
+        # Apply growth factor and project over the planning horizon
+        base_weekly_demand = base_weekly_demand * growth_factor
+        weeks_in_horizon = self.planning_horizon_days / 7
+        total_demand = base_weekly_demand * weeks_in_horizon
+
+        seasonality_note = "with seasonality adjustment" if auto_detect_seasonality else "without seasonality"
+
+        for style, avg, base, total, cv, confidence, days in zip(
+                style_stats.index, weekly_avg.tolist(), base_weekly_demand.tolist(), total_demand.tolist(),
+                style_stats['cv'].tolist(), style_stats['confidence'].tolist(),
+                days_of_history.reindex(style_stats.index).tolist()):
+            if avg <= 0:
+                continue
 
-            if weekly_stats['weekly_avg'] > 0:
-                # Calculate total demand for planning horizon
-                weeks_in_horizon = self.planning_horizon_days / 7
-
-                # Use seasonally adjusted demand if available
-                base_weekly_demand = (weekly_stats['seasonally_adjusted']
-                                    if auto_detect_seasonality and weekly_stats['seasonally_adjusted'] > 0
-                                    else weekly_stats['weekly_avg'])
-
-                # Apply growth factor
-                base_weekly_demand *= growth_factor
-
-                # Total demand for the planning period
-                total_demand = base_weekly_demand * weeks_in_horizon
-
-                # Add safety stock if requested
-                if include_safety_stock:
-                    # Use weekly statistics for safety stock calculation
-                    weekly_std = weekly_stats['weekly_avg'] * weekly_stats['cv'] if weekly_stats['cv'] else 0
-                    safety_stock = self.calculate_safety_stock(
-                        base_weekly_demand,
-                        weekly_std,
-                        14  # Default 2-week lead time
-                    )
-                    total_demand += safety_stock
-
-                # Create forecast object
-                seasonality_note = "with seasonality adjustment" if auto_detect_seasonality else "without seasonality"
-                forecast = FinishedGoodsForecast(
-                    sku_id=style,
-                    forecast_qty=int(np.ceil(total_demand)),
-                    forecast_date=self.forecast_end_date.date(),
-                    source='sales_history',
-                    confidence=weekly_stats['confidence'],
-                    notes=f"Based on {days_of_history} days history, weekly avg: {weekly_stats['weekly_avg']:.1f} yards, {seasonality_note}"
+            # Add safety stock if requested
+            if include_safety_stock:
+                # Use weekly statistics for safety stock calculation
+                weekly_std = avg * cv if cv else 0
+                total += self.calculate_safety_stock(
+                    base,
+                    weekly_std,
+                    14  # Default 2-week lead time
                 )
-                forecasts.append(forecast)
+
+            # Create forecast object
+            forecast = FinishedGoodsForecast(
+                sku_id=style,
+                forecast_qty=int(np.ceil(total)),
+                forecast_date=self.forecast_end_date.date(),
+                source='sales_history',
+                confidence=confidence,
+                notes=f"Based on {days} days history, weekly avg: {avg:.1f} yards, {seasonality_note}"
+            )
+            forecasts.append(forecast)
 
         return forecasts
+
+    def _projected_seasonality_factors(self, styles: pd.Index, weeks_ahead: int,
+                                       min_periods: int = 12, n_jobs: int = 1) -> pd.Series:
+        """
+        Average seasonality factor over the next weeks_ahead weeks for each style
+
+        Uses the same factors as detect_seasonality_patterns: none (1.0) with too few
+        records, monthly averages with under 24 months of sales, decomposition otherwise.
+        Monthly averages for all styles come from one grouped pass; only styles with
+        enough history for decomposition are analysed one at a time, in n_jobs
+        worker processes when n_jobs is not 1.
+        """
+        factors = pd.DataFrame(1.0, index=styles, columns=range(1, 13))
+        if weeks_ahead <= 0 or len(factors) == 0:
+            return pd.Series(1.0, index=styles)
+
+        sales_data = self.sales_df[self.sales_df['Style'].isin(styles)]
+        style_key = sales_data['Style']
+        month = sales_data['Invoice Date'].dt.month
+        record_counts = style_key.value_counts()
+        month_counts = self._get_month_counts()
+
+        eligible = record_counts[record_counts >= min_periods * 30].index
+        eligible_months = month_counts.reindex(eligible)
+        simple_styles = eligible_months[eligible_months < 24].index
+        decomposed_styles = eligible_months[eligible_months >= 24].index
+
+        # Simple approach: average by month relative to the average month
+        if len(simple_styles):
+            simple_sales = sales_data[style_key.isin(simple_styles)]
+            monthly_avg = simple_sales['Yds_ordered'].groupby(
+                [simple_sales['Style'], month[simple_sales.index]], observed=True
+            ).mean().unstack()
+            overall_avg = monthly_avg.mean(axis=1)
+            simple_factors = monthly_avg.div(overall_avg, axis=0).round(3)
+            simple_factors[overall_avg <= 0] = 1.0
+            simple_factors = simple_factors.reindex(columns=range(1, 13)).fillna(1.0)
+            factors.loc[simple_factors.index] = simple_factors.to_numpy()
+
+        for style, style_factors in self._decomposed_seasonality(
+                decomposed_styles, sales_data, min_periods, n_jobs).items():
+            for factor_month, factor in style_factors.items():
+                factors.loc[style, factor_month] = factor
+
+        # Average the factor of the month each projected week starts in
+        week_months = pd.date_range(self._now, periods=weeks_ahead, freq='7D').month.to_numpy()
+        return pd.Series(factors.to_numpy()[:, week_months - 1].mean(axis=1), index=factors.index)
+
+    def _decomposed_seasonality(self, styles: pd.Index, sales_data: pd.DataFrame,
+                                min_periods: int, n_jobs: int) -> Dict[str, Dict[int, float]]:
+        """
+        detect_seasonality_patterns for each style, split into one chunk of styles per worker
+
+        Workers receive only their chunk's sales and run its styles sequentially, so
+        the per-task overhead is paid once per chunk rather than once per style.
+        Runs serially when n_jobs is 1, joblib is unavailable or every style is cached.
+        """
+        pending = [style for style in styles if (style, min_periods) not in self._seasonality_cache]
+        if n_jobs != 1 and Parallel is not None and len(pending) > 1:
+            n_chunks = min(len(pending), cpu_count() if n_jobs < 0 else n_jobs)
+            chunks = [chunk.tolist() for chunk in np.array_split(np.array(pending, dtype=object), n_chunks)]
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_seasonality_for_styles)(sales_data[sales_data['Style'].isin(chunk)], chunk, min_periods)
+                for chunk in chunks
+            )
+            for chunk_factors in results:
+                for style, style_factors in chunk_factors.items():
+                    self._seasonality_cache[(style, min_periods)] = style_factors
+
+        return {style: self.detect_seasonality_patterns(style, min_periods) for style in styles}
     
     def aggregate_demand_by_period(self, 
                                  period: str = 'weekly',
@@ -535,7 +934,7 @@ class SalesForecastGenerator:
         sales_data['period'] = sales_data['Invoice Date'].dt.to_period(freq)
         
         # Aggregate
-        aggregated = sales_data.groupby(['period', 'Style']).agg({
+        aggregated = sales_data.groupby(['period', 'Style'], observed=True).agg({
             'Yds_ordered': ['sum', 'mean', 'std', 'count'],
             'Line Price': 'sum'
         }).round(2)
@@ -543,20 +942,24 @@ class SalesForecastGenerator:
         # Flatten column names
         aggregated.columns = ['_'.join(col).strip() for col in aggregated.columns]
         aggregated = aggregated.reset_index()
+        aggregated['Style'] = aggregated['Style'].astype(object)
         
         # Add period start and end dates
-        aggregated['period_start'] = aggregated['period'].apply(lambda x: x.start_time)
-        aggregated['period_end'] = aggregated['period'].apply(lambda x: x.end_time)
+        period_index = pd.PeriodIndex(aggregated['period'])
+        aggregated['period_start'] = period_index.start_time
+        aggregated['period_end'] = period_index.end_time
         
         return aggregated
     
     def generate_yarn_forecasts(self, 
-                              style_forecasts: Optional[List[FinishedGoodsForecast]] = None) -> Dict[str, Dict]:
+                                style_forecasts: Optional[Union[List[FinishedGoodsForecast], pd.DataFrame]] = None
+                                ) -> Dict[str, Dict]:
         """
         Generate yarn-level forecasts from style forecasts using BOM
         
         Args:
-            style_forecasts: Optional list of style forecasts (if None, generates them)
+            style_forecasts: Optional list of style forecasts or frame from generate_forecast_frame
+                (if None, generates them)
             
         Returns:
             Dictionary of yarn requirements
@@ -566,13 +969,17 @@ class SalesForecastGenerator:
         
         # Generate style forecasts if not provided
         if style_forecasts is None:
-            style_forecasts = self.generate_forecasts()
+            style_forecasts = self.generate_forecast_frame()
         
         # Convert to dictionary format
-        style_forecast_dict = {
-            f.sku_id: f.forecast_qty 
-            for f in style_forecasts
-        }
+        if isinstance(style_forecasts, pd.DataFrame):
+            style_forecast_dict = dict(zip(style_forecasts['sku_id'].tolist(),
+                                           style_forecasts['forecast_qty'].tolist()))
+        else:
+            style_forecast_dict = {
+                f.sku_id: f.forecast_qty 
+                for f in style_forecasts
+            }
         
         # Explode to yarn requirements
         yarn_requirements = BOMExploder.explode_style_to_yarn_requirements(
@@ -618,39 +1025,67 @@ class SalesForecastGenerator:
         
         return accuracy_summary
     
-    def create_forecast_summary(self, forecasts: List[FinishedGoodsForecast]) -> pd.DataFrame:
+    def create_forecast_summary(self,
+                                forecasts: Union[List[FinishedGoodsForecast], pd.DataFrame]) -> pd.DataFrame:
         """
         Create a summary DataFrame from forecast objects
         
         Args:
-            forecasts: List of FinishedGoodsForecast objects
+            forecasts: List of FinishedGoodsForecast objects, or a frame from generate_forecast_frame
             
         Returns:
             Summary DataFrame
         """
-        data = []
-        for forecast in forecasts:
-            data.append({
-                'style_id': forecast.sku_id,
-                'forecast_qty': forecast.forecast_qty,
-                'forecast_date': forecast.forecast_date,
-                'source': forecast.source,
-                'confidence': forecast.confidence,
-                'notes': forecast.notes
-            })
+        if isinstance(forecasts, pd.DataFrame):
+            columns = [forecasts[column].tolist()
+                       for column in ('sku_id', 'forecast_qty', 'forecast_date', 'source', 'confidence', 'notes')]
+        else:
+            columns = [
+                [forecast.sku_id for forecast in forecasts],
+                [forecast.forecast_qty for forecast in forecasts],
+                [forecast.forecast_date for forecast in forecasts],
+                [forecast.source for forecast in forecasts],
+                [forecast.confidence for forecast in forecasts],
+                [forecast.notes for forecast in forecasts]
+            ]
+        style_ids, quantities, forecast_dates, sources, confidences, notes = columns
+        n = len(style_ids)
         
-        summary_df = pd.DataFrame(data)
+        # One row per forecast plus the total row, allocated once
+        style_id = np.empty(n + 1, dtype=object)
+        forecast_qty = np.empty(n + 1, dtype=np.int64)
+        forecast_date = np.empty(n + 1, dtype=object)
+        source = np.empty(n + 1, dtype=object)
+        confidence = np.empty(n + 1, dtype=np.float64)
+        note = np.empty(n + 1, dtype=object)
+        style_id[:n], forecast_qty[:n], forecast_date[:n] = style_ids, quantities, forecast_dates
+        source[:n], confidence[:n], note[:n] = sources, confidences, notes
         
         # Add total summary
-        total_row = pd.DataFrame([{
-            'style_id': 'TOTAL',
-            'forecast_qty': summary_df['forecast_qty'].sum(),
-            'forecast_date': summary_df['forecast_date'].iloc[0] if len(summary_df) > 0 else None,
-            'source': 'aggregated',
-            'confidence': summary_df['confidence'].mean() if len(summary_df) > 0 else 0,
-            'notes': f'Total of {len(summary_df)} styles'
-        }])
-        
-        summary_df = pd.concat([summary_df, total_row], ignore_index=True)
-        
-        return summary_df
\ No newline at end of file
+        style_id[n] = 'TOTAL'
+        forecast_qty[n] = forecast_qty[:n].sum()
+        forecast_date[n] = forecast_date[0] if n > 0 else None
+        source[n] = 'aggregated'
+        confidence[n] = confidence[:n].mean() if n > 0 else 0
+        note[n] = f'Total of {n} styles'
+        
+        summary_df = pd.DataFrame({
+            'style_id': style_id,
+            'forecast_qty': forecast_qty,
+            'forecast_date': forecast_date,
+            'source': source,
+            'confidence': confidence,
+            'notes': note
+        })
+        
+        return summary_df
+
+
+def _seasonality_for_styles(sales_data: pd.DataFrame, styles: List[str], min_periods: int) -> Dict[str, Dict[int, float]]:
+    """Worker for SalesForecastGenerator._decomposed_seasonality: factors for each style in a chunk"""
+    return {
+        style: SalesForecastGenerator._seasonality_from_sales(
+            sales_data[sales_data['Style'] == style].copy(), min_periods
+        )
+        for style in styles
+    }
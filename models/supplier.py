@@ -3,15 +3,121 @@ Supplier Data Model with EOQ Optimization and Multi-Supplier Sourcing
 """
 
 import math
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, NamedTuple, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from utils.logger import get_logger
 
-@dataclass
+# Optional JIT for the allocation loop; the plain Python loop is used without numba
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional process pool for MultiSupplierOptimizer.optimize_many
+try:
+    from joblib import Parallel, cpu_count, delayed
+except ImportError:
+    Parallel = None
+
+logger = get_logger(__name__)
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular dataclasses
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _allocate_loop(moq: np.ndarray, contract_limit: np.ndarray, eoq: np.ndarray,
+                   required_quantity: float) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Allocation quantities for suppliers in priority order
+    
+    contract_limit and eoq use 0 for "none". Returns (picked, quantities, count):
+    the first count entries give each allocated supplier's position and quantity.
+    """
+    k = moq.shape[0]
+    picked = np.empty(k, dtype=np.int64)
+    quantities = np.empty(k, dtype=np.float64)
+    count = 0
+    remaining = required_quantity
+    
+    for i in range(k):
+        if remaining <= 0:
+            break
+        
+        # Determine allocation quantity
+        if i == k - 1:
+            # Last supplier gets remaining quantity
+            allocation = remaining
+        else:
+            # Allocate based on supplier capacity and EOQ
+            max_allocation = remaining
+            if contract_limit[i] != 0 and contract_limit[i] < max_allocation:
+                max_allocation = contract_limit[i]
+            
+            if eoq[i] != 0 and eoq[i] > moq[i]:
+                # Use EOQ if it's above MOQ
+                allocation = min(max_allocation, eoq[i])
+            elif remaining >= moq[i]:
+                # Use MOQ or proportional allocation
+                allocation = max(moq[i], max_allocation * 0.4)
+            else:
+                allocation = remaining
+        
+        # Ensure MOQ is met, or skip this supplier if we can't meet it
+        if allocation < moq[i]:
+            if remaining >= moq[i]:
+                allocation = moq[i]
+            else:
+                continue
+        
+        # Ensure we don't exceed contract limits
+        if contract_limit[i] != 0:
+            allocation = min(allocation, contract_limit[i])
+        allocation = min(allocation, remaining)
+        
+        if allocation > 0:
+            picked[count] = i
+            quantities[count] = allocation
+            count += 1
+            remaining -= allocation
+    
+    return picked, quantities, count
+
+
+_allocate = njit(cache=True)(_allocate_loop) if njit is not None else _allocate_loop
+
+
+def _top_k_descending(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, highest first, ties in index order
+    (the order a stable descending sort would give), with a partial sort
+    """
+    n = scores.shape[0]
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        # Only scores at or above the k-th largest can be in the top k
+        kth_largest = np.partition(scores, n - k)[n - k]
+        candidates = np.flatnonzero(scores >= kth_largest)
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:k]
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Supplier:
-    """Represents supplier information for a material"""
+    """Represents supplier information for a material
+
+    Declared with ``frozen=True`` and, on Python 3.10+, ``slots=True`` so the many
+    instances built from supplier tables carry no per-object ``__dict__``. The constructor does not
+    validate; use ``create_validated`` for unchecked input.
+    """
     material_id: str
     supplier_id: str
     cost_per_unit: float
@@ -23,18 +129,173 @@ class Supplier:
     ordering_cost: float = 100.0  # Cost per order (setup, admin, etc.)
     holding_cost_rate: float = 0.2  # Annual holding cost as % of unit cost
     
-    def __post_init__(self):
-        """Validate supplier data"""
-        if self.cost_per_unit <= 0:
+    @classmethod
+    def create_validated(cls, *args: Any, **kwargs: Any) -> 'Supplier':
+        """Create a supplier, raising ValueError for invalid supplier data"""
+        supplier = cls(*args, **kwargs)
+        if supplier.cost_per_unit <= 0:
             raise ValueError("Cost per unit must be positive")
-        if self.lead_time_days < 0:
+        if supplier.lead_time_days < 0:
             raise ValueError("Lead time cannot be negative")
-        if self.reliability_score < 0 or self.reliability_score > 1:
+        if supplier.reliability_score < 0 or supplier.reliability_score > 1:
             raise ValueError("Reliability score must be between 0 and 1")
-        if self.ordering_cost < 0:
+        if supplier.ordering_cost < 0:
             raise ValueError("Ordering cost cannot be negative")
-        if self.holding_cost_rate < 0:
+        if supplier.holding_cost_rate < 0:
             raise ValueError("Holding cost rate cannot be negative")
+        return supplier
+
+
+_NO_ROWS = np.empty(0, dtype=np.int32)
+
+
+class SupplierTable:
+    """
+    Column-oriented set of suppliers
+    
+    Holds one NumPy array per Supplier field (contract_qty_limit is NaN when
+    unset) and only builds Supplier objects when indexed, iterated or filtered
+    by material. Rows are assumed valid; SupplierSelector.table_from_dataframe
+    validates them in bulk.
+    
+    With compact=True the numeric columns are stored as float32/int32, halving
+    their memory; Supplier objects built from such a table carry the float32
+    values (about 7 significant digits).
+    """
+    
+    def __init__(self,
+                 material_id: npt.ArrayLike,
+                 supplier_id: npt.ArrayLike,
+                 cost_per_unit: npt.ArrayLike,
+                 lead_time_days: npt.ArrayLike,
+                 moq: npt.ArrayLike,
+                 contract_qty_limit: npt.ArrayLike,
+                 reliability_score: npt.ArrayLike,
+                 ordering_cost: npt.ArrayLike,
+                 holding_cost_rate: npt.ArrayLike,
+                 compact: bool = False):
+        float_dtype, int_dtype = (np.float32, np.int32) if compact else (np.float64, np.int64)
+        self.compact = compact
+        self.material_id = np.asarray(material_id, dtype=object)
+        self.supplier_id = np.asarray(supplier_id, dtype=object)
+        self.cost_per_unit = np.asarray(cost_per_unit, dtype=float_dtype)
+        self.lead_time_days = np.asarray(lead_time_days, dtype=int_dtype)
+        self.moq = np.asarray(moq, dtype=int_dtype)
+        self.contract_qty_limit = np.asarray(contract_qty_limit, dtype=float_dtype)
+        self.reliability_score = np.asarray(reliability_score, dtype=float_dtype)
+        self.ordering_cost = np.asarray(ordering_cost, dtype=float_dtype)
+        self.holding_cost_rate = np.asarray(holding_cost_rate, dtype=float_dtype)
+        # Row indices per material, built on first lookup
+        self._by_material: Optional[Dict[str, np.ndarray]] = None
+    
+    @classmethod
+    def from_suppliers(cls, suppliers: List[Supplier]) -> 'SupplierTable':
+        """Build a table from Supplier objects, for callers that select from the same list repeatedly"""
+        return cls(
+            material_id=[s.material_id for s in suppliers],
+            supplier_id=[s.supplier_id for s in suppliers],
+            cost_per_unit=[s.cost_per_unit for s in suppliers],
+            lead_time_days=[s.lead_time_days for s in suppliers],
+            moq=[s.moq for s in suppliers],
+            contract_qty_limit=[np.nan if s.contract_qty_limit is None else s.contract_qty_limit
+                                for s in suppliers],
+            reliability_score=[s.reliability_score for s in suppliers],
+            ordering_cost=[s.ordering_cost for s in suppliers],
+            holding_cost_rate=[s.holding_cost_rate for s in suppliers]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.material_id)
+    
+    def __getitem__(self, i: int) -> Supplier:
+        return next(self._suppliers([i]))
+    
+    def __iter__(self) -> Iterator[Supplier]:
+        return self._suppliers(slice(None))
+    
+    def to_list(self) -> List[Supplier]:
+        """All suppliers as Supplier objects"""
+        return list(self)
+    
+    def for_material(self, material_id: str) -> List[Supplier]:
+        """Supplier objects for one material, in table order"""
+        return list(self._suppliers(self.material_rows(material_id)))
+    
+    def material_rows(self, material_id: str) -> np.ndarray:
+        """Row indices of one material's suppliers, from an index built once per table"""
+        if self._by_material is None:
+            codes, materials = pd.factorize(self.material_id)
+            rows = np.argsort(codes, kind='stable').astype(np.int32)
+            bounds = np.cumsum(np.bincount(codes, minlength=len(materials)))[:-1]
+            self._by_material = dict(zip(materials.tolist(), np.split(rows, bounds)))
+        return self._by_material.get(material_id, _NO_ROWS)
+    
+    def take(self, rows: np.ndarray) -> 'SupplierTable':
+        """New table with only the given rows"""
+        return SupplierTable(
+            material_id=self.material_id[rows],
+            supplier_id=self.supplier_id[rows],
+            cost_per_unit=self.cost_per_unit[rows],
+            lead_time_days=self.lead_time_days[rows],
+            moq=self.moq[rows],
+            contract_qty_limit=self.contract_qty_limit[rows],
+            reliability_score=self.reliability_score[rows],
+            ordering_cost=self.ordering_cost[rows],
+            holding_cost_rate=self.holding_cost_rate[rows],
+            compact=self.compact
+        )
+    
+    def _suppliers(self, rows: Union[np.ndarray, List[int], slice]) -> Iterator[Supplier]:
+        """Build Supplier objects for the selected rows"""
+        contract_limits = self.contract_qty_limit[rows]
+        columns = zip(
+            self.material_id[rows].tolist(), self.supplier_id[rows].tolist(),
+            self.cost_per_unit[rows].tolist(), self.lead_time_days[rows].tolist(), self.moq[rows].tolist(),
+            [None if np.isnan(limit) else int(limit) for limit in contract_limits.tolist()],
+            self.reliability_score[rows].tolist(), self.ordering_cost[rows].tolist(),
+            self.holding_cost_rate[rows].tolist()
+        )
+        for (material_id, supplier_id, cost_per_unit, lead_time_days, moq, contract_qty_limit,
+             reliability_score, ordering_cost, holding_cost_rate) in columns:
+            yield Supplier(
+                material_id=material_id,
+                supplier_id=supplier_id,
+                cost_per_unit=cost_per_unit,
+                lead_time_days=lead_time_days,
+                moq=moq,
+                contract_qty_limit=contract_qty_limit,
+                reliability_score=reliability_score,
+                ordering_cost=ordering_cost,
+                holding_cost_rate=holding_cost_rate
+            )
+
+
+def _suppliers_for_material(suppliers: Union[List[Supplier], SupplierTable], material_id: str) -> List[Supplier]:
+    """Suppliers of one material from a SupplierTable or a list of Supplier objects"""
+    if isinstance(suppliers, SupplierTable):
+        return suppliers.for_material(material_id)
+    return [s for s in suppliers if s.material_id == material_id]
+
+
+def _suppliers_for_materials(suppliers: Union[List[Supplier], SupplierTable],
+                             materials: List[Tuple[str, float]]) -> Union[List[Supplier], SupplierTable]:
+    """The suppliers of the given (material_id, quantity) pairs, in the same container type"""
+    material_ids = {material_id for material_id, _ in materials}
+    if isinstance(suppliers, SupplierTable):
+        rows = np.concatenate([suppliers.material_rows(m) for m in material_ids] or [_NO_ROWS])
+        return suppliers.take(np.sort(rows))
+    return [s for s in suppliers if s.material_id in material_ids]
+
+
+def _optimize_materials(materials: List[Tuple[str, float]],
+                        suppliers: Union[List[Supplier], SupplierTable],
+                        kwargs: Dict[str, Any]) -> Dict[str, List['SupplierAllocation']]:
+    """Worker for MultiSupplierOptimizer.optimize_many: optimize each material in turn"""
+    optimizer = MultiSupplierOptimizer()
+    return {
+        material_id: optimizer.optimize_multi_supplier_sourcing(material_id, required_quantity, suppliers, **kwargs)
+        for material_id, required_quantity in materials
+    }
 
 
 class EOQCalculator:
@@ -64,6 +325,64 @@ class EOQCalculator:
         eoq = math.sqrt((2 * annual_demand * ordering_cost) / holding_cost_per_unit)
         return eoq
     
+    @staticmethod
+    @lru_cache(maxsize=100_000)
+    def calculate_eoq_cached(annual_demand: float,
+                             ordering_cost: float,
+                             unit_cost: float,
+                             holding_cost_rate: float) -> float:
+        """
+        calculate_eoq memoized on its arguments, for planning loops that ask for
+        the same supplier and demand repeatedly. Keys are the exact values, so
+        results never go stale; clear_eoq_cache only frees memory.
+        """
+        return EOQCalculator.calculate_eoq(annual_demand, ordering_cost, unit_cost, holding_cost_rate)
+    
+    @staticmethod
+    def clear_eoq_cache() -> None:
+        """Drop memoized EOQ results, e.g. after loading a new supplier set"""
+        EOQCalculator.calculate_eoq_cached.cache_clear()
+    
+    @staticmethod
+    def calculate_eoq_batch(annual_demand: Union[np.ndarray, float],
+                            ordering_cost: Union[np.ndarray, float],
+                            unit_cost: Union[np.ndarray, float],
+                            holding_cost_rate: Union[np.ndarray, float]) -> np.ndarray:
+        """
+        Calculate Economic Order Quantity for many suppliers at once
+        
+        Takes arrays (or scalars, broadcast against the arrays) of the calculate_eoq
+        arguments. Entries with any non-positive input get 0, as in calculate_eoq.
+        The calculation stays in float32 when every array argument is float32
+        (e.g. columns of a compact SupplierTable), otherwise it uses float64.
+        
+        Returns:
+            Array of optimal order quantities
+        """
+        values = [np.asarray(value) for value in (annual_demand, ordering_cost, unit_cost, holding_cost_rate)]
+        arrays = [value for value in values if value.ndim]
+        dtype = np.float32 if arrays and all(value.dtype == np.float32 for value in arrays) else np.float64
+        annual_demand, ordering_cost, unit_cost, holding_cost_rate = np.broadcast_arrays(
+            *(value.astype(dtype, copy=False) for value in values)
+        )
+        valid = (annual_demand > 0) & (ordering_cost > 0) & (unit_cost > 0) & (holding_cost_rate > 0)
+        
+        eoq = np.zeros(valid.shape, dtype=dtype)
+        holding_cost_per_unit = unit_cost[valid] * holding_cost_rate[valid]
+        eoq[valid] = np.sqrt((2 * annual_demand[valid] * ordering_cost[valid]) / holding_cost_per_unit)
+        return eoq
+    
+    @classmethod
+    def calculate_supplier_eoqs(cls, annual_demand: float, suppliers: List[Supplier]) -> np.ndarray:
+        """EOQ for each supplier at the given annual demand"""
+        n = len(suppliers)
+        return cls.calculate_eoq_batch(
+            annual_demand,
+            np.fromiter((s.ordering_cost for s in suppliers), dtype=np.float64, count=n),
+            np.fromiter((s.cost_per_unit for s in suppliers), dtype=np.float64, count=n),
+            np.fromiter((s.holding_cost_rate for s in suppliers), dtype=np.float64, count=n)
+        )
+    
     @staticmethod
     def calculate_total_cost(annual_demand: float,
                            order_quantity: float,
@@ -116,10 +435,44 @@ class MultiSupplierOptimizer:
     def __init__(self):
         self.eoq_calculator = EOQCalculator()
     
+    def optimize_many(self,
+                      materials: List[Tuple[str, float]],
+                      suppliers: Union[List[Supplier], SupplierTable],
+                      n_jobs: int = 1,
+                      **kwargs: Any) -> Dict[str, List[SupplierAllocation]]:
+        """
+        Optimize sourcing for many materials independently
+        
+        Args:
+            materials: (material_id, required_quantity) pairs
+            suppliers: List of available suppliers, or a SupplierTable
+            n_jobs: Worker processes (-1 for all CPUs; requires joblib, otherwise runs serially)
+            **kwargs: Further optimize_multi_supplier_sourcing arguments
+            
+        Returns:
+            {material_id: list of supplier allocations}
+        """
+        if n_jobs == 1 or Parallel is None or len(materials) < 2:
+            return _optimize_materials(materials, suppliers, kwargs)
+        
+        # One task per chunk of materials, each sent only its materials' suppliers
+        n_chunks = min(len(materials), cpu_count() if n_jobs < 0 else n_jobs)
+        chunks = [[materials[i] for i in chunk.tolist()]
+                  for chunk in np.array_split(np.arange(len(materials)), n_chunks)]
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_optimize_materials)(chunk, _suppliers_for_materials(suppliers, chunk), kwargs)
+            for chunk in chunks
+        )
+        
+        allocations = {}
+        for chunk_allocations in results:
+            allocations.update(chunk_allocations)
+        return allocations
+    
     def optimize_multi_supplier_sourcing(self,
                                        material_id: str,
                                        required_quantity: float,
-                                       suppliers: List[Supplier],
+                                       suppliers: Union[List[Supplier], SupplierTable],
                                        annual_demand: float = None,
                                        max_suppliers: int = 3,
                                        max_lead_time: int = None,
@@ -131,7 +484,7 @@ class MultiSupplierOptimizer:
         Args:
             material_id: Material identifier
             required_quantity: Total quantity needed
-            suppliers: List of available suppliers
+            suppliers: List of available suppliers, or a SupplierTable
             annual_demand: Annual demand for EOQ calculation
             max_suppliers: Maximum number of suppliers to use
             max_lead_time: Maximum acceptable lead time
@@ -142,7 +495,7 @@ class MultiSupplierOptimizer:
             List of supplier allocations
         """
         # Filter suppliers for this material
-        material_suppliers = [s for s in suppliers if s.material_id == material_id]
+        material_suppliers = _suppliers_for_material(suppliers, material_id)
         
         if not material_suppliers:
             return []
@@ -154,95 +507,47 @@ class MultiSupplierOptimizer:
         if not material_suppliers:
             return []
         
-        # Calculate supplier scores
-        scored_suppliers = []
-        for supplier in material_suppliers:
-            # Calculate EOQ if annual demand is provided
-            eoq = None
-            if annual_demand:
-                eoq = self.eoq_calculator.calculate_eoq(
-                    annual_demand, 
-                    supplier.ordering_cost,
-                    supplier.cost_per_unit,
-                    supplier.holding_cost_rate
-                )
-            
-            # Calculate composite score
-            cost_score = 1 / supplier.cost_per_unit if supplier.cost_per_unit > 0 else 0
-            reliability_score = supplier.reliability_score
-            composite_score = (cost_weight * cost_score) + (reliability_weight * reliability_score)
-            
-            scored_suppliers.append({
-                'supplier': supplier,
-                'score': composite_score,
-                'eoq': eoq
-            })
+        # Calculate composite scores for all suppliers at once
+        n = len(material_suppliers)
+        costs = np.fromiter((s.cost_per_unit for s in material_suppliers), dtype=np.float64, count=n)
+        reliability = np.fromiter((s.reliability_score for s in material_suppliers), dtype=np.float64, count=n)
+        cost_score = np.where(costs > 0, 1 / np.where(costs > 0, costs, 1), 0)
+        scores = (cost_weight * cost_score) + (reliability_weight * reliability)
         
-        # Sort by score (descending)
-        scored_suppliers.sort(key=lambda x: x['score'], reverse=True)
+        # Highest scores first, ties in input order, keeping only the suppliers we may use
+        top = _top_k_descending(scores, len(range(n)[:max_suppliers]))
+        candidates = [material_suppliers[i] for i in top.tolist()]
         
-        # Allocate quantities
-        allocations = []
-        remaining_quantity = required_quantity
+        # Calculate EOQ for the candidates in one call if annual demand is provided
+        eoqs = [None] * len(candidates)
+        if annual_demand:
+            eoqs = self.eoq_calculator.calculate_supplier_eoqs(annual_demand, candidates).tolist()
         
-        for i, supplier_info in enumerate(scored_suppliers[:max_suppliers]):
-            if remaining_quantity <= 0:
-                break
-            
-            supplier = supplier_info['supplier']
-            eoq = supplier_info['eoq']
-            
-            # Determine allocation quantity
-            if i == len(scored_suppliers[:max_suppliers]) - 1:
-                # Last supplier gets remaining quantity
-                allocation_qty = remaining_quantity
-            else:
-                # Allocate based on supplier capacity and EOQ
-                max_allocation = min(
-                    remaining_quantity,
-                    supplier.contract_qty_limit or float('inf')
-                )
-                
-                if eoq and eoq > supplier.moq:
-                    # Use EOQ if it's above MOQ
-                    allocation_qty = min(max_allocation, eoq)
-                else:
-                    # Use MOQ or proportional allocation
-                    if remaining_quantity >= supplier.moq:
-                        allocation_qty = max(supplier.moq, max_allocation * 0.4)
-                    else:
-                        allocation_qty = remaining_quantity
-            
-            # Ensure MOQ is met
-            if allocation_qty < supplier.moq and remaining_quantity >= supplier.moq:
-                allocation_qty = supplier.moq
-            elif allocation_qty < supplier.moq:
-                # Skip this supplier if we can't meet MOQ
-                continue
+        # Allocate quantities over the top suppliers' fields as arrays
+        k = len(candidates)
+        moq = np.fromiter((c.moq for c in candidates), dtype=np.float64, count=k)
+        contract_limit = np.fromiter((c.contract_qty_limit or 0 for c in candidates), dtype=np.float64, count=k)
+        eoq = np.fromiter((e or 0 for e in eoqs), dtype=np.float64, count=k)
+        picked, quantities, count = _allocate(moq, contract_limit, eoq, float(required_quantity))
+        
+        allocations = []
+        for i, allocation_qty in zip(picked[:count].tolist(), quantities[:count].tolist()):
+            supplier = candidates[i]
+            supplier_eoq = eoqs[i]
+            cost = allocation_qty * supplier.cost_per_unit
+            percentage = (allocation_qty / required_quantity) * 100
+            reasoning = self._generate_allocation_reasoning(
+                supplier, allocation_qty, supplier_eoq, i == 0
+            )
             
-            # Ensure we don't exceed contract limits
-            if supplier.contract_qty_limit:
-                allocation_qty = min(allocation_qty, supplier.contract_qty_limit)
-
-            allocation_qty = min(allocation_qty, remaining_quantity)
-
-            if allocation_qty > 0:
-                cost = allocation_qty * supplier.cost_per_unit
-                percentage = (allocation_qty / required_quantity) * 100
-                reasoning = self._generate_allocation_reasoning(
-                    supplier, allocation_qty, eoq, i == 0
-                )
-
-                allocations.append(SupplierAllocation(
-                    supplier=supplier,
-                    quantity=allocation_qty,
-                    cost=cost,
-                    reasoning=reasoning,
-                    eoq=eoq,
-                    percentage=percentage
-                ))
-
-                remaining_quantity -= allocation_qty
+            allocations.append(SupplierAllocation(
+                supplier=supplier,
+                quantity=allocation_qty,
+                cost=cost,
+                reasoning=reasoning,
+                eoq=supplier_eoq,
+                percentage=percentage
+            ))
         
         return allocations
     
@@ -287,8 +592,17 @@ class SupplierSelector:
     @classmethod
     def from_dataframe(cls, df: pd.DataFrame) -> List[Supplier]:
         """Create supplier objects from DataFrame - optimized version"""
-        suppliers = []
-
+        return cls.table_from_dataframe(df).to_list()
+    
+    @classmethod
+    def table_from_dataframe(cls, df: pd.DataFrame, compact: bool = False) -> SupplierTable:
+        """
+        Create a SupplierTable from DataFrame, validating all rows at once
+        
+        Rows that from_dataframe would reject are dropped with the same checks
+        as Supplier, without building a Supplier object per row. compact=True
+        stores the numeric columns as float32/int32 (see SupplierTable).
+        """
         required_columns = ['material_id', 'supplier_id', 'cost_per_unit',
                           'lead_time_days', 'moq']
 
@@ -296,57 +610,64 @@ class SupplierSelector:
             if col not in df.columns:
                 raise ValueError(f"Missing required column: {col}")
 
-        # Validate data types and handle missing values upfront
-        df = df.copy()
-        df['material_id'] = df['material_id'].astype(str)
-        df['supplier_id'] = df['supplier_id'].astype(str)
-        df['cost_per_unit'] = pd.to_numeric(df['cost_per_unit'], errors='coerce')
-        df['lead_time_days'] = pd.to_numeric(df['lead_time_days'], errors='coerce').fillna(0).astype(int)
-        df['moq'] = pd.to_numeric(df['moq'], errors='coerce').fillna(1).astype(int)
-
-        # Handle optional columns with defaults
-        if 'contract_qty_limit' in df.columns:
-            df['contract_qty_limit'] = pd.to_numeric(df['contract_qty_limit'], errors='coerce')
-        else:
-            df['contract_qty_limit'] = None
-
-        df['reliability_score'] = pd.to_numeric(df.get('reliability_score', 1.0), errors='coerce').fillna(1.0)
-        df['ordering_cost'] = pd.to_numeric(df.get('ordering_cost', 100.0), errors='coerce').fillna(100.0)
-        df['holding_cost_rate'] = pd.to_numeric(df.get('holding_cost_rate', 0.2), errors='coerce').fillna(0.2)
-
-        # Check for invalid data
-        invalid_rows = df[df['cost_per_unit'].isna() | (df['cost_per_unit'] <= 0)]
-        if not invalid_rows.empty:
-            logger.warning(f"Found {len(invalid_rows)} rows with invalid cost_per_unit values")
-            df = df[~df['cost_per_unit'].isna() & (df['cost_per_unit'] > 0)]
-
-        # Use vectorized operations to create supplier objects
-        supplier_data = df.to_dict('records')
-
-        for row in supplier_data:
-            try:
-                supplier = Supplier(
-                    material_id=row['material_id'],
-                    supplier_id=row['supplier_id'],
-                    cost_per_unit=float(row['cost_per_unit']),
-                    lead_time_days=int(row['lead_time_days']),
-                    moq=int(row['moq']),
-                    contract_qty_limit=int(row['contract_qty_limit']) if pd.notna(row['contract_qty_limit']) else None,
-                    reliability_score=float(row['reliability_score']),
-                    ordering_cost=float(row['ordering_cost']),
-                    holding_cost_rate=float(row['holding_cost_rate'])
-                )
-                suppliers.append(supplier)
-            except Exception as e:
-                logger.error(f"Error creating supplier from row: {e}")
-                continue
+        # Validate data types and handle missing values upfront, building only the
+        # columns used below rather than copying the whole input frame
+        df = pd.DataFrame({
+            'material_id': df['material_id'].astype(str),
+            'supplier_id': df['supplier_id'].astype(str),
+            'cost_per_unit': pd.to_numeric(df['cost_per_unit'], errors='coerce'),
+            'lead_time_days': pd.to_numeric(df['lead_time_days'], errors='coerce').fillna(0).astype(int),
+            'moq': pd.to_numeric(df['moq'], errors='coerce').fillna(1).astype(int),
+            # Handle optional columns with defaults
+            'contract_qty_limit': (pd.to_numeric(df['contract_qty_limit'], errors='coerce')
+                                   if 'contract_qty_limit' in df.columns else np.nan),
+            'reliability_score': pd.to_numeric(df.get('reliability_score', 1.0), errors='coerce').fillna(1.0),
+            'ordering_cost': pd.to_numeric(df.get('ordering_cost', 100.0), errors='coerce').fillna(100.0),
+            'holding_cost_rate': pd.to_numeric(df.get('holding_cost_rate', 0.2), errors='coerce').fillna(0.2),
+        })
+
+        # Check for invalid data with a single keep-mask (NaN compares False)
+        keep = df['cost_per_unit'] > 0
+        n_invalid = int((~keep).sum())
+        if n_invalid:
+            logger.warning(f"Found {n_invalid} rows with invalid cost_per_unit values")
+            df = df.loc[keep]
 
-        logger.info(f"Successfully created {len(suppliers)} suppliers from {len(df)} rows")
-        return suppliers
+        # The remaining Supplier checks, one mask per rule
+        contract_qty_limit = df['contract_qty_limit'].to_numpy(dtype=np.float64)
+        checks = [
+            (df['lead_time_days'] >= 0, "Lead time cannot be negative"),
+            (df['reliability_score'].between(0, 1), "Reliability score must be between 0 and 1"),
+            (df['ordering_cost'] >= 0, "Ordering cost cannot be negative"),
+            (df['holding_cost_rate'] >= 0, "Holding cost rate cannot be negative"),
+            (~np.isinf(contract_qty_limit), "Contract quantity limit must be finite"),
+        ]
+        valid = np.ones(len(df), dtype=bool)
+        for passed, message in checks:
+            failed = valid & ~np.asarray(passed)
+            if failed.any():
+                logger.error(f"Error creating supplier from {int(failed.sum())} rows: {message}")
+            valid &= ~failed
+
+        table = SupplierTable(
+            material_id=df['material_id'].to_numpy(dtype=object)[valid],
+            supplier_id=df['supplier_id'].to_numpy(dtype=object)[valid],
+            cost_per_unit=df['cost_per_unit'].to_numpy(dtype=np.float64)[valid],
+            lead_time_days=df['lead_time_days'].to_numpy()[valid],
+            moq=df['moq'].to_numpy()[valid],
+            contract_qty_limit=np.trunc(contract_qty_limit)[valid],
+            reliability_score=df['reliability_score'].to_numpy(dtype=np.float64)[valid],
+            ordering_cost=df['ordering_cost'].to_numpy(dtype=np.float64)[valid],
+            holding_cost_rate=df['holding_cost_rate'].to_numpy(dtype=np.float64)[valid],
+            compact=compact
+        )
+
+        logger.info(f"Successfully created {len(table)} suppliers from {len(df)} rows")
+        return table
     
     def select_optimal_supplier(self,
                               material_id: str,
-                              suppliers: List[Supplier],
+                              suppliers: Union[List[Supplier], SupplierTable],
                               required_quantity: float = None,
                               annual_demand: float = None,
                               max_lead_time: int = None,
@@ -356,7 +677,7 @@ class SupplierSelector:
         
         Args:
             material_id: Material identifier
-            suppliers: List of available suppliers
+            suppliers: List of available suppliers, or a SupplierTable
             required_quantity: Quantity needed for this order
             annual_demand: Annual demand for EOQ calculation
             max_lead_time: Maximum acceptable lead time
@@ -366,7 +687,7 @@ class SupplierSelector:
             Optimal supplier or None if no suitable supplier found
         """
         # Filter suppliers for this material
-        material_suppliers = [s for s in suppliers if s.material_id == material_id]
+        material_suppliers = _suppliers_for_material(suppliers, material_id)
         
         if not material_suppliers:
             return None
@@ -387,11 +708,16 @@ class SupplierSelector:
         if not material_suppliers:
             return None
         
+        # EOQ for every candidate in one call
+        eoqs: List[Optional[float]] = [None] * len(material_suppliers)
+        if use_eoq and annual_demand:
+            eoqs = self.eoq_calculator.calculate_supplier_eoqs(annual_demand, material_suppliers).tolist()
+        
         # Score suppliers
         best_supplier = None
         best_score = -1
         
-        for supplier in material_suppliers:
+        for supplier, eoq in zip(material_suppliers, eoqs):
             score = 0
             
             # Base score from cost and reliability
@@ -401,14 +727,7 @@ class SupplierSelector:
             
             # EOQ consideration
             if use_eoq and annual_demand:
-                eoq = self.eoq_calculator.calculate_eoq(
-                    annual_demand,
-                    supplier.ordering_cost,
-                    supplier.cost_per_unit,
-                    supplier.holding_cost_rate
-                )
-                
-                if required_quantity and eoq > 0:
+                if required_quantity and eoq is not None and eoq > 0:
                     # Bonus for being close to EOQ
                     eoq_ratio = min(required_quantity, eoq) / max(required_quantity, eoq)
                     eoq_bonus = eoq_ratio * 0.2  # Up to 20% bonus
@@ -456,7 +775,7 @@ class SupplierSelector:
         
         # Calculate EOQ if annual demand is available
         if annual_demand:
-            eoq = self.eoq_calculator.calculate_eoq(
+            eoq = self.eoq_calculator.calculate_eoq_cached(
                 annual_demand,
                 supplier.ordering_cost,
                 supplier.cost_per_unit,
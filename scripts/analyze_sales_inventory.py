@@ -1,30 +1,91 @@
 # import matplotlib.pyplot as plt
 # import seaborn as sns
+import re
 import warnings
+from typing import Any, Dict, Iterable
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 
 warnings.filterwarnings('ignore')
 
+_CURRENCY_RE = re.compile(r'[$,]')
+# Order prices look like "$5.95 (yds)"
+_ORDER_PRICE_RE = re.compile(r'\$([0-9.]+)')
+
+
+def parse_currency(s: pd.Series) -> pd.Series:
+    """Parse "$1,234.50"-style strings to floats, NaN where unparseable"""
+    return pd.to_numeric(s.str.replace(_CURRENCY_RE, '', regex=True), errors='coerce')
+
+
+SALES_CHUNKSIZE = 200_000
+_SALES_KEYS = ['Customer', 'Style', 'Invoice Date']
+
+
+def read_daily_sales(path: str, chunksize: int = SALES_CHUNKSIZE) -> pd.DataFrame:
+    """
+    Read the sales report in chunks, reducing each chunk to per customer, style
+    and invoice date totals so the raw rows are never held in memory at once
+
+    Columns: Line Price and Yds_ordered sums, Document (non-null count),
+    Unit Price sum with Price Count (for the mean) and Rows (line count)
+    """
+    parts = []
+    for chunk in pd.read_csv(
+            path, chunksize=chunksize,
+            usecols=['Document', 'Invoice Date', 'Customer', 'Style', 'Yds_ordered', 'Unit Price', 'Line Price'],
+            parse_dates=['Invoice Date']):
+        unit_price = parse_currency(chunk['Unit Price'])
+        columns: Dict[str, Any] = {
+            'Yds_ordered': pd.to_numeric(chunk['Yds_ordered'], errors='coerce'),
+            'Line Price': parse_currency(chunk['Line Price']),
+            'Document': chunk['Document'].notna().astype(np.int64),
+            'Unit Price': unit_price,
+            'Price Count': unit_price.notna().astype(np.int64),
+            'Rows': np.int64(1),
+        }
+        chunk = chunk.assign(**columns)
+        parts.append(chunk.groupby(_SALES_KEYS, dropna=False).sum())
+    return pd.concat(parts).groupby(level=_SALES_KEYS, dropna=False).sum()
+
+
+def sum_by_prefix(keys: pd.Series, values: pd.Series, prefixes: Iterable[str]) -> pd.Series:
+    """
+    Sum values over the rows whose key starts with each prefix, like
+    values[keys.str.startswith(prefix)].sum() per prefix but with one grouped
+    pass and a binary search per prefix instead of a scan per prefix
+    """
+    totals = values.groupby(keys).sum()
+    sorted_keys = totals.index.to_numpy(dtype=str)
+    cumulative = np.concatenate(([0], np.cumsum(totals.to_numpy())))
+    prefix_array = np.asarray(list(prefixes), dtype=str)
+    # Keys starting with a prefix sort between the prefix and the prefix followed by the highest code point
+    lo = np.searchsorted(sorted_keys, prefix_array, side='left')
+    hi = np.searchsorted(sorted_keys, np.char.add(prefix_array, chr(0x10FFFF)), side='left')
+    return pd.Series(cumulative[hi] - cumulative[lo], index=prefix_array)
+
+
 # Load the data files
 logger.info("Loading data files...")
-sales_df = pd.read_csv('data/Sales Activity Report.csv')
-inventory_df = pd.read_csv('data/Inventory.csv')
-orders_df = pd.read_csv('data/eFab_SO_List.csv')
+# Only the columns used below, parsed by the multithreaded pyarrow reader
+# Sales lines are only ever aggregated, so they are streamed into daily totals
+daily_sales = read_daily_sales('data/Sales Activity Report.csv')
+inventory_df = pd.read_csv('data/Inventory.csv', engine='pyarrow', usecols=['style_id', 'yds', 'lbs'])
+orders_df = pd.read_csv(
+    'data/eFab_SO_List.csv', engine='pyarrow',
+    usecols=['Status', 'Unit Price', 'Quoted Date', 'fBase', 'Ordered', 'Sold To'],
+    parse_dates=['Quoted Date']
+)
 
 # Clean and prepare the data
 logger.info("\nCleaning and preparing data...")
 
-# Sales data preparation
-sales_df['Invoice Date'] = pd.to_datetime(sales_df['Invoice Date'])
-sales_df['Yds_ordered'] = pd.to_numeric(sales_df['Yds_ordered'], errors='coerce')
-sales_df['Unit Price'] = sales_df['Unit Price'].str.replace('$', '').str.replace(',', '').astype(float)
-sales_df['Line Price'] = sales_df['Line Price'].str.replace('$', '').str.replace(',', '').astype(float)
-
 # Inventory data preparation - handle non-numeric values
 inventory_df['yds'] = pd.to_numeric(inventory_df['yds'].astype(str).str.replace(',', ''), errors='coerce')
 inventory_df['lbs'] = pd.to_numeric(inventory_df['lbs'].astype(str).str.replace(',', ''), errors='coerce')
@@ -33,9 +94,7 @@ inventory_df = inventory_df.dropna(subset=['yds'])
 
 # Orders data preparation
 orders_df['Ordered'] = pd.to_numeric(orders_df['Ordered'].astype(str).str.replace(',', ''), errors='coerce')
-# Extract price from format like "$5.95 (yds)"
-orders_df['Unit Price'] = orders_df['Unit Price'].astype(str).str.extract(r'\$([0-9.]+)')[0].astype(float)
-orders_df['Quoted Date'] = pd.to_datetime(orders_df['Quoted Date'])
+orders_df['Unit Price'] = orders_df['Unit Price'].astype(str).str.extract(_ORDER_PRICE_RE)[0].astype(float)
 
 # Analysis 1: Sales Summary
 logger.info("\n" + "="*60)
@@ -43,12 +102,12 @@ logger.info("SALES ACTIVITY ANALYSIS")
 logger.info("="*60)
 
 # Overall sales metrics
-total_sales_value = sales_df['Line Price'].sum()
-total_yards_sold = sales_df['Yds_ordered'].sum()
-avg_price_per_yard = sales_df['Unit Price'].mean()
-num_transactions = len(sales_df)
-num_unique_customers = sales_df['Customer'].nunique()
-num_unique_styles = sales_df['Style'].nunique()
+total_sales_value = daily_sales['Line Price'].to_numpy().sum()
+total_yards_sold = daily_sales['Yds_ordered'].sum()
+avg_price_per_yard = daily_sales['Unit Price'].sum() / daily_sales['Price Count'].sum()
+num_transactions = int(daily_sales['Rows'].sum())
+num_unique_customers = daily_sales.index.get_level_values('Customer').nunique()
+num_unique_styles = daily_sales.index.get_level_values('Style').nunique()
 
 logger.info(f"\nOverall Sales Metrics:")
 logger.info(f"- Total Sales Value: ${total_sales_value:,.2f}")
@@ -60,34 +119,34 @@ logger.info(f"- Unique Styles: {num_unique_styles}")
 
 # Top customers by sales value
 logger.info("\nTop 10 Customers by Sales Value:")
-customer_sales = sales_df.groupby('Customer').agg({
+customer_sales = daily_sales.groupby(level='Customer').agg({
     'Line Price': 'sum',
     'Yds_ordered': 'sum',
-    'Document': 'count'
+    'Document': 'sum'
 }).round(2)
 customer_sales.columns = ['Total Sales ($)', 'Total Yards', 'Order Count']
-customer_sales = customer_sales.sort_values('Total Sales ($)', ascending=False)
-logger.info(customer_sales.head(10))
+logger.info(customer_sales.nlargest(10, 'Total Sales ($)'))
 
 # Top selling styles
 logger.info("\nTop 10 Selling Styles by Volume:")
-style_sales = sales_df.groupby('Style').agg({
+style_sales = daily_sales.groupby(level='Style').agg({
     'Yds_ordered': 'sum',
     'Line Price': 'sum',
-    'Document': 'count'
+    'Document': 'sum'
 }).round(2)
 style_sales.columns = ['Total Yards', 'Total Sales ($)', 'Order Count']
-style_sales = style_sales.sort_values('Total Yards', ascending=False)
-logger.info(style_sales.head(10))
+logger.info(style_sales.nlargest(10, 'Total Yards'))
 
 # Sales trend analysis
 logger.info("\nMonthly Sales Trend:")
-sales_df['Month'] = sales_df['Invoice Date'].dt.to_period('M')
-monthly_sales = sales_df.groupby('Month').agg({
+# Month start as an int64-backed datetime key; formatted as YYYY-MM only for display
+sales_month = daily_sales.index.get_level_values('Invoice Date').to_numpy().astype('datetime64[M]')
+monthly_sales = daily_sales.groupby(pd.Index(sales_month, name='Month')).agg({
     'Line Price': 'sum',
     'Yds_ordered': 'sum'
 }).round(2)
 monthly_sales.columns = ['Sales ($)', 'Yards']
+monthly_sales.index = monthly_sales.index.strftime('%Y-%m').rename('Month')
 logger.info(monthly_sales)
 
 # Analysis 2: Inventory Analysis
@@ -116,7 +175,10 @@ logger.info("CURRENT ORDERS ANALYSIS")
 logger.info("="*60)
 
 # Orders summary
-total_orders_value = (orders_df['Ordered'] * orders_df['Unit Price']).sum()
+ordered = orders_df['Ordered'].to_numpy(dtype=np.float64)
+unit_price = orders_df['Unit Price'].to_numpy(dtype=np.float64)
+priced = ~(np.isnan(ordered) | np.isnan(unit_price))  # pandas sum skipped NaN products
+total_orders_value = float(np.dot(ordered[priced], unit_price[priced]))
 total_orders_yards = orders_df['Ordered'].sum()
 num_open_orders = len(orders_df[orders_df['Status'] == 'Open'])
 
@@ -127,16 +189,15 @@ logger.info(f"- Number of Open Orders: {num_open_orders}")
 
 # Top customers with pending orders
 logger.info("\nTop Customers by Pending Order Volume:")
-customer_orders = orders_df.groupby('Sold To').agg({
-    'Ordered': 'sum',
-    'Status': 'count'
-}).round(2)
-customer_orders.columns = ['Total Yards', 'Order Count']
-customer_orders['Estimated Value'] = orders_df.groupby('Sold To').apply(
-    lambda x: (x['Ordered'] * x['Unit Price']).sum()
+orders_df['Line Value'] = orders_df['Ordered'] * orders_df['Unit Price']
+customer_orders = orders_df.groupby('Sold To').agg(
+    **{
+        'Total Yards': ('Ordered', 'sum'),
+        'Order Count': ('Status', 'count'),
+        'Estimated Value': ('Line Value', 'sum')
+    }
 ).round(2)
-customer_orders = customer_orders.sort_values('Total Yards', ascending=False)
-logger.info(customer_orders.head(10))
+logger.info(customer_orders.nlargest(10, 'Total Yards'))
 
 # Analysis 4: Cross-Analysis - Matching Sales History with Current Inventory and Orders
 logger.info("\n" + "="*60)
@@ -144,9 +205,9 @@ logger.info("INTEGRATED ANALYSIS")
 logger.info("="*60)
 
 # Find styles that appear in both sales history and current orders
-sales_styles = set(sales_df['Style'].unique())
-order_styles = set(orders_df['fBase'].str.split('/').str[0].unique())
-inventory_styles = set(inventory_df['style_id'].str.split('/').str[0].unique())
+sales_styles = daily_sales.index.get_level_values('Style').unique()
+order_styles = pd.Index(orders_df['fBase'].str.split('/', n=1).str[0].unique())
+inventory_styles = pd.Index(inventory_df['style_id'].str.split('/', n=1).str[0].unique())
 
 common_sales_orders = sales_styles.intersection(order_styles)
 common_sales_inventory = sales_styles.intersection(inventory_styles)
@@ -164,23 +225,18 @@ logger.info("Style | Historical Sales (yds) | Current Inventory (yds) | Pending
 logger.info("-" * 80)
 
 # Get top selling styles
-top_selling_styles = sales_df.groupby('Style')['Yds_ordered'].sum().nlargest(20)
+top_selling_styles = daily_sales.groupby(level='Style')['Yds_ordered'].sum().nlargest(20)
 
 # Fill NaNs in 'fBase' to prevent errors
 orders_df['fBase'] = orders_df['fBase'].fillna('')
 
-for style in top_selling_styles.index:
-    historical_sales = top_selling_styles[style]
+# Inventory and pending orders for every top style at once (accounting for style variations)
+current_inventory = sum_by_prefix(inventory_df['style_id'], inventory_df['yds'], top_selling_styles.index)
+pending_orders = sum_by_prefix(orders_df['fBase'], orders_df['Ordered'], top_selling_styles.index)
 
-    # Check inventory (accounting for style variations)
-    inventory_match = inventory_df[inventory_df['style_id'].str.startswith(style)]
-    current_inventory = inventory_match['yds'].sum() if not inventory_match.empty else 0
-
-    # Check pending orders
-    orders_match = orders_df[orders_df['fBase'].str.startswith(style)]
-    pending_orders = orders_match['Ordered'].sum() if not orders_match.empty else 0
-
-    logger.info(f"{style:<15} | {historical_sales:>20,.0f} | {current_inventory:>22,.0f} | {pending_orders:>18,.0f}")
+for style, historical_sales, inventory_yds, pending_yds in zip(
+        top_selling_styles.index, top_selling_styles, current_inventory, pending_orders):
+    logger.info(f"{style:<15} | {historical_sales:>20,.0f} | {inventory_yds:>22,.0f} | {pending_yds:>18,.0f}")
 
 # Analysis 5: Recommendations
 logger.info("\n" + "="*60)
@@ -188,36 +244,34 @@ logger.info("RECOMMENDATIONS")
 logger.info("="*60)
 
 # Calculate average monthly demand for top styles
-recent_sales = sales_df[sales_df['Invoice Date'] >= sales_df['Invoice Date'].max() - timedelta(days=90)]
-avg_monthly_demand = recent_sales.groupby('Style')['Yds_ordered'].sum() / 3  # 3 months
+invoice_dates = daily_sales.index.get_level_values('Invoice Date')
+recent_sales = daily_sales[invoice_dates >= invoice_dates.max() - timedelta(days=90)]
+avg_monthly_demand = recent_sales.groupby(level='Style')['Yds_ordered'].sum() / 3  # 3 months
 
 logger.info("\nInventory Alerts (Styles with high demand but low inventory):")
 logger.info("Style | Avg Monthly Demand | Current Inventory | Coverage (months)")
 logger.info("-" * 70)
 
-alerts = []
-for style in avg_monthly_demand.nlargest(20).index:
-    monthly_demand = avg_monthly_demand[style]
-    
-    # Check inventory
-    inventory_match = inventory_df[inventory_df['style_id'].str.startswith(style)]
-    current_inventory = inventory_match['yds'].sum() if not inventory_match.empty else 0
-    
-    # Calculate coverage
-    coverage_months = current_inventory / monthly_demand if monthly_demand > 0 else float('inf')
-    
-    if coverage_months < 2:  # Less than 2 months coverage
-        alerts.append({
-            'style': style,
-            'monthly_demand': monthly_demand,
-            'inventory': current_inventory,
-            'coverage': coverage_months
-        })
-
-# Sort by coverage (lowest first)
-alerts.sort(key=lambda x: x['coverage'])
-for alert in alerts[:10]:  # Show top 10 alerts
-    logger.info(f"{alert['style']:<15} | {alert['monthly_demand']:>17,.0f} | {alert['inventory']:>16,.0f} | {alert['coverage']:>16.1f}")
+top_demand = avg_monthly_demand.nlargest(20)
+
+# Check inventory and calculate coverage for all top styles at once
+style_inventory = sum_by_prefix(inventory_df['style_id'], inventory_df['yds'], top_demand.index)
+coverage = pd.Series(
+    np.where(top_demand > 0, style_inventory.to_numpy() / top_demand.where(top_demand > 0, 1).to_numpy(), np.inf),
+    index=top_demand.index
+)
+
+# Less than 2 months coverage, sorted by coverage (lowest first)
+low_coverage = (coverage < 2).to_numpy()
+alerts_df = pd.DataFrame({
+    'style': top_demand.index[low_coverage],
+    'monthly_demand': top_demand.to_numpy()[low_coverage],
+    'inventory': style_inventory.to_numpy()[low_coverage],
+    'coverage': coverage.to_numpy()[low_coverage]
+}).sort_values('coverage', kind='stable', ignore_index=True)
+
+for alert in alerts_df.head(10).itertuples(index=False):  # Show top 10 alerts
+    logger.info(f"{alert.style:<15} | {alert.monthly_demand:>17,.0f} | {alert.inventory:>16,.0f} | {alert.coverage:>16.1f}")
 
 # Save detailed reports
 logger.info("\n" + "="*60)
@@ -254,7 +308,6 @@ with open('sales_inventory_summary.json', 'w') as f:
     json.dump(summary_report, f, indent=2)
 
 # Save detailed alerts to CSV
-alerts_df = pd.DataFrame(alerts)
 if not alerts_df.empty:
     alerts_df.to_csv('inventory_alerts.csv', index=False)
 
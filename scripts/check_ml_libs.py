@@ -1,37 +1,56 @@
 import sys
+from importlib.metadata import PackageNotFoundError, version as dist_version
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Versions come from installed package metadata, without importing the libraries;
+# pass --import to also import each one as a sanity check
+IMPORT_CHECK = '--import' in sys.argv[1:]
+
 logger.info(f"Python version: {sys.version}")
 
 # Check TensorFlow
 try:
-    import tensorflow as tf
-    try:
-        logger.info(f"TensorFlow IS installed: version {tf.__version__}")
-    except AttributeError:
-        logger.info("TensorFlow module found but version unavailable (possibly incompatible with Python 3.13)")
-except ImportError:
+    tf_version = dist_version('tensorflow')
+except PackageNotFoundError:
     logger.info("TensorFlow is NOT installed")
+else:
+    if IMPORT_CHECK:
+        try:
+            import tensorflow as tf
+            logger.info(f"TensorFlow IS installed: version {tf.__version__}")
+        except AttributeError:
+            logger.info("TensorFlow module found but version unavailable (possibly incompatible with Python 3.13)")
+        except ImportError:
+            logger.info(f"TensorFlow {tf_version} is installed but fails to import")
+    else:
+        logger.info(f"TensorFlow IS installed: version {tf_version}")
 
-# Check other ML libraries
+# Check other ML libraries: {module: (distribution, display name)}
 libraries = {
-    'sklearn': 'scikit-learn',
-    'xgboost': 'XGBoost',
-    'lightgbm': 'LightGBM',
-    'torch': 'PyTorch',
-    'statsmodels': 'statsmodels',
-    'prophet': 'Prophet'
+    'sklearn': ('scikit-learn', 'scikit-learn'),
+    'xgboost': ('xgboost', 'XGBoost'),
+    'lightgbm': ('lightgbm', 'LightGBM'),
+    'torch': ('torch', 'PyTorch'),
+    'statsmodels': ('statsmodels', 'statsmodels'),
+    'prophet': ('prophet', 'Prophet')
 }
 
 logger.info("\nML Library Status:")
-for module, name in libraries.items():
+for module, (dist, name) in libraries.items():
     try:
-        mod = __import__(module)
-        version = "installed"
+        version = f"version {dist_version(dist)}"
+    except PackageNotFoundError:
+        logger.info(f"✗ {name} is NOT installed")
+        continue
+
+    if IMPORT_CHECK:
+        try:
+            mod = __import__(module)
+        except ImportError:
+            logger.info(f"✗ {name} is installed ({version}) but fails to import")
+            continue
         if hasattr(mod, '__version__'):
             version = f"version {mod.__version__}"
-        logger.info(f"✓ {name} is installed ({version})")
-    except ImportError:
-        logger.info(f"✗ {name} is NOT installed")
\ No newline at end of file
+    logger.info(f"✓ {name} is installed ({version})")
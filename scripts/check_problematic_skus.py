@@ -3,30 +3,41 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Read the Style_BOM
-style_bom = pd.read_csv('data/Style_BOM.csv')
+# Read the Style_BOM: only the columns used, with fixed dtypes and no NA scan
+style_bom = pd.read_csv(
+    'data/Style_BOM.csv', engine='c', na_filter=False,
+    usecols=['Style_ID', 'Yarn_ID', 'BOM_Percentage'],
+    dtype={'Style_ID': 'category', 'Yarn_ID': 'category', 'BOM_Percentage': str}
+)
+# Blank or malformed percentages become NaN instead of aborting the check
+style_bom['BOM_Percentage'] = pd.to_numeric(style_bom['BOM_Percentage'], errors='coerce').astype('float32')
 
 # Check the problematic SKUs
-problematic_skus = ['205FLX2006/M', 'C1B4545A/1D', 'C1B4637A/1', 'CF5492/0', 
-                   'FF 10008/0005C', 'FF 10008/0009A', 'FF 10008/0010C', 
+problematic_skus = ['205FLX2006/M', 'C1B4545A/1D', 'C1B4637A/1', 'CF5492/0',
+                   'FF 10008/0005C', 'FF 10008/0009A', 'FF 10008/0010C',
                    'FF 10008/0011C', 'FF 10008/0014C', 'FF25002/0008A']
 
 logger.info("Investigating SKUs that don't sum to 1.0 in Style_BOM:")
 logger.info("=" * 60)
 
+# BOM rows of the problematic SKUs, their totals and listing lines, all computed at once
+subset = style_bom[style_bom['Style_ID'].isin(problematic_skus)]
+totals = subset.groupby('Style_ID', sort=False, observed=True)['BOM_Percentage'].sum()
+off_totals = totals.index[(totals - 1.0).abs() > 0.1]
+material_lines = ('  Material ' + subset['Yarn_ID'].astype(str) + ': '
+                  + subset['BOM_Percentage'].map('{:.3f}'.format))
+material_lines = material_lines.groupby(subset['Style_ID'], sort=False, observed=True)
+
 for sku in problematic_skus:
-    sku_data = style_bom[style_bom['Style_ID'] == sku]
-    if not sku_data.empty:
+    if sku in totals.index:
         logger.info(f"\nSKU: {sku}")
         logger.info(f"Materials and percentages:")
-        total = 0
-        for _, row in sku_data.iterrows():
-            logger.info(f"  Material {row['Yarn_ID']}: {row['BOM_Percentage']:.3f}")
-            total += row['BOM_Percentage']
-        logger.info(f"  TOTAL: {total:.6f}")
-        
+        for line in material_lines.get_group(sku):
+            logger.info(line)
+        logger.info(f"  TOTAL: {totals[sku]:.6f}")
+
         # Check if this might be a data entry error
-        if abs(total - 1.0) > 0.1:
+        if sku in off_totals:
             logger.info(f"  ⚠️  WARNING: Total is significantly off from 1.0!")
     else:
-        logger.info(f"\nSKU: {sku} - NOT FOUND in Style_BOM")
\ No newline at end of file
+        logger.info(f"\nSKU: {sku} - NOT FOUND in Style_BOM")
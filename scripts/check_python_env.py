@@ -6,6 +6,7 @@ This script helps with Python version compatibility and dependency installation.
 """
 
 import platform
+import shutil
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -72,13 +73,19 @@ def install_basic_dependencies():
         "seaborn>=0.12.0"
     ]
     
-    for dep in basic_deps:
-        logger.info(f"Installing {dep}...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
-            logger.info(f"✓ Successfully installed {dep}")
-        except subprocess.CalledProcessError:
-            logger.info(f"✗ Failed to install {dep}")
+    # One installer invocation, so the whole set is resolved together; uv when available
+    if shutil.which("uv"):
+        command = ["uv", "pip", "install", "--python", sys.executable, *basic_deps]
+    else:
+        command = [sys.executable, "-m", "pip", "install", "--no-input",
+                   "--disable-pip-version-check", *basic_deps]
+    
+    logger.info(f"Installing {', '.join(basic_deps)}...")
+    try:
+        subprocess.check_call(command)
+        logger.info(f"✓ Successfully installed {len(basic_deps)} packages")
+    except subprocess.CalledProcessError:
+        logger.info("✗ Failed to install basic dependencies")
 
 
 def create_alternative_venv_script():
@@ -12,12 +12,19 @@ This script performs various cleanup operations:
 """
 
 import ast
+import hashlib
+import io
+import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 # Add parent directory to path to import utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,6 +32,235 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Worker processes for the external formatters. black and isort run one after
+# the other (both rewrite the same files) but each uses all cores.
+_JOBS = str(os.cpu_count() or 1)
+
+# Per-file scan results from the previous run, in the project root
+SCAN_CACHE_FILE = '.cleanup_cache.json'
+_SCAN_CACHE_VERSION = 1
+
+# Directories never scanned
+EXCLUDE_DIRS = {
+    '__pycache__', '.git', '.venv', 'venv', 
+    'env', '.env', 'tensorflow', 'zen-mcp-server'
+}
+
+# Hardcoded secret assignments (case-insensitive); also passed to ripgrep
+SECRET_PATTERNS = (
+    r'password\s*=\s*["\'][^"\']+["\']',
+    r'api_key\s*=\s*["\'][^"\']+["\']',
+    r'secret\s*=\s*["\'][^"\']+["\']',
+    r'token\s*=\s*["\'][^"\']+["\']'
+)
+SECRET_RES = [re.compile(pattern, re.IGNORECASE) for pattern in SECRET_PATTERNS]
+
+# String-built SQL passed to execute()
+SQL_RES = [
+    re.compile(pattern) for pattern in (
+        r'execute\(["\'][^"\']*%[^"\']*["\'].*%',
+        r'execute\(.*\.format\(',
+        r'execute\(.*\+.*\)'
+    )
+]
+
+
+# Bytes-level prefilters, checked before a file is decoded: files already using
+# logging or without print( need no rewrite, and files without any secret
+# keyword or execute( cannot match the security patterns
+_LOGGING_NEEDLES = (b'import logging', b'from utils.logger import')
+_SECRET_PREFILTER = re.compile(rb'password|api_key|secret|token', re.IGNORECASE)
+
+_LOGGER_IMPORT = 'from utils.logger import get_logger\n\nlogger = get_logger(__name__)\n'
+_PRINT_RE = re.compile(r'\bprint\b')
+_IMPORT_LINE_RE = re.compile(r'^(import |from )', re.MULTILINE)
+_LEADING_COMMENTS_RE = re.compile(r'(#[^\n]*\n)*')
+_SKIPPED_TOKENS = {tokenize.NL, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT}
+
+
+def _print_call_positions(content: str) -> List[Tuple[int, int]]:
+    """
+    (row, col) of every print( call in the code, ignoring prints in strings
+    and comments, attribute calls like obj.print( and def print(
+    """
+    positions = []
+    previous = candidate = None
+    for tok in tokenize.generate_tokens(io.StringIO(content).readline):
+        if tok.type in _SKIPPED_TOKENS:
+            continue
+        if candidate is not None and tok.type == tokenize.OP and tok.string == '(':
+            positions.append(candidate)
+        candidate = None
+        if (tok.type == tokenize.NAME and tok.string == 'print'
+                and not (previous is not None and previous.string in ('.', 'def'))):
+            candidate = tok.start
+        previous = tok
+    return positions
+
+
+def _rewrite_prints(content: str) -> Tuple[str, int]:
+    """
+    Replace print calls with logger.info and add the logger import
+    
+    Returns:
+        The new content and the number of replacements (0, with the content
+        unchanged, when the file already uses logging, has no print calls or
+        cannot be tokenized)
+    """
+    # Skip if already has logging
+    if 'import logging' in content or 'from utils.logger import' in content:
+        return content, 0
+    
+    # Cheap substring gate before tokenizing
+    if 'print(' not in content:
+        return content, 0
+    
+    try:
+        positions = _print_call_positions(content)
+    except (tokenize.TokenError, SyntaxError):
+        return content, 0
+    if not positions:
+        return content, 0
+    
+    # One substitution over the whole content; only the matches the tokenizer
+    # found as calls are replaced (rows are counted on '\n' like tokenize does)
+    calls = set(positions)
+    row, line_start, last = 1, 0, 0
+    
+    def replace(match: re.Match[str]) -> str:
+        nonlocal row, line_start, last
+        start = match.start()
+        newlines = content.count('\n', last, start)
+        if newlines:
+            row += newlines
+            line_start = content.rindex('\n', last, start) + 1
+        last = start
+        return 'logger.info' if (row, start - line_start) in calls else match.group()
+    
+    new_content = _PRINT_RE.sub(replace, content)
+    
+    # Add the import after the first import line, or after any leading comment
+    # lines (shebang, encoding) when the file has no imports
+    first_import = _IMPORT_LINE_RE.search(new_content)
+    if first_import is not None:
+        end = new_content.find('\n', first_import.start())
+        if end < 0:
+            new_content += '\n'
+            end = len(new_content) - 1
+        splice_at = end + 1
+    else:
+        # The pattern can match empty, so it matches at the start of any content
+        leading_comments = _LEADING_COMMENTS_RE.match(new_content)
+        splice_at = leading_comments.end() if leading_comments is not None else 0
+    
+    return new_content[:splice_at] + _LOGGER_IMPORT + new_content[splice_at:], len(positions)
+
+
+def _needs_print_rewrite(raw: bytes) -> bool:
+    """Whether raw file bytes can contain prints for _rewrite_prints to replace"""
+    return b'print(' in raw and not any(needle in raw for needle in _LOGGING_NEEDLES)
+
+
+def _missing_return_types(content: Union[str, bytes]) -> List[str]:
+    """Names of the functions (other than __init__) without a return annotation"""
+    tree = ast.parse(content)
+    return [
+        node.name for node in ast.walk(tree)
+        if isinstance(node, ast.FunctionDef) and not node.returns and node.name != '__init__'
+    ]
+
+
+def _secret_issue(file_path: Path, match: str) -> Optional[str]:
+    """Issue text for a secret pattern match, None for obvious placeholders"""
+    if 'your_' in match or 'placeholder' in match:
+        return None
+    return f"Potential hardcoded secret in {file_path}: {match}"
+
+
+def _sql_issues(file_path: Path, content: str) -> List[str]:
+    """Potential SQL injection in one file's content"""
+    if 'execute(' not in content or '%s' in content:
+        return []
+    return [f"Potential SQL injection in {file_path}" for pattern in SQL_RES if pattern.search(content)]
+
+
+def _security_issues(file_path: Path, content: str) -> List[str]:
+    """Potential hardcoded secrets and SQL injection in one file's content"""
+    issues = [
+        issue for pattern in SECRET_RES for match in pattern.findall(content)
+        if (issue := _secret_issue(file_path, match)) is not None
+    ]
+    return issues + _sql_issues(file_path, content)
+
+
+def _raw_security_issues(file_path: Path, raw: bytes, scan_secrets: bool = True) -> List[str]:
+    """
+    Security issues in raw file bytes, decoding only files that pass the
+    bytes-level prefilter (SQL injection only when scan_secrets is False)
+    """
+    check_secrets = scan_secrets and _SECRET_PREFILTER.search(raw) is not None
+    if not check_secrets and (b'execute(' not in raw or b'%s' in raw):
+        return []
+    
+    content = raw.decode('utf-8', 'ignore')
+    return _security_issues(file_path, content) if check_secrets else _sql_issues(file_path, content)
+
+
+def _scan_one(file_path: Path, scan_secrets: bool = True) -> Tuple[Path, Dict]:
+    """
+    Run every per-file pass on one file, reading it once: print replacement,
+    missing return type detection and the security scan (SQL only when
+    scan_secrets is False)
+    
+    Top-level so it can run in worker processes. Nothing is written here;
+    'rewrite' holds the new content when the file needs writing back.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except OSError as e:
+        return file_path, {'error': str(e)}
+    
+    rewrite = None
+    replacements = 0
+    if _needs_print_rewrite(raw):
+        content, replacements = _rewrite_prints(raw.decode('utf-8', 'ignore'))
+        new_raw = content.encode('utf-8')
+        # Only write back what actually changed on disk
+        if replacements and new_raw != raw:
+            rewrite = content
+            raw = new_raw
+    
+    try:
+        missing_returns = _missing_return_types(raw)
+        parse_error = None
+    except SyntaxError as e:
+        missing_returns = []
+        parse_error = str(e)
+    
+    return file_path, {
+        'rewrite': rewrite,
+        'replacements': replacements,
+        'missing_returns': missing_returns,
+        'parse_error': parse_error,
+        'issues': _raw_security_issues(file_path, raw, scan_secrets)
+    }
+
+
+def _content_hash(raw: bytes) -> str:
+    """Short content hash used to recognise files unchanged since the last scan"""
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _report_security_issues(issues: List[str]) -> None:
+    """Log the security scan results"""
+    if issues:
+        logger.warning(f"Found {len(issues)} security issues:")
+        for issue in issues:
+            logger.warning(f"  - {issue}")
+    else:
+        logger.info("No security issues found")
+
 
 class CodeCleaner:
     """Main code cleanup class"""
@@ -37,27 +273,55 @@ class CodeCleaner:
             project_root: Root directory of the project
         """
         self.project_root = project_root
+        # {path: (mtime_ns, raw bytes)}, shared by the passes so unchanged files are read once
+        self._file_cache: Dict[Path, Tuple[int, bytes]] = {}
         self.python_files = self._find_python_files()
         
     def _find_python_files(self) -> List[Path]:
         """Find all Python files in the project"""
-        exclude_dirs = {
-            '__pycache__', '.git', '.venv', 'venv', 
-            'env', '.env', 'tensorflow', 'zen-mcp-server'
-        }
-        
+        # Depth-first like os.walk (a directory's files, then its subdirectories),
+        # using the type information scandir entries already carry
         python_files = []
-        for root, dirs, files in os.walk(self.project_root):
-            # Remove excluded directories from search
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    python_files.append(Path(root) / file)
+        pending = [self.project_root]
+        while pending:
+            directory = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Remove excluded directories from search
+                            if entry.name not in EXCLUDE_DIRS:
+                                subdirs.append(Path(entry.path))
+                        elif entry.name.endswith('.py') and entry.is_file():
+                            python_files.append(Path(entry.path))
+            except OSError:
+                continue
+            pending.extend(reversed(subdirs))
                     
         logger.info(f"Found {len(python_files)} Python files")
         return python_files
     
+    def _read_bytes(self, file_path: Path) -> bytes:
+        """Raw file content, from the cache unless the file changed on disk since it was read"""
+        mtime = file_path.stat().st_mtime_ns
+        cached = self._file_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        self._file_cache[file_path] = (mtime, raw)
+        return raw
+    
+    def _write(self, file_path: Path, content: str) -> bytes:
+        """Write a file, keep its cache entry current and return the written bytes"""
+        raw = content.encode('utf-8')
+        with open(file_path, 'wb') as f:
+            f.write(raw)
+        self._file_cache[file_path] = (file_path.stat().st_mtime_ns, raw)
+        return raw
+    
     def remove_unused_imports(self) -> None:
         """Remove unused imports from all Python files"""
         logger.info("Removing unused imports...")
@@ -79,7 +343,8 @@ class CodeCleaner:
         
         try:
             subprocess.run(
-                ["black", str(self.project_root), "--exclude", "tensorflow|zen-mcp-server"],
+                ["black", str(self.project_root), "--workers", _JOBS,
+                 "--exclude", "tensorflow|zen-mcp-server"],
                 check=True
             )
             logger.info("Successfully formatted code")
@@ -93,7 +358,7 @@ class CodeCleaner:
         
         try:
             subprocess.run(
-                ["isort", str(self.project_root), "--skip", "tensorflow", 
+                ["isort", str(self.project_root), "--jobs", _JOBS, "--skip", "tensorflow", 
                  "--skip", "zen-mcp-server"],
                 check=True
             )
@@ -102,6 +367,149 @@ class CodeCleaner:
             logger.warning(f"isort not available: {e}")
             logger.info("Install with: pip install isort")
     
+    def _rg_secret_issues(self) -> Optional[List[str]]:
+        """
+        Secret scan of every project file in a single ripgrep run
+        
+        Returns:
+            The issues in python_files order, or None when ripgrep is not
+            installed or fails (callers then scan with SECRET_RES)
+        """
+        rg = shutil.which('rg')
+        if rg is None:
+            return None
+        
+        command = [
+            rg, '--no-heading', '--line-number', '--only-matching', '--null', '--ignore-case',
+            '--no-ignore', '--hidden', '--no-messages',
+            '-g', '*.py', '-g', '!{' + ','.join(sorted(EXCLUDE_DIRS)) + '}'
+        ]
+        for pattern in SECRET_PATTERNS:
+            command += ['-e', pattern]
+        command.append(str(self.project_root))
+        
+        result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        # Exit status 1 means no matches
+        if result.returncode > 1:
+            return None
+        
+        # Lines are "<path>\0<line>:<match>"
+        matches: Dict[Path, List[str]] = {}
+        for line in result.stdout.splitlines():
+            path, _, rest = line.partition('\0')
+            matches.setdefault(Path(path), []).append(rest.partition(':')[2])
+        
+        return [
+            issue for file_path in self.python_files for match in matches.get(file_path, ())
+            if (issue := _secret_issue(file_path, match)) is not None
+        ]
+    
+    def _load_scan_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Per-file scan results from the last run, {} when missing or stale"""
+        try:
+            with open(self.project_root / SCAN_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != _SCAN_CACHE_VERSION:
+            return {}
+        files = cache.get('files')
+        return files if isinstance(files, dict) else {}
+    
+    def _save_scan_cache(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Persist per-file scan results for the next run"""
+        try:
+            with open(self.project_root / SCAN_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'version': _SCAN_CACHE_VERSION, 'files': files}, f)
+        except OSError as e:
+            logger.warning(f"Could not save scan cache: {e}")
+    
+    def scan_all(self, parallel: bool = True, use_cache: bool = True) -> None:
+        """
+        Replace prints, report missing type hints and check security in one pass over the files
+        
+        Args:
+            parallel: Scan the files in a process pool; rewrites are still
+                written from this process
+            use_cache: Reuse the results of files whose content hash matches
+                the last run (see SCAN_CACHE_FILE) instead of rescanning them
+        """
+        logger.info("Scanning Python files (print statements, type hints, security issues)...")
+        
+        # Secrets are found with one ripgrep run after the loop when rg is available
+        use_rg = shutil.which('rg') is not None
+        
+        cache = self._load_scan_cache() if use_cache else {}
+        digests: Dict[Path, str] = {}
+        results: Dict[Path, Dict[str, Any]] = {}
+        to_scan: List[Path] = []
+        for file_path in self.python_files:
+            try:
+                digests[file_path] = _content_hash(self._read_bytes(file_path))
+            except OSError as e:
+                results[file_path] = {'error': str(e)}
+                continue
+            entry = cache.get(str(file_path))
+            if (entry is not None and entry['hash'] == digests[file_path]
+                    and entry['scan_secrets'] == (not use_rg)):
+                results[file_path] = dict(entry['result'], rewrite=None, replacements=0)
+            else:
+                to_scan.append(file_path)
+        
+        scan = partial(_scan_one, scan_secrets=not use_rg)
+        workers = min(os.cpu_count() or 1, len(to_scan))
+        if parallel and workers > 1:
+            # Batches of files per task: enough tasks to balance load, few enough to amortize dispatch
+            chunksize = max(1, len(to_scan) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results.update(executor.map(scan, to_scan, chunksize=chunksize))
+        else:
+            results.update(scan(file_path) for file_path in to_scan)
+        
+        replacements = 0
+        issues: List[str] = []
+        new_cache: Dict[str, Dict[str, Any]] = {}
+        for file_path in self.python_files:
+            result = results[file_path]
+            if 'error' in result:
+                logger.error(f"Error processing {file_path}: {result['error']}")
+                continue
+            if result['rewrite'] is not None:
+                try:
+                    digests[file_path] = _content_hash(self._write(file_path, result['rewrite']))
+                except OSError as e:
+                    logger.error(f"Error processing {file_path}: {e}")
+                    continue
+            new_cache[str(file_path)] = {
+                'hash': digests[file_path],
+                'scan_secrets': not use_rg,
+                'result': {key: result[key] for key in ('missing_returns', 'parse_error', 'issues')}
+            }
+            
+            replacements += result['replacements']
+            for name in result['missing_returns']:
+                logger.debug(f"Function {name} in {file_path} missing return type")
+            if result['parse_error']:
+                logger.error(f"Error analyzing {file_path}: {result['parse_error']}")
+            issues.extend(result['issues'])
+        
+        if use_rg:
+            secret_issues = self._rg_secret_issues()
+            if secret_issues is None:
+                secret_issues = [
+                    issue for file_path in self.python_files
+                    if _SECRET_PREFILTER.search(raw := self._read_bytes(file_path))
+                    for pattern in SECRET_RES for match in pattern.findall(raw.decode('utf-8', 'ignore'))
+                    if (issue := _secret_issue(file_path, match)) is not None
+                ]
+            issues = secret_issues + issues
+        
+        if use_cache:
+            self._save_scan_cache(new_cache)
+        
+        logger.info(f"Replaced {replacements} print statements")
+        _report_security_issues(issues)
+    
     def replace_print_with_logging(self) -> None:
         """Replace print statements with proper logging"""
         logger.info("Replacing print statements with logging...")
@@ -109,41 +517,15 @@ class CodeCleaner:
         replacements = 0
         for file_path in self.python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Skip if already has logging
-                if 'import logging' in content or 'from utils.logger import' in content:
+                raw = self._read_bytes(file_path)
+                if not _needs_print_rewrite(raw):
                     continue
                 
-                # Find print statements
-                if 'print(' in content:
-                    # Add import at the top
-                    lines = content.split('\n')
-                    import_added = False
-                    new_lines = []
-                    
-                    for i, line in enumerate(lines):
-                        if not import_added and (line.startswith('import ') or 
-                                                line.startswith('from ')):
-                            new_lines.append(line)
-                            new_lines.append('from utils.logger import get_logger')
-                            new_lines.append('')
-                            new_lines.append('logger = get_logger(__name__)')
-                            import_added = True
-                        else:
-                            # Replace print statements
-                            if 'print(' in line:
-                                # Simple replacement - can be improved
-                                new_line = line.replace('print(', 'logger.info(')
-                                new_lines.append(new_line)
-                                replacements += 1
-                            else:
-                                new_lines.append(line)
-                    
-                    # Write back
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(new_lines))
+                new_content, file_replacements = _rewrite_prints(raw.decode('utf-8', 'ignore'))
+                # Write back only when the bytes on disk would change
+                if file_replacements and new_content.encode('utf-8') != raw:
+                    self._write(file_path, new_content)
+                    replacements += file_replacements
                         
             except Exception as e:
                 logger.error(f"Error processing {file_path}: {e}")
@@ -156,17 +538,8 @@ class CodeCleaner:
         
         for file_path in self.python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Parse AST
-                tree = ast.parse(content)
-                
-                # Find functions without type hints
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        if not node.returns and node.name != '__init__':
-                            logger.debug(f"Function {node.name} in {file_path} missing return type")
+                for name in _missing_return_types(self._read_bytes(file_path)):
+                    logger.debug(f"Function {name} in {file_path} missing return type")
                             
             except Exception as e:
                 logger.error(f"Error analyzing {file_path}: {e}")
@@ -175,49 +548,19 @@ class CodeCleaner:
         """Check for common security issues"""
         logger.info("Checking for security issues...")
         
-        issues = []
+        # Secrets via one ripgrep run when available, else per file with SECRET_RES
+        rg_issues = self._rg_secret_issues()
+        use_rg = rg_issues is not None
+        issues: List[str] = rg_issues if rg_issues is not None else []
         
         for file_path in self.python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Check for hardcoded secrets
-                secret_patterns = [
-                    r'password\s*=\s*["\'][^"\']+["\']',
-                    r'api_key\s*=\s*["\'][^"\']+["\']',
-                    r'secret\s*=\s*["\'][^"\']+["\']',
-                    r'token\s*=\s*["\'][^"\']+["\']'
-                ]
-                
-                for pattern in secret_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        for match in matches:
-                            if 'your_' not in match and 'placeholder' not in match:
-                                issues.append(f"Potential hardcoded secret in {file_path}: {match}")
-                
-                # Check for SQL injection vulnerabilities
-                if 'execute(' in content and '%s' not in content:
-                    sql_patterns = [
-                        r'execute\(["\'][^"\']*%[^"\']*["\'].*%',
-                        r'execute\(.*\.format\(',
-                        r'execute\(.*\+.*\)'
-                    ]
-                    
-                    for pattern in sql_patterns:
-                        if re.search(pattern, content):
-                            issues.append(f"Potential SQL injection in {file_path}")
+                issues.extend(_raw_security_issues(file_path, self._read_bytes(file_path), scan_secrets=not use_rg))
                             
             except Exception as e:
                 logger.error(f"Error checking {file_path}: {e}")
         
-        if issues:
-            logger.warning(f"Found {len(issues)} security issues:")
-            for issue in issues:
-                logger.warning(f"  - {issue}")
-        else:
-            logger.info("No security issues found")
+        _report_security_issues(issues)
     
     def run_all_cleanups(self) -> None:
         """Run all cleanup operations"""
@@ -226,9 +569,7 @@ class CodeCleaner:
         self.remove_unused_imports()
         self.sort_imports()
         self.format_code()
-        self.replace_print_with_logging()
-        self.add_type_hints()
-        self.check_security_issues()
+        self.scan_all()
         
         logger.info("Code cleanup completed!")
 
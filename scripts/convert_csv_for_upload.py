@@ -10,6 +10,37 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional Polars backend for convert_all_files_polars
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+# Translation tables for clean_currency: drop "$" and ",", and optionally turn "(12.50)" into "-12.50"
+_CURRENCY_TR = str.maketrans({'$': None, ',': None})
+_ACCOUNTING_TR = str.maketrans({'$': None, ',': None, '(': '-', ')': None})
+
+
+def clean_currency(values: pd.Series, parentheses_negative: bool = False) -> pd.Series:
+    """
+    Parse "$1,234.50"-style values column-wise; missing or unparseable values become 0.0
+    
+    With parentheses_negative, accounting negatives like "(12.50)" parse as -12.50.
+    """
+    table = _ACCOUNTING_TR if parentheses_negative else _CURRENCY_TR
+    cleaned = values.astype(str).str.translate(table).str.strip()
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0.0)
+
+
+def _clean_currency_expr(column: str, parentheses_negative: bool = False) -> "pl.Expr":
+    """Polars expression equivalent of clean_currency for one column"""
+    cleaned = pl.col(column).cast(pl.Utf8).str.replace_all(r'[$,]', '')
+    if parentheses_negative:
+        cleaned = cleaned.str.replace_all('(', '-', literal=True).str.replace_all(')', '', literal=True)
+    return cleaned.str.strip_chars().cast(pl.Float64, strict=False).fill_null(0.0)
+
+
 class BeverlyKnitsCSVConverter:
     """Converts Beverly Knits CSV files to expected upload format"""
     
@@ -22,20 +53,33 @@ class BeverlyKnitsCSVConverter:
         """Convert all CSV files to upload format"""
         print("🔄 Converting Beverly Knits CSV files to upload format...")
         
-        # Load raw data
+        # Load raw data with Arrow's multi-threaded CSV parser (numpy-backed dtypes,
+        # so material ids render as before), reading only the columns the conversions
+        # use with fixed dtypes; the currency columns stay strings for clean_currency
         try:
             print("Loading inventory: data/Yarn_ID_Current_Inventory.csv")
-            inventory = pd.read_csv(self.input_dir / "Yarn_ID_Current_Inventory.csv")
+            inventory = pd.read_csv(
+                self.input_dir / "Yarn_ID_Current_Inventory.csv", engine='pyarrow',
+                usecols=['Yarn_ID', 'Supplier', 'Inventory', 'On_Order', 'Cost_Pound'],
+                dtype={'Yarn_ID': 'float64', 'Supplier': str, 'Inventory': str, 'On_Order': str, 'Cost_Pound': str}
+            )
             print("Loading suppliers: data/Supplier_ID.csv")
-            suppliers = pd.read_csv(self.input_dir / "Supplier_ID.csv")
+            suppliers = pd.read_csv(
+                self.input_dir / "Supplier_ID.csv", engine='pyarrow',
+                usecols=['Supplier', 'Lead_time', 'MOQ', 'Type'], dtype=str
+            )
             print("Loading boms: data/Style_BOM.csv")
-            boms = pd.read_csv(self.input_dir / "Style_BOM.csv")
+            boms = pd.read_csv(
+                self.input_dir / "Style_BOM.csv", engine='pyarrow',
+                usecols=['Style_ID', 'Yarn_ID', 'BOM_Percentage'],
+                dtype={'Style_ID': 'string', 'Yarn_ID': 'string', 'BOM_Percentage': 'float32'}
+            )
         except FileNotFoundError as e:
             print(f"❌ Error loading raw data: {e}")
             return {}
         
         # Convert each file
-        forecasts_df = self.create_forecasts_file()
+        forecasts_df = self.create_forecasts_file(boms)
         boms_df = self.convert_boms_file(boms)
         inventory_df = self.convert_inventory_file(inventory)
         suppliers_df = self.convert_suppliers_file(inventory, suppliers)
@@ -60,8 +104,130 @@ class BeverlyKnitsCSVConverter:
             'suppliers': suppliers_df
         }
     
-    def create_forecasts_file(self):
-        """Create forecasts from available data"""
+    def convert_all_files_polars(self):
+        """
+        Convert all CSV files like convert_all_files, with the pipeline run in Polars
+        
+        The files are scanned lazily and every output is one query plan, so Polars
+        pushes the column projections into the CSV scans and runs all plans together
+        in a single collect_all. Results are returned as pandas DataFrames. Requires
+        the optional polars package.
+        """
+        if pl is None:
+            raise ImportError("convert_all_files_polars requires the polars package")
+        
+        print("🔄 Converting Beverly Knits CSV files to upload format (Polars)...")
+        
+        print("Loading inventory: data/Yarn_ID_Current_Inventory.csv")
+        print("Loading suppliers: data/Supplier_ID.csv")
+        print("Loading boms: data/Style_BOM.csv")
+        
+        # BOMs, plus the per-SKU percentage totals outside 0.98-1.02 and the first 20 styles for forecasts
+        boms = pl.scan_csv(self.input_dir / "Style_BOM.csv", infer_schema_length=None)
+        boms_lf = boms.select(
+            pl.col('Style_ID').alias('sku_id'),
+            pl.col('Yarn_ID').cast(pl.Utf8).alias('material_id'),
+            pl.col('BOM_Percentage').alias('qty_per_unit'),
+            pl.lit('lbs').alias('unit')
+        )
+        invalid_skus_lf = (
+            boms_lf.group_by('sku_id')
+            .agg(pl.col('qty_per_unit').sum())
+            .filter(~pl.col('qty_per_unit').is_between(0.98, 1.02))
+        )
+        styles_lf = boms.select(pl.col('Style_ID').unique(maintain_order=True).head(20))
+        
+        # Inventory: Yarn_ID is nullable, so render ids through Float64 as pandas does ('19020.0', 'nan')
+        inventory = pl.scan_csv(self.input_dir / "Yarn_ID_Current_Inventory.csv", infer_schema_length=None)
+        material_id = pl.col('Yarn_ID').cast(pl.Float64).cast(pl.Utf8).fill_null('nan').alias('material_id')
+        inventory_clean = inventory.select(
+            material_id,
+            _clean_currency_expr('Inventory', parentheses_negative=True).clip(lower_bound=0).alias('on_hand_qty'),
+            pl.lit('lbs').alias('unit'),
+            _clean_currency_expr('On_Order', parentheses_negative=True).clip(lower_bound=0).alias('open_po_qty'),
+            pl.lit((datetime.now() + timedelta(days=14)).strftime('%Y-%m-%d')).alias('po_expected_date')
+        )
+        fixed_count_lf = inventory_clean.select((pl.col('on_hand_qty') == 0).sum())
+        inventory_lf = inventory_clean.unique(subset='material_id', keep='first', maintain_order=True)
+        
+        # Suppliers: one lookup row per supplier name (last one wins), joined in inventory order;
+        # 'Remove' or unparseable lead times and MOQs fall back to the defaults
+        suppliers_lookup = (
+            pl.scan_csv(self.input_dir / "Supplier_ID.csv", infer_schema_length=None)
+            .filter(pl.col('Type').ne_missing('Remove') & pl.col('Supplier').is_not_null())
+            .select(
+                'Supplier',
+                pl.col('Lead_time').cast(pl.Utf8).cast(pl.Float64, strict=False)
+                .fill_null(14).cast(pl.Int64).alias('lead_time_days'),
+                pl.col('MOQ').cast(pl.Utf8).cast(pl.Float64, strict=False)
+                .fill_null(1000).cast(pl.Int64).alias('moq')
+            )
+            .unique(subset='Supplier', keep='last', maintain_order=True)
+        )
+        suppliers_lf = (
+            inventory.with_row_index('row')
+            .select(
+                'row',
+                material_id,
+                pl.col('Supplier').alias('supplier_id'),
+                _clean_currency_expr('Cost_Pound').alias('cost_per_unit')
+            )
+            .join(suppliers_lookup, left_on='supplier_id', right_on='Supplier', how='inner')
+            .filter(pl.col('cost_per_unit') > 0)
+            .sort('row')
+            .select(
+                'material_id', 'supplier_id', 'cost_per_unit', 'lead_time_days', 'moq',
+                pl.lit(0.95).alias('reliability_score'),
+                pl.lit(100.0).alias('ordering_cost'),
+                pl.lit(0.25).alias('holding_cost_rate')
+            )
+        )
+        
+        try:
+            styles, boms_df, invalid_skus, inventory_df, fixed_count, suppliers_df = pl.collect_all([
+                styles_lf, boms_lf, invalid_skus_lf, inventory_lf, fixed_count_lf, suppliers_lf
+            ])
+        except FileNotFoundError as e:
+            print(f"❌ Error loading raw data: {e}")
+            return {}
+        
+        forecasts_df = pl.from_pandas(self.create_forecasts_file(styles.to_pandas()))
+        
+        print("\n🔧 Converting BOMs file...")
+        if len(invalid_skus) > 0:
+            print(f"  ⚠️  Warning: {len(invalid_skus)} SKUs have BOM percentages not summing to 1.0")
+        print(f"  Converted {len(boms_df)} BOM records")
+        
+        print("\n📦 Converting inventory file...")
+        print(f"  Converted {len(inventory_df)} inventory records")
+        print(f"  Fixed {fixed_count.item()} negative inventory values")
+        
+        print("\n🏭 Converting suppliers file...")
+        print(f"  Converted {len(suppliers_df)} supplier relationships")
+        print(f"  Materials with suppliers: {suppliers_df['material_id'].n_unique()}")
+        
+        converted = {
+            'forecasts': forecasts_df,
+            'boms': boms_df,
+            'inventory': inventory_df,
+            'suppliers': suppliers_df
+        }
+        for name, df in converted.items():
+            df.write_csv(self.output_dir / f"{name}.csv")
+        
+        print("\n✅ Conversion complete! Files saved to:", self.output_dir)
+        print("\nConverted files:")
+        for name, df in converted.items():
+            print(f"  • {name}.csv ({len(df)} records)")
+        
+        return {name: df.to_pandas() for name, df in converted.items()}
+    
+    def create_forecasts_file(self, boms=None, seed=None):
+        """
+        Create forecasts from available data; boms is the loaded Style_BOM, read from disk if not given
+        
+        Pass seed to make the generated demo quantities reproducible.
+        """
         print("\n📊 Creating forecasts file...")
         
         # Check for sales data files
@@ -73,37 +239,31 @@ class BeverlyKnitsCSVConverter:
         
         # For now, create sample forecasts based on BOMs
         # In production, this would analyze sales history
-        try:
-            print("Loading boms for forecast creation: data/Style_BOM.csv")
-            boms = pd.read_csv(self.input_dir / "Style_BOM.csv")
-        except FileNotFoundError as e:
-            print(f"❌ Error loading boms for forecast creation: {e}")
-            return pd.DataFrame()
+        if boms is None:
+            try:
+                print("Loading boms for forecast creation: data/Style_BOM.csv")
+                boms = pd.read_csv(self.input_dir / "Style_BOM.csv", engine='pyarrow', usecols=['Style_ID'])
+            except FileNotFoundError as e:
+                print(f"❌ Error loading boms for forecast creation: {e}")
+                return pd.DataFrame()
             
-        unique_styles = boms['Style_ID'].unique()
+        styles = boms['Style_ID'].unique()[:20]  # Top 20 styles for demo
         
-        # Create forecast records
-        forecasts = []
-        base_date = datetime.now() + timedelta(days=30)  # 30 days out
+        # Create a 3-month forecast per style: a realistic base quantity with ±20%
+        # monthly variation, 30 days apart starting 30 days out
+        rng = np.random.default_rng(seed)
+        base_qty = rng.integers(100, 1000, size=len(styles))
+        variation = rng.uniform(-0.2, 0.2, size=(len(styles), 3))
+        qty = (base_qty[:, None] * (1 + variation)).astype(np.int32)
+        forecast_dates = pd.date_range(datetime.now() + timedelta(days=30), periods=3, freq='30D')
         
-        for style in unique_styles[:20]:  # Top 20 styles for demo
-            # Generate realistic forecast quantities
-            base_qty = np.random.randint(100, 1000)
-            
-            # Create 3-month forecast
-            for month in range(3):
-                forecast_date = base_date + timedelta(days=30 * month)
-                qty = base_qty * (1 + np.random.uniform(-0.2, 0.2))  # ±20% variation
-                
-                forecasts.append({
-                    'sku_id': style,
-                    'forecast_qty': int(qty),
-                    'forecast_date': forecast_date.strftime('%Y-%m-%d'),
-                    'source': 'sales_history'
-                })
-        
-        forecasts_df = pd.DataFrame(forecasts)
-        print(f"  Created {len(forecasts_df)} forecast records for {len(unique_styles[:20])} SKUs")
+        forecasts_df = pd.DataFrame({
+            'sku_id': np.repeat(styles, 3),
+            'forecast_qty': qty.ravel(),
+            'forecast_date': np.tile(forecast_dates.strftime('%Y-%m-%d'), len(styles)),
+            'source': 'sales_history'
+        })
+        print(f"  Created {len(forecasts_df)} forecast records for {len(styles)} SKUs")
         
         return forecasts_df
     
@@ -111,15 +271,17 @@ class BeverlyKnitsCSVConverter:
         """Convert Style_BOM.csv to expected format"""
         print("\n🔧 Converting BOMs file...")
         
+        # Repeating id columns are categorical, so grouping hashes integer codes;
+        # they are written to CSV as their string values
         converted = pd.DataFrame({
-            'sku_id': boms_df['Style_ID'],
-            'material_id': boms_df['Yarn_ID'].astype(str),
+            'sku_id': boms_df['Style_ID'].astype('category'),
+            'material_id': boms_df['Yarn_ID'].astype(str).astype('category'),
             'qty_per_unit': boms_df['BOM_Percentage'],
             'unit': 'lbs'  # Default unit for yarn
         })
         
         # Validate BOM percentages
-        sku_totals = converted.groupby('sku_id')['qty_per_unit'].sum()
+        sku_totals = converted.groupby('sku_id', observed=True)['qty_per_unit'].sum()
         invalid_skus = sku_totals[(sku_totals < 0.98) | (sku_totals > 1.02)]
         
         if len(invalid_skus) > 0:
@@ -133,35 +295,23 @@ class BeverlyKnitsCSVConverter:
         """Convert Yarn_ID_Current_Inventory.csv to expected format"""
         print("\n📦 Converting inventory file...")
 
-        # Clean numeric columns
-        def clean_numeric(value):
-            if pd.isna(value):
-                return 0.0
-            # Convert to string and clean
-            cleaned = str(value).replace('$', '').replace(',', '').replace('(', '-').replace(')', '').strip()
-            try:
-                return float(cleaned)
-            except:
-                return 0.0
-
-        # Apply cleaning to each value
-        inventory_clean = inventory_df['Inventory'].apply(clean_numeric)
-        on_order_clean = inventory_df['On_Order'].apply(clean_numeric)
-
-        # Ensure non-negative inventory
-        inventory_clean = np.maximum(inventory_clean, 0)
-        on_order_clean = np.maximum(on_order_clean, 0)
+        # Clean numeric columns, ensuring non-negative inventory
+        inventory_clean = clean_currency(inventory_df['Inventory'], parentheses_negative=True).clip(lower=0)
+        on_order_clean = clean_currency(inventory_df['On_Order'], parentheses_negative=True).clip(lower=0)
 
         converted = pd.DataFrame({
-            'material_id': inventory_df['Yarn_ID'].astype(str),
+            # fillna: pandas 3 keeps missing ids as NaN in astype(str); pandas 2 wrote 'nan'
+            'material_id': inventory_df['Yarn_ID'].astype(str).fillna('nan'),
             'on_hand_qty': inventory_clean,
             'unit': 'lbs',
             'open_po_qty': on_order_clean,
             'po_expected_date': (datetime.now() + timedelta(days=14)).strftime('%Y-%m-%d')  # Default 2 weeks
         })
 
-        # Remove duplicates if any
-        converted = converted.drop_duplicates(subset=['material_id'])
+        # Remove duplicates if any, keeping the first row per yarn; grouping on the raw
+        # (numeric) Yarn_ID hashes numbers instead of the rendered id strings
+        converted = converted.groupby(inventory_df['Yarn_ID'], sort=False, dropna=False).first()
+        converted = converted.reset_index(drop=True)
 
         print(f"  Converted {len(converted)} inventory records")
         print(f"  Fixed {(inventory_clean == 0).sum()} negative inventory values")
@@ -175,50 +325,34 @@ class BeverlyKnitsCSVConverter:
         """Create suppliers file from inventory and supplier master data"""
         print("\n🏭 Converting suppliers file...")
         
-        # Clean suppliers master data
+        # Clean suppliers master data into a lookup indexed by supplier, one row per supplier
+        # (last one wins); 'Remove' or unparseable lead times and MOQs fall back to the defaults
         valid_suppliers = suppliers_df[
-            (suppliers_df['Type'] != 'Remove') & 
-            (suppliers_df['Supplier'].notna())
-        ].copy()
-        
-        # Create supplier lookup
-        supplier_info = {}
-        for _, row in valid_suppliers.iterrows():
-            supplier_info[row['Supplier']] = {
-                'lead_time': 14 if row['Lead_time'] == 'Remove' else int(row['Lead_time']),
-                'moq': 1000 if row['MOQ'] == 'Remove' else int(row['MOQ'])
-            }
-        
-        # Clean cost data from inventory
-        def clean_cost(value):
-            if pd.isna(value):
-                return 0.0
-            cleaned = str(value).replace('$', '').replace(',', '').strip()
-            try:
-                return float(cleaned)
-            except:
-                return 0.0
-        
-        # Create supplier relationships from inventory data
-        supplier_records = []
-        
-        for _, row in inventory_df.iterrows():
-            if pd.notna(row['Supplier']) and row['Supplier'] in supplier_info:
-                cost = clean_cost(row['Cost_Pound'])
-                
-                if cost > 0:  # Only include if we have valid cost
-                    supplier_records.append({
-                        'material_id': str(row['Yarn_ID']),
-                        'supplier_id': row['Supplier'],
-                        'cost_per_unit': cost,
-                        'lead_time_days': supplier_info[row['Supplier']]['lead_time'],
-                        'moq': supplier_info[row['Supplier']]['moq'],
-                        'reliability_score': 0.95,  # Default high reliability
-                        'ordering_cost': 100.0,  # Default ordering cost
-                        'holding_cost_rate': 0.25  # Default 25% annual holding cost
-                    })
-        
-        converted = pd.DataFrame(supplier_records)
+            suppliers_df['Type'].ne('Remove') & suppliers_df['Supplier'].notna()
+        ].drop_duplicates(subset='Supplier', keep='last').set_index('Supplier')
+        supplier_info = pd.DataFrame({
+            'lead_time': pd.to_numeric(valid_suppliers['Lead_time'], errors='coerce').fillna(14).astype(int),
+            'moq': pd.to_numeric(valid_suppliers['MOQ'], errors='coerce').fillna(1000).astype(int)
+        })
+        
+        # Create supplier relationships from inventory data: join each inventory row
+        # to its supplier, keeping only rows with a valid cost (inner join keeps inventory order)
+        relationships = inventory_df[['Yarn_ID', 'Supplier']].assign(
+            cost_per_unit=clean_currency(inventory_df['Cost_Pound'])
+        )
+        relationships = relationships.merge(supplier_info, left_on='Supplier', right_index=True)
+        relationships = relationships[relationships['cost_per_unit'] > 0]
+        
+        converted = pd.DataFrame({
+            'material_id': relationships['Yarn_ID'].astype(str).astype('category'),
+            'supplier_id': relationships['Supplier'].astype('category'),
+            'cost_per_unit': relationships['cost_per_unit'],
+            'lead_time_days': relationships['lead_time'],
+            'moq': relationships['moq'],
+            'reliability_score': 0.95,  # Default high reliability
+            'ordering_cost': 100.0,  # Default ordering cost
+            'holding_cost_rate': 0.25  # Default 25% annual holding cost
+        }).reset_index(drop=True)
         
         print(f"  Converted {len(converted)} supplier relationships")
         print(f"  Materials with suppliers: {converted['material_id'].nunique()}")
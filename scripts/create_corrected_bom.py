@@ -1,28 +1,27 @@
+import numpy as np
 import pandas as pd
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Read the original Style_BOM
-style_bom = pd.read_csv('data/Style_BOM.csv')
+style_bom = pd.read_csv('data/Style_BOM.csv', engine='pyarrow')
+
+# Round quantities to 3 decimal places. Series.round scales by 1000 in binary, which
+# can round up values stored just below a half (e.g. 0.9275), so recompute those few
+# with Python's correctly rounded round()
+bom_percentage = style_bom['BOM_Percentage']
+quantity = bom_percentage.round(3)
+scaled = bom_percentage * 1000
+near_half = ((scaled - np.floor(scaled)) - 0.5).abs() < 1e-6
+quantity[near_half] = bom_percentage[near_half].map(lambda value: round(value, 3))
 
 # Create the corrected integrated BOM
-corrected_bom = []
-
-# Process each row from Style_BOM
-for _, row in style_bom.iterrows():
-    sku_id = row['Style_ID']
-    material_id = row['Yarn_ID']
-    quantity = round(row['BOM_Percentage'], 3)  # Round to 3 decimal places
-    
-    corrected_bom.append({
-        'sku_id': sku_id,
-        'material_id': material_id,
-        'quantity_per_unit': quantity
-    })
-
-# Convert to DataFrame
-corrected_df = pd.DataFrame(corrected_bom)
+corrected_df = pd.DataFrame({
+    'sku_id': style_bom['Style_ID'],
+    'material_id': style_bom['Yarn_ID'],
+    'quantity_per_unit': quantity
+})
 
 # Verify totals sum to 1.0 for each SKU
 logger.info("Verifying SKU totals...")
@@ -44,7 +43,7 @@ logger.info(f"Total SKUs: {corrected_df['sku_id'].nunique()}")
 logger.info(f"Total unique materials: {corrected_df['material_id'].nunique()}")
 
 # Compare with the original integrated BOM
-original_integrated = pd.read_csv('data/integrated_boms_v2.csv')
+original_integrated = pd.read_csv('data/integrated_boms_v2.csv', engine='pyarrow')
 logger.info(f"\nComparison with original integrated BOM:")
 logger.info(f"  Original rows: {len(original_integrated)}")
 logger.info(f"  Corrected rows: {len(corrected_df)}")
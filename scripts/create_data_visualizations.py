@@ -11,8 +11,12 @@ from matplotlib.patches import FancyBboxPatch, ConnectionPatch
 import numpy as np
 
 
-def create_data_relationship_diagram():
-    """Create a visual diagram showing all data relationships"""
+def create_data_relationship_diagram(show: bool = False, dpi: int = 150):
+    """
+    Create a visual diagram showing all data relationships
+    
+    The figure is saved at the given dpi and closed; pass show=True to also display it.
+    """
     
     fig, ax = plt.subplots(1, 1, figsize=(16, 12))
     ax.set_xlim(0, 10)
@@ -130,11 +134,13 @@ def create_data_relationship_diagram():
     ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.15, 1))
     
     plt.tight_layout()
-    plt.savefig('data_relationship_diagram.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.savefig('data_relationship_diagram.png', dpi=dpi, bbox_inches='tight')
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
-def create_data_flow_diagram():
+def create_data_flow_diagram(show: bool = False, dpi: int = 150):
     """Create a diagram showing the data processing flow"""
     
     fig, ax = plt.subplots(1, 1, figsize=(14, 10))
@@ -207,11 +213,13 @@ def create_data_flow_diagram():
             fontsize=16, weight='bold', ha='center')
     
     plt.tight_layout()
-    plt.savefig('data_flow_diagram.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.savefig('data_flow_diagram.png', dpi=dpi, bbox_inches='tight')
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
-def create_integration_summary_table():
+def create_integration_summary_table(show: bool = False, dpi: int = 150):
     """Create a summary table of all data integrations"""
     
     integration_summary = pd.DataFrame([
@@ -281,11 +289,16 @@ def create_integration_summary_table():
                 table[(i, j)].set_facecolor('#f0f0f0')
     
     plt.title('Beverly Knits Data Integration Summary', fontsize=16, weight='bold', pad=20)
-    plt.savefig('integration_summary_table.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.savefig('integration_summary_table.png', dpi=dpi, bbox_inches='tight')
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
 if __name__ == "__main__":
+    # Batch run: render off-screen, nothing is shown
+    plt.switch_backend('Agg')
+    
     # Create all visualizations
     print("Creating data relationship diagram...")
     create_data_relationship_diagram()
@@ -0,0 +1,79 @@
+"""
+Tests for the pandas and Polars pipelines of BeverlyKnitsCSVConverter
+"""
+
+import pandas as pd
+import pytest
+
+from scripts.convert_csv_for_upload import BeverlyKnitsCSVConverter
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """Raw Beverly Knits files with currency strings, accounting negatives, duplicate and missing yarn ids"""
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    pd.DataFrame({
+        'Yarn_ID': [101, 102, 102, 103, 104, None],
+        'Supplier': ['ACME', 'ACME', 'ACME', 'YARNCO, INC', 'GONE', None],
+        'Inventory': ['$1,234.50', '(12.00)', '5', '', '7', None],
+        'On_Order': ['0', '$500', '0', '25', '(3)', None],
+        'Cost_Pound': ['$3.65', '$2.10', '$2.10', '1.5', '$4.00', None],
+    }).to_csv(raw / "Yarn_ID_Current_Inventory.csv", index=False)
+    pd.DataFrame({
+        'Supplier_ID': [1, 2, 3, 4],
+        'Supplier': ['ACME', 'YARNCO, INC', 'GONE', 'ACME'],
+        'Lead_time': ['8', 'Remove', '6', '10'],
+        'MOQ': ['1000', '2500', '500', 'Remove'],
+        'Type': ['Import', 'Domestic', 'Remove', 'Import'],
+    }).to_csv(raw / "Supplier_ID.csv", index=False)
+    pd.DataFrame({
+        'Style_ID': ['S-1', 'S-1', 'S-2', 'S-3'],
+        'Yarn_ID': [101, 102, 103, 104],
+        'BOM_Percentage': [0.6, 0.4, 1.0, 0.5],
+    }).to_csv(raw / "Style_BOM.csv", index=False)
+    return raw
+
+
+def test_polars_pipeline_matches_pandas(raw_dir, tmp_path):
+    pytest.importorskip('polars')
+    pandas_out = tmp_path / "pandas"
+    polars_out = tmp_path / "polars"
+
+    expected = BeverlyKnitsCSVConverter(raw_dir, pandas_out).convert_all_files()
+    converted = BeverlyKnitsCSVConverter(raw_dir, polars_out).convert_all_files_polars()
+
+    assert converted.keys() == expected.keys()
+    for name in ('boms', 'inventory', 'suppliers'):
+        assert (polars_out / f"{name}.csv").read_bytes() == (pandas_out / f"{name}.csv").read_bytes()
+        pd.testing.assert_frame_equal(converted[name], expected[name].reset_index(drop=True),
+                                      check_dtype=False, check_categorical=False)
+    keys = ['sku_id', 'forecast_date', 'source']
+    pd.testing.assert_frame_equal(converted['forecasts'][keys], expected['forecasts'][keys], check_dtype=False)
+
+
+def test_pandas_pipeline_converts_raw_rows(raw_dir, tmp_path):
+    converted = BeverlyKnitsCSVConverter(raw_dir, tmp_path / "out").convert_all_files()
+
+    # Accounting negatives clip to 0; the duplicate yarn 102 keeps its first row
+    inventory = converted['inventory']
+    assert inventory['material_id'].tolist() == ['101.0', '102.0', '103.0', '104.0', 'nan']
+    assert inventory['on_hand_qty'].tolist() == [1234.5, 0.0, 0.0, 7.0, 0.0]
+    assert inventory['open_po_qty'].tolist() == [0.0, 500.0, 25.0, 0.0, 0.0]
+
+    # 'Remove' lead times and MOQs fall back to 14 days and 1000; the last ACME row wins,
+    # and suppliers typed 'Remove' or missing from the master list are dropped
+    suppliers = converted['suppliers']
+    columns = ['material_id', 'supplier_id', 'cost_per_unit', 'lead_time_days', 'moq']
+    assert suppliers[columns].astype(object).values.tolist() == [
+        ['101.0', 'ACME', 3.65, 10, 1000],
+        ['102.0', 'ACME', 2.10, 10, 1000],
+        ['102.0', 'ACME', 2.10, 10, 1000],
+        ['103.0', 'YARNCO, INC', 1.5, 14, 2500],
+    ]
+
+    boms = converted['boms']
+    assert boms[['sku_id', 'material_id']].astype(str).values.tolist() == [
+        ['S-1', '101'], ['S-1', '102'], ['S-2', '103'], ['S-3', '104']
+    ]
+    assert boms['qty_per_unit'].tolist() == pytest.approx([0.6, 0.4, 1.0, 0.5])
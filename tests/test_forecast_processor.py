@@ -0,0 +1,64 @@
+"""
+Tests for forecast loading and aggregation in ForecastProcessor
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from models.forecast import FinishedGoodsForecast, ForecastProcessor
+
+
+@pytest.fixture
+def forecast_df():
+    """Forecast rows with one row of each invalid kind"""
+    return pd.DataFrame({
+        'sku_id': ['SKU-1', 'SKU-1', 'SKU-2', 'SKU-3', 'SKU-4'],
+        'forecast_qty': [100, 50, 200, -5, 30],
+        'forecast_date': ['2025-01-01', '2025-01-15', '2025-02-01', '2025-02-01', 'not a date'],
+        'source': ['sales_order', 'projection', 'prod_plan', 'sales_order', 'manual']
+    })
+
+
+def test_from_dataframe_drops_invalid_rows(forecast_df):
+    forecasts = ForecastProcessor.from_dataframe(forecast_df)
+
+    assert [f.sku_id for f in forecasts] == ['SKU-1', 'SKU-1', 'SKU-2']
+    assert forecasts[0].forecast_date == date(2025, 1, 1)
+
+
+def test_from_dataframe_skips_unknown_sources(forecast_df):
+    forecast_df.loc[0, 'source'] = 'rumour'
+
+    forecasts = ForecastProcessor.from_dataframe(forecast_df)
+
+    assert [f.source for f in forecasts] == ['projection', 'prod_plan']
+
+
+def test_aggregate_forecasts_applies_source_weights():
+    forecasts = [
+        FinishedGoodsForecast('SKU-1', 100, date(2025, 1, 1), 'sales_order'),
+        FinishedGoodsForecast('SKU-1', 100, date(2025, 1, 1), 'projection'),
+        FinishedGoodsForecast('SKU-2', 10, date(2025, 1, 1), 'manual'),
+    ]
+
+    totals = ForecastProcessor().aggregate_forecasts(forecasts)
+
+    assert totals == pytest.approx({'SKU-1': 170.0, 'SKU-2': 5.0})
+
+
+def test_forecast_summary_weighted_qty():
+    forecasts = [FinishedGoodsForecast('SKU-1', 100, date(2025, 1, 1), 'prod_plan')]
+
+    summary = ForecastProcessor.get_forecast_summary(forecasts)
+
+    assert summary.loc[0, 'weighted_qty'] == pytest.approx(90.0)
+
+
+def test_iter_from_dataframe_feeds_aggregation(forecast_df):
+    forecasts = ForecastProcessor.iter_from_dataframe(forecast_df, chunksize=2)
+
+    totals = ForecastProcessor().aggregate_forecasts(forecasts)
+
+    assert totals == pytest.approx({'SKU-1': 135.0, 'SKU-2': 180.0})
@@ -0,0 +1,60 @@
+"""
+Tests for inventory loading and netting in InventoryNetter
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from models.inventory import Inventory, InventoryNetter
+
+
+@pytest.fixture
+def material_requirements():
+    return {
+        'YARN-A': {'total_qty': 100.0, 'unit': 'lb', 'sources': []},
+        'YARN-B': {'total_qty': 100.0, 'unit': 'lb', 'sources': []},
+        'YARN-C': {'total_qty': 100.0, 'unit': 'lb', 'sources': []},
+        'YARN-D': {'total_qty': 100.0, 'unit': 'lb', 'sources': []},
+    }
+
+
+@pytest.fixture
+def inventories():
+    return [
+        Inventory('YARN-A', 150.0, 'lb'),
+        Inventory('YARN-B', 60.0, 'lb', open_po_qty=50.0),
+        Inventory('YARN-C', 30.0, 'lb', open_po_qty=20.0),
+    ]
+
+
+def test_from_dataframe_parses_po_dates():
+    df = pd.DataFrame({
+        'material_id': ['YARN-A', 'YARN-B', 'YARN-C'],
+        'on_hand_qty': [10, 20, -1],
+        'unit': ['lb', 'lb', 'lb'],
+        'open_po_qty': [5, 0, 0],
+        'po_expected_date': ['2025-03-01', None, '2025-03-02'],
+    })
+
+    items = InventoryNetter.from_dataframe(df)
+
+    assert [inv.material_id for inv in items] == ['YARN-A', 'YARN-B']
+    assert items[0].po_expected_date == date(2025, 3, 1)
+    assert items[1].po_expected_date is None
+
+
+def test_net_requirements_frame_matches_dict(material_requirements, inventories):
+    as_dict = InventoryNetter.calculate_net_requirements(material_requirements, inventories)
+    as_frame = InventoryNetter.calculate_net_requirements_frame(material_requirements, inventories)
+
+    for material_id, req_data in as_dict.items():
+        assert as_frame.loc[material_id, 'net_requirement'] == pytest.approx(req_data['net_requirement'])
+        assert as_frame.loc[material_id, 'inventory_status'] == req_data['inventory_status']
+
+
+def test_identify_critical_materials_accepts_frame(material_requirements, inventories):
+    as_frame = InventoryNetter.calculate_net_requirements_frame(material_requirements, inventories)
+
+    assert InventoryNetter.identify_critical_materials(as_frame) == ['YARN-C', 'YARN-D']
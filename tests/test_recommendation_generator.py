@@ -0,0 +1,140 @@
+"""
+Tests for RecommendationGenerator output helpers
+"""
+
+import pandas as pd
+import pytest
+
+from models.recommendation import ProcurementRecommendation, RecommendationGenerator, RiskFlag
+from models.supplier import Supplier
+
+
+@pytest.fixture
+def recommendations():
+    return [
+        ProcurementRecommendation(
+            material_id='YARN-A', order_quantity=110.0, supplier_id='SUP-1',
+            cost_per_unit=2.0, total_cost=220.0, lead_time_days=14,
+            risk=RiskFlag.LOW, reasoning_text='Standard procurement',
+            net_requirement=100.0, safety_buffer=10.0
+        ),
+        ProcurementRecommendation(
+            material_id='YARN-B', order_quantity=500.0, supplier_id='SUP-1',
+            cost_per_unit=1.0, total_cost=500.0, lead_time_days=21,
+            risk=RiskFlag.MEDIUM, reasoning_text='MOQ adjustment applied',
+            eoq_quantity=450.0
+        ),
+        ProcurementRecommendation(
+            material_id='YARN-C', order_quantity=40.0, supplier_id='NO_SUPPLIER',
+            cost_per_unit=0.0, total_cost=0.0, lead_time_days=999,
+            risk=RiskFlag.HIGH, reasoning_text='No supplier available for this material'
+        ),
+    ]
+
+
+def test_to_dataframe_core_columns(recommendations):
+    df = RecommendationGenerator.to_dataframe(recommendations)
+
+    assert df['material_id'].tolist() == ['YARN-A', 'YARN-B', 'YARN-C']
+    assert df['risk'].tolist() == ['low', 'medium', 'high']
+    assert df['eoq_quantity'].isna().tolist() == [True, False, True]
+    assert 'risk_flag' not in df.columns
+
+
+def test_to_dataframe_column_dtypes(recommendations):
+    df = RecommendationGenerator.to_dataframe(recommendations)
+
+    assert df['lead_time_days'].dtype == 'int32'
+    assert df['order_quantity'].dtype == 'float64'
+    assert df['eoq_quantity'].dtype == 'float64'
+    assert 'cost_analysis' not in df.columns
+
+
+def test_to_dataframe_legacy_columns(recommendations):
+    df = RecommendationGenerator.to_dataframe(recommendations, legacy=True)
+
+    assert df['recommended_order_qty'].tolist() == df['order_quantity'].tolist()
+    assert df['risk_flag'].tolist() == df['risk'].tolist()
+    assert df['expected_lead_time'].tolist() == [14, 21, 999]
+
+
+def test_get_summary_stats(recommendations):
+    stats = RecommendationGenerator.get_summary_stats(recommendations)
+
+    assert stats['total_recommendations'] == 3
+    assert stats['total_estimated_cost'] == pytest.approx(720.0)
+    assert stats['avg_lead_time'] == pytest.approx((14 + 21 + 999) / 3)
+    assert stats['risk_distribution'] == {'low': 1, 'medium': 1, 'high': 1}
+    assert stats['materials_without_suppliers'] == 1
+    assert stats['eoq_optimized_count'] == 1
+    assert stats['unique_suppliers'] == 1
+    assert stats['avg_order_quantity'] == pytest.approx(650.0 / 3)
+
+
+def test_get_summary_stats_from_dataframe(recommendations):
+    df = RecommendationGenerator.to_dataframe(recommendations)
+
+    from_df = RecommendationGenerator.get_summary_stats(df)
+    from_list = RecommendationGenerator.get_summary_stats(recommendations)
+
+    assert from_df.keys() == from_list.keys()
+    for key in ('total_estimated_cost', 'avg_lead_time', 'avg_order_quantity'):
+        assert from_df[key] == pytest.approx(from_list[key])
+    for key in ('total_recommendations', 'risk_distribution', 'materials_without_suppliers',
+                'eoq_optimized_count', 'unique_suppliers'):
+        assert from_df[key] == from_list[key]
+
+
+def test_to_dict_legacy_keys_are_opt_in(recommendations):
+    rec = recommendations[0]
+
+    assert 'risk_flag' not in rec.to_dict()
+    legacy = rec.to_dict(legacy=True)
+    assert legacy['risk_flag'] == legacy['risk'] == 'low'
+    assert legacy['recommended_order_qty'] == rec.order_quantity
+
+
+@pytest.fixture
+def net_requirements():
+    return {
+        'YARN-A': {'gross_requirement': 150.0, 'net_requirement': 100.0},
+        'YARN-B': {'gross_requirement': 50.0, 'net_requirement': 0.0},
+        'YARN-C': {'gross_requirement': 40.0, 'net_requirement': 40.0},
+        'YARN-D': {'gross_requirement': 300.0, 'net_requirement': 200.0},
+    }
+
+
+@pytest.fixture
+def suppliers():
+    return [
+        Supplier('YARN-A', 'SUP-1', 2.0, 14, 50, reliability_score=0.95),
+        Supplier('YARN-D', 'SUP-2', 1.0, 21, 100, reliability_score=0.6),
+    ]
+
+
+def test_generate_recommendations_buffers_and_flags_risk(net_requirements, suppliers):
+    recs = RecommendationGenerator.generate_recommendations(net_requirements, suppliers, {})
+
+    assert [r.material_id for r in recs] == ['YARN-A', 'YARN-C', 'YARN-D']
+    assert recs[0].order_quantity == pytest.approx(110.0)
+    assert recs[0].total_cost == pytest.approx(220.0)
+    assert recs[0].risk == RiskFlag.LOW
+    assert recs[0].reasoning == 'Safety buffer: 10.0; High reliability supplier'
+    assert recs[0].gross_requirement == 150.0
+    assert recs[1].supplier_id == 'NO_SUPPLIER'
+    assert recs[1].reasoning == 'No supplier available for this material'
+    assert recs[2].risk == RiskFlag.HIGH
+
+
+def test_recommendation_batch_exports_like_objects(net_requirements, suppliers):
+    batch = RecommendationGenerator.generate_recommendation_batch(net_requirements, suppliers, {})
+    recs = RecommendationGenerator.generate_recommendations(net_requirements, suppliers, {})
+
+    assert isinstance(recs, list)
+    assert [r.to_dict() for r in batch] == [r.to_dict() for r in recs]
+    assert [r.material_id for r in batch[1:]] == ['YARN-C', 'YARN-D']
+    assert batch[-1].material_id == 'YARN-D'
+    pd.testing.assert_frame_equal(
+        RecommendationGenerator.to_dataframe(batch, legacy=True),
+        RecommendationGenerator.to_dataframe(list(batch), legacy=True)
+    )
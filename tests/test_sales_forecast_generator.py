@@ -0,0 +1,133 @@
+"""
+Tests for demand statistics and forecast generation in SalesForecastGenerator
+"""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from models.sales_forecast_generator import SalesForecastGenerator, _multiplicative_seasonal
+
+
+@pytest.fixture
+def sales_df():
+    """Three styles: steady weekly sales, sparse sales with gaps, and too little history"""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    rows = []
+    for day in range(0, 84, 7):
+        rows.append((today - timedelta(days=day), 'STYLE-A', 100.0))
+    for day, qty in [(3, 40.0), (10, 60.0), (45, 200.0), (80, 10.0)]:
+        rows.append((today - timedelta(days=day), 'STYLE-B', qty))
+    for day in (1, 5):
+        rows.append((today - timedelta(days=day), 'STYLE-C', 25.0))
+    return pd.DataFrame(rows, columns=['Invoice Date', 'Style', 'Yds_ordered'])
+
+
+def test_generate_forecasts_matches_per_style_statistics(sales_df):
+    generator = SalesForecastGenerator(sales_df, safety_stock_method='percentage')
+
+    forecasts = generator.generate_forecasts()
+
+    assert sorted(f.sku_id for f in forecasts) == ['STYLE-A', 'STYLE-B']
+    for forecast in forecasts:
+        stats = generator.calculate_demand_statistics(forecast.sku_id)
+        assert forecast.forecast_qty == math.ceil(stats['average_demand'] * 1.2)
+        assert forecast.confidence == pytest.approx(stats['confidence'])
+
+
+def test_demand_statistics_count_empty_periods(sales_df):
+    generator = SalesForecastGenerator(sales_df)
+
+    stats = generator.calculate_demand_statistics('STYLE-B')
+    expected = pd.Series([40.0, 60.0, 200.0, 10.0]).sum() / stats['num_periods']
+
+    assert stats['num_periods'] > 4
+    assert stats['average_demand'] == pytest.approx(expected)
+
+
+def test_generate_forecasts_polars_matches_pandas(sales_df):
+    pytest.importorskip('polars')
+    generator = SalesForecastGenerator(sales_df)
+
+    expected = generator.generate_forecasts()
+    forecasts = generator.generate_forecasts_polars()
+
+    assert [(f.sku_id, f.forecast_qty) for f in forecasts] == [(f.sku_id, f.forecast_qty) for f in expected]
+
+
+def test_auto_seasonality_forecasts_use_weekly_average(sales_df):
+    generator = SalesForecastGenerator(sales_df, safety_stock_method='percentage')
+
+    forecasts = generator.generate_forecasts_with_auto_seasonality(auto_detect_seasonality=False)
+
+    assert sorted(f.sku_id for f in forecasts) == ['STYLE-A', 'STYLE-B']
+    for forecast in forecasts:
+        weekly = generator.calculate_weekly_average_demand(forecast.sku_id, apply_seasonality=False)
+        expected = weekly['weekly_avg'] * (generator.planning_horizon_days / 7) + weekly['weekly_avg'] * 0.2
+        assert forecast.forecast_qty == math.ceil(expected)
+
+
+def test_compact_quantities_match_full_precision(sales_df):
+    compact = SalesForecastGenerator(sales_df, compact_quantities=True)
+    full = SalesForecastGenerator(sales_df)
+
+    assert compact.sales_df['Yds_ordered'].dtype == 'float32'
+    assert [(f.sku_id, f.forecast_qty) for f in compact.generate_forecasts()] == \
+        [(f.sku_id, f.forecast_qty) for f in full.generate_forecasts()]
+
+
+def test_forecast_frame_matches_forecast_objects(sales_df):
+    generator = SalesForecastGenerator(sales_df)
+
+    frame = generator.generate_forecast_frame()
+    forecasts = generator.generate_forecasts()
+
+    assert frame['sku_id'].tolist() == [f.sku_id for f in forecasts]
+    assert frame['forecast_qty'].tolist() == [f.forecast_qty for f in forecasts]
+    assert [vars(f) for f in generator.to_forecast_objects(frame)] == [vars(f) for f in forecasts]
+    pd.testing.assert_frame_equal(generator.create_forecast_summary(frame),
+                                  generator.create_forecast_summary(forecasts))
+
+
+def test_yarn_forecasts_sum_style_shares(sales_df):
+    bom_df = pd.DataFrame({
+        'Style': ['STYLE-A', 'STYLE-A', 'STYLE-B'],
+        'Yarn': ['YARN-1', 'YARN-2', 'YARN-1'],
+        'Percentage': [60.0, 40.0, 100.0],
+    })
+    generator = SalesForecastGenerator(sales_df, bom_df=bom_df)
+    qty = {f.sku_id: f.forecast_qty for f in generator.generate_forecasts()}
+
+    yarns = generator.generate_yarn_forecasts()
+
+    assert yarns['YARN-1']['total_qty'] == pytest.approx(qty['STYLE-A'] * 0.6 + qty['STYLE-B'])
+    assert yarns['YARN-2']['total_qty'] == pytest.approx(qty['STYLE-A'] * 0.4)
+    assert sorted(source['style_id'] for source in yarns['YARN-1']['sources']) == ['STYLE-A', 'STYLE-B']
+
+
+def test_multiplicative_seasonal_matches_statsmodels():
+    seasonal = pytest.importorskip('statsmodels.tsa.seasonal')
+    index = pd.period_range('2021-01', periods=40, freq='M')
+    monthly_sales = pd.Series(100 + 30 * np.sin(np.arange(40) * np.pi / 6) + np.arange(40), index=index)
+
+    expected = seasonal.seasonal_decompose(monthly_sales, model='multiplicative', period=12).seasonal
+
+    np.testing.assert_allclose(_multiplicative_seasonal(monthly_sales.to_numpy(), 12), expected.to_numpy())
+
+
+def test_dynamic_safety_stock_with_single_period_history():
+    sales = pd.DataFrame({
+        'Invoice Date': pd.to_datetime(['2026-07-25', '2026-08-15', '2026-09-25']),
+        'Style': 'STYLE-Q',
+        'Yds_ordered': [100.0, 50.0, 30.0],
+    })
+    generator = SalesForecastGenerator(sales, aggregation_period='quarterly', safety_stock_method='dynamic')
+
+    frame = generator.generate_forecast_frame()
+    forecasts = generator.generate_forecasts()
+
+    assert frame['forecast_qty'].tolist() == [180 + 18]
+    assert [f.forecast_qty for f in forecasts] == frame['forecast_qty'].tolist()
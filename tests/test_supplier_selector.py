@@ -0,0 +1,127 @@
+"""
+Tests for EOQ calculation and supplier selection in models.supplier
+"""
+
+from dataclasses import asdict
+
+import pandas as pd
+import pytest
+
+from models.supplier import EOQCalculator, MultiSupplierOptimizer, Supplier, SupplierSelector, SupplierTable
+
+
+@pytest.fixture
+def suppliers():
+    return [
+        Supplier('YARN-A', 'SUP-1', 2.0, 14, 50, reliability_score=0.95),
+        Supplier('YARN-A', 'SUP-2', 1.5, 21, 100, contract_qty_limit=300, reliability_score=0.8,
+                 ordering_cost=50.0),
+        Supplier('YARN-A', 'SUP-3', 3.0, 7, 10, reliability_score=0.6, holding_cost_rate=0.0),
+        Supplier('YARN-B', 'SUP-1', 1.0, 10, 20),
+    ]
+
+
+def test_calculate_eoq_batch_matches_scalar(suppliers):
+    batch = EOQCalculator.calculate_supplier_eoqs(12000.0, suppliers)
+
+    expected = [EOQCalculator.calculate_eoq(12000.0, s.ordering_cost, s.cost_per_unit, s.holding_cost_rate)
+                for s in suppliers]
+    assert batch.tolist() == pytest.approx(expected)
+    assert batch[2] == 0
+
+
+def test_optimize_multi_supplier_sourcing_covers_requirement(suppliers):
+    allocations = MultiSupplierOptimizer().optimize_multi_supplier_sourcing(
+        'YARN-A', 1000.0, suppliers, annual_demand=12000.0
+    )
+
+    assert sum(a.quantity for a in allocations) == pytest.approx(1000.0)
+    assert all(a.supplier.material_id == 'YARN-A' for a in allocations)
+    primary = allocations[0].supplier
+    assert allocations[0].eoq == pytest.approx(EOQCalculator.calculate_eoq(
+        12000.0, primary.ordering_cost, primary.cost_per_unit, primary.holding_cost_rate
+    ))
+
+
+def test_select_optimal_supplier_respects_constraints(suppliers):
+    selector = SupplierSelector()
+
+    best = selector.select_optimal_supplier('YARN-A', suppliers, required_quantity=400.0, annual_demand=12000.0)
+
+    assert best.supplier_id == 'SUP-1'
+    assert selector.select_optimal_supplier('YARN-C', suppliers) is None
+
+
+def test_table_from_dataframe_drops_invalid_rows():
+    df = pd.DataFrame({
+        'material_id': ['YARN-A', 'YARN-A', 'YARN-B', 'YARN-B'],
+        'supplier_id': ['SUP-1', 'SUP-2', 'SUP-3', 'SUP-4'],
+        'cost_per_unit': [2.0, 0.0, 1.0, 1.0],
+        'lead_time_days': [14, 7, -1, 10],
+        'moq': [50, 10, 10, 20],
+        'contract_qty_limit': [None, None, None, 500.0],
+        'reliability_score': [0.9, 0.9, 0.9, 0.8],
+        'ordering_cost': [100.0, 100.0, 100.0, 50.0],
+        'holding_cost_rate': [0.2, 0.2, 0.2, 0.25],
+    })
+
+    table = SupplierSelector.table_from_dataframe(df)
+
+    assert isinstance(table, SupplierTable)
+    assert [s.supplier_id for s in table] == ['SUP-1', 'SUP-4']
+    assert table[1] == Supplier('YARN-B', 'SUP-4', 1.0, 10, 20, contract_qty_limit=500, reliability_score=0.8,
+                                ordering_cost=50.0, holding_cost_rate=0.25)
+    assert SupplierSelector.from_dataframe(df) == table.to_list()
+    assert [s.supplier_id for s in table.for_material('YARN-A')] == ['SUP-1']
+
+
+def test_table_from_suppliers_selects_like_list(suppliers):
+    table = SupplierTable.from_suppliers(suppliers)
+    selector = SupplierSelector()
+
+    assert table.material_rows('YARN-A').tolist() == [0, 1, 2]
+    assert table.material_rows('YARN-C').tolist() == []
+    assert selector.select_optimal_supplier('YARN-A', table, required_quantity=400.0, annual_demand=12000.0) == \
+        selector.select_optimal_supplier('YARN-A', suppliers, required_quantity=400.0, annual_demand=12000.0)
+
+
+def test_calculate_eoq_cached_matches_uncached():
+    EOQCalculator.clear_eoq_cache()
+
+    first = EOQCalculator.calculate_eoq_cached(12000.0, 100.0, 2.0, 0.2)
+    second = EOQCalculator.calculate_eoq_cached(12000.0, 100.0, 2.0, 0.2)
+
+    assert first == second == EOQCalculator.calculate_eoq(12000.0, 100.0, 2.0, 0.2)
+    assert EOQCalculator.calculate_eoq_cached.cache_info().hits == 1
+
+
+def test_optimize_many_matches_single_calls(suppliers):
+    optimizer = MultiSupplierOptimizer()
+    materials = [('YARN-A', 1000.0), ('YARN-B', 50.0), ('YARN-C', 10.0)]
+
+    results = optimizer.optimize_many(materials, SupplierTable.from_suppliers(suppliers), annual_demand=12000.0)
+
+    assert list(results) == ['YARN-A', 'YARN-B', 'YARN-C']
+    for material_id, quantity in materials:
+        assert results[material_id] == optimizer.optimize_multi_supplier_sourcing(
+            material_id, quantity, suppliers, annual_demand=12000.0
+        )
+
+
+def test_create_validated_rejects_invalid_supplier():
+    assert Supplier.create_validated('YARN-A', 'SUP-1', 2.0, 14, 50) == Supplier('YARN-A', 'SUP-1', 2.0, 14, 50)
+    with pytest.raises(ValueError, match="Reliability score"):
+        Supplier.create_validated('YARN-A', 'SUP-1', 2.0, 14, 50, reliability_score=1.5)
+
+
+def test_compact_table_keeps_float32_eoqs(suppliers):
+    df = pd.DataFrame([asdict(s) for s in suppliers])
+
+    table = SupplierSelector.table_from_dataframe(df, compact=True)
+    eoqs = EOQCalculator.calculate_eoq_batch(12000.0, table.ordering_cost, table.cost_per_unit,
+                                             table.holding_cost_rate)
+
+    assert table.cost_per_unit.dtype == 'float32' and table.moq.dtype == 'int32'
+    assert table.take([0, 1]).cost_per_unit.dtype == 'float32'
+    assert eoqs.dtype == 'float32'
+    assert eoqs == pytest.approx(EOQCalculator.calculate_supplier_eoqs(12000.0, suppliers), rel=1e-6)